@@ -4,12 +4,13 @@ Backlog統合パッケージ
 Backlog MCPクライアントとモデルを提供。
 """
 
-from .client import BacklogMCPClient
+from .client import BacklogAPIError, BacklogMCPClient
 from .models import (BacklogProject, BacklogTask, Category, CustomField,
                      CustomFieldInput, IssueType)
 
 __all__ = [
     "BacklogMCPClient",
+    "BacklogAPIError",
     "BacklogTask",
     "IssueType",
     "Category",
@@ -14,6 +14,10 @@ from .models import (BacklogTask, Category, CustomField, CustomFieldInput,
                      IssueType)
 
 
+class BacklogAPIError(Exception):
+    """Backlog API呼び出しの失敗を表す例外"""
+
+
 class BacklogMCPClient:
     """Backlog MCPクライアントクラス
 
@@ -60,7 +64,7 @@ class BacklogMCPClient:
             APIレスポンスデータ
 
         Raises:
-            Exception: API呼び出し失敗時
+            BacklogAPIError: API呼び出し失敗時
         """
         url = f"{self.space_url}{endpoint}"
 
@@ -76,25 +80,10 @@ class BacklogMCPClient:
                     f"MCP call: {method} {url} (attempt {attempt + 1}/{self.max_retries})"
                 )
 
-                # TODO: 実際のMCP SDKクライアントを使用してAPI呼び出し
-                # 現在はプレースホルダー実装
-                # 実装例:
-                # response = await mcp_client.call_tool(
-                #     "backlog_api",
-                #     {
-                #         "method": method,
-                #         "url": url,
-                #         "params": params,
-                #         "data": data,
-                #         "timeout": self.timeout
-                #     }
-                # )
-
-                # プレースホルダー: 実際のMCP呼び出しに置き換える必要がある
-                await asyncio.sleep(0.1)  # API呼び出しをシミュレート
+                response = await self._send_request(method, url, params, data)
 
                 self.logger.info(f"MCP call successful: {method} {endpoint}")
-                return {}  # プレースホルダー
+                return response
 
             except Exception as e:
                 self.logger.warning(
@@ -106,12 +95,54 @@ class BacklogMCPClient:
                     self.logger.error(
                         f"MCP call failed after {self.max_retries} attempts: {method} {endpoint}"
                     )
-                    raise
+                    if isinstance(e, BacklogAPIError):
+                        raise
+                    raise BacklogAPIError(str(e)) from e
 
                 # 指数バックオフで待機
                 delay = self.retry_delay * (2**attempt)
                 await asyncio.sleep(delay)
 
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """MCPトランスポートで1回分のAPI呼び出しを送信（内部メソッド）
+
+        リトライは行わない（_call_mcpが担当）。
+
+        Args:
+            method: HTTPメソッド
+            url: リクエストURL
+            params: クエリパラメータ
+            data: リクエストボディ
+
+        Returns:
+            APIレスポンスデータ
+        """
+        # TODO: 実際のMCP SDKクライアントを使用してAPI呼び出し
+        # 現在はプレースホルダー実装
+        # MCPセッション（接続）は__init__で1つだけ生成して全呼び出しで再利用し、
+        # 呼び出しごとに接続を張り直さないこと
+        # 実装例:
+        # response = await mcp_client.call_tool(
+        #     "backlog_api",
+        #     {
+        #         "method": method,
+        #         "url": url,
+        #         "params": params,
+        #         "data": data,
+        #         "timeout": self.timeout
+        #     }
+        # )
+
+        # プレースホルダー: 実際のMCP呼び出しに置き換える必要がある
+        await asyncio.sleep(0.1)  # API呼び出しをシミュレート
+        return {}  # プレースホルダー
+
     async def fetch_data(self, url: str) -> Dict[str, Any]:
         """BacklogからURLのデータを取得
 
@@ -123,7 +154,7 @@ class BacklogMCPClient:
 
         Raises:
             ValueError: 無効なURL
-            Exception: データ取得失敗
+            BacklogAPIError: データ取得失敗
         """
         self.logger.info(f"Fetching data from Backlog URL: {url}")
 
@@ -146,7 +177,7 @@ class BacklogMCPClient:
             タスクリスト
 
         Raises:
-            Exception: タスク取得失敗
+            BacklogAPIError: タスク取得失敗
         """
         self.logger.info(f"Getting tasks for project: {project_key}")
 
@@ -176,7 +207,7 @@ class BacklogMCPClient:
             登録されたBacklogタスクリスト
 
         Raises:
-            Exception: タスク登録失敗
+            BacklogAPIError: タスク登録失敗
         """
         self.logger.info(f"Creating {len(tasks)} tasks in project: {project_key}")
 
@@ -232,7 +263,7 @@ class BacklogMCPClient:
             種別リスト
 
         Raises:
-            Exception: 種別取得失敗
+            BacklogAPIError: 種別取得失敗
         """
         self.logger.info(f"Getting issue types for project: {project_key}")
 
@@ -257,7 +288,7 @@ class BacklogMCPClient:
             作成された種別
 
         Raises:
-            Exception: 種別作成失敗
+            BacklogAPIError: 種別作成失敗
         """
         self.logger.info(f"Creating issue type '{name}' in project: {project_key}")
 
@@ -285,7 +316,7 @@ class BacklogMCPClient:
             カテゴリリスト
 
         Raises:
-            Exception: カテゴリ取得失敗
+            BacklogAPIError: カテゴリ取得失敗
         """
         self.logger.info(f"Getting categories for project: {project_key}")
 
@@ -310,7 +341,7 @@ class BacklogMCPClient:
             作成されたカテゴリ
 
         Raises:
-            Exception: カテゴリ作成失敗
+            BacklogAPIError: カテゴリ作成失敗
         """
         self.logger.info(f"Creating category '{name}' in project: {project_key}")
 
@@ -334,7 +365,7 @@ class BacklogMCPClient:
             カスタム属性リスト
 
         Raises:
-            Exception: カスタム属性取得失敗
+            BacklogAPIError: カスタム属性取得失敗
         """
         self.logger.info(f"Getting custom fields for project: {project_key}")
 
@@ -363,7 +394,7 @@ class BacklogMCPClient:
             作成されたカスタム属性
 
         Raises:
-            Exception: カスタム属性作成失敗
+            BacklogAPIError: カスタム属性作成失敗
         """
         self.logger.info(
             f"Creating custom field '{field.name}' in project: {project_key}"
@@ -4,12 +4,13 @@ Notion統合パッケージ
 Notion MCPクライアントとモデルを提供。
 """
 
-from .client import NotionMCPClient
+from .client import NotionAPIError, NotionMCPClient
 from .models import (NotionBlock, NotionDatabase, NotionPage, NotionRichText,
                      NotionUser)
 
 __all__ = [
     "NotionMCPClient",
+    "NotionAPIError",
     "NotionPage",
     "NotionDatabase",
     "NotionBlock",
@@ -6,11 +6,22 @@ Notion API操作を実行。
 """
 
 import asyncio
+import re
 from typing import Any, Dict, List, Optional
 
 from ...utils.logger import Logger
 from .models import (NotionBlock, NotionDatabase, NotionPage)
 
+# 32文字の英数字（ハイフンなし）またはUUID形式のNotion ID
+_NOTION_ID_RE = re.compile(
+    r"([a-f0-9]{32})|([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})",
+    re.IGNORECASE,
+)
+
+
+class NotionAPIError(Exception):
+    """Notion API呼び出しの失敗を表す例外"""
+
 
 class NotionMCPClient:
     """Notion MCPクライアントクラス
@@ -57,7 +68,7 @@ class NotionMCPClient:
             APIレスポンスデータ
 
         Raises:
-            Exception: API呼び出し失敗時
+            NotionAPIError: API呼び出し失敗時
         """
         url = f"{self.api_base_url}{endpoint}"
 
@@ -68,29 +79,10 @@ class NotionMCPClient:
                     f"MCP call: {method} {url} (attempt {attempt + 1}/{self.max_retries})"
                 )
 
-                # TODO: 実際のMCP SDKクライアントを使用してAPI呼び出し
-                # 現在はプレースホルダー実装
-                # 実装例:
-                # response = await mcp_client.call_tool(
-                #     "notion_api",
-                #     {
-                #         "method": method,
-                #         "url": url,
-                #         "headers": {
-                #             "Authorization": f"Bearer {self.api_key}",
-                #             "Notion-Version": "2022-06-28"
-                #         },
-                #         "params": params,
-                #         "json": data,
-                #         "timeout": self.timeout
-                #     }
-                # )
-
-                # プレースホルダー: 実際のMCP呼び出しに置き換える必要がある
-                await asyncio.sleep(0.1)  # API呼び出しをシミュレート
+                response = await self._send_request(method, url, params, data)
 
                 self.logger.info(f"MCP call successful: {method} {endpoint}")
-                return {}  # プレースホルダー
+                return response
 
             except Exception as e:
                 self.logger.warning(
@@ -102,12 +94,58 @@ class NotionMCPClient:
                     self.logger.error(
                         f"MCP call failed after {self.max_retries} attempts: {method} {endpoint}"
                     )
-                    raise
+                    if isinstance(e, NotionAPIError):
+                        raise
+                    raise NotionAPIError(str(e)) from e
 
                 # 指数バックオフで待機
                 delay = self.retry_delay * (2**attempt)
                 await asyncio.sleep(delay)
 
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """MCPトランスポートで1回分のAPI呼び出しを送信（内部メソッド）
+
+        リトライは行わない（_call_mcpが担当）。
+
+        Args:
+            method: HTTPメソッド
+            url: リクエストURL
+            params: クエリパラメータ
+            data: リクエストボディ
+
+        Returns:
+            APIレスポンスデータ
+        """
+        # TODO: 実際のMCP SDKクライアントを使用してAPI呼び出し
+        # 現在はプレースホルダー実装
+        # MCPセッション（接続）は__init__で1つだけ生成して全呼び出しで再利用し、
+        # 呼び出しごとに接続を張り直さないこと
+        # 実装例:
+        # response = await mcp_client.call_tool(
+        #     "notion_api",
+        #     {
+        #         "method": method,
+        #         "url": url,
+        #         "headers": {
+        #             "Authorization": f"Bearer {self.api_key}",
+        #             "Notion-Version": "2022-06-28"
+        #         },
+        #         "params": params,
+        #         "json": data,
+        #         "timeout": self.timeout
+        #     }
+        # )
+
+        # プレースホルダー: 実際のMCP呼び出しに置き換える必要がある
+        await asyncio.sleep(0.1)  # API呼び出しをシミュレート
+        return {}  # プレースホルダー
+
     async def fetch_data(self, url: str) -> Dict[str, Any]:
         """NotionからURLのデータを取得
 
@@ -123,7 +161,7 @@ class NotionMCPClient:
 
         Raises:
             ValueError: 無効なURL
-            Exception: データ取得失敗
+            NotionAPIError: データ取得失敗
         """
         self.logger.info(f"Fetching data from Notion URL: {url}")
 
@@ -246,7 +284,7 @@ class NotionMCPClient:
             Notionページ
 
         Raises:
-            Exception: ページ取得失敗
+            NotionAPIError: ページ取得失敗
         """
         self.logger.info(f"Getting Notion page: {page_id}")
 
@@ -291,7 +329,7 @@ class NotionMCPClient:
             子ブロックリスト
 
         Raises:
-            Exception: ブロック取得失敗
+            NotionAPIError: ブロック取得失敗
         """
         self.logger.info(f"Getting blocks for: {block_id}")
 
@@ -320,7 +358,7 @@ class NotionMCPClient:
             Notionデータベース
 
         Raises:
-            Exception: データベース取得失敗
+            NotionAPIError: データベース取得失敗
         """
         self.logger.info(f"Getting Notion database: {database_id}")
 
@@ -376,7 +414,7 @@ class NotionMCPClient:
             データベース行（Notionページ）リスト
 
         Raises:
-            Exception: クエリ失敗
+            NotionAPIError: クエリ失敗
         """
         self.logger.info(
             f"Querying Notion database: {database_id} (page_size={page_size})"
@@ -420,15 +458,12 @@ class NotionMCPClient:
         # https://www.notion.so/workspace/Page-Title-32文字のID
         # https://www.notion.so/32文字のID
 
-        import re
-
         # 32文字の英数字（ハイフンなし）またはUUID形式を抽出
-        pattern = r"([a-f0-9]{32})|([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})"
-        match = re.search(pattern, url.lower())
+        match = _NOTION_ID_RE.search(url)
 
         if match:
             # ハイフンなしの32文字IDをUUID形式に変換
-            id_str = match.group(1) or match.group(2)
+            id_str = (match.group(1) or match.group(2)).lower()
             if "-" not in id_str:
                 # 32文字をUUID形式に変換: 8-4-4-4-12
                 id_str = (
@@ -5,10 +5,10 @@ Google Cloud Functions用のメインエントリーポイント。
 HTTP リクエストを受信し、MCP ハンドラーに委譲。
 """
 
-import json
 import traceback
 from typing import Tuple
 
+import orjson
 from flask import Request, Response
 
 from .mcp.schemas import CreateWBSRequest, CreateWBSResponse
@@ -164,7 +164,7 @@ def wbs_create(request: Request) -> Tuple[Response, int]:
                 "success": False,
                 "error_message": f"Method {request.method} not allowed. Use POST.",
             }
-            return Response(json.dumps(error_response), status=405, headers=headers)
+            return Response(orjson.dumps(error_response), status=405, headers=headers)
 
         # リクエストボディを解析
         request_data = request.get_json(silent=True)
@@ -173,7 +173,7 @@ def wbs_create(request: Request) -> Tuple[Response, int]:
                 "success": False,
                 "error_message": "Invalid JSON in request body",
             }
-            return Response(json.dumps(error_response), status=400, headers=headers)
+            return Response(orjson.dumps(error_response), status=400, headers=headers)
 
         logger.info(f"Request data: {request_data}")
 
@@ -186,7 +186,7 @@ def wbs_create(request: Request) -> Tuple[Response, int]:
                 "success": False,
                 "error_message": f"Request validation error: {str(e)}",
             }
-            return Response(json.dumps(error_response), status=400, headers=headers)
+            return Response(orjson.dumps(error_response), status=400, headers=headers)
 
         # ハンドラーを呼び出し
         import asyncio
@@ -223,7 +223,7 @@ def wbs_create(request: Request) -> Tuple[Response, int]:
         }
 
         return Response(
-            json.dumps(error_response),
+            orjson.dumps(error_response),
             status=500,
             headers={
                 "Content-Type": "application/json",
@@ -245,10 +245,11 @@ def health_check(request: Request) -> Tuple[Response, int]:
     """
     metadata = get_server_metadata()
 
-    health_response = {"status": "healthy", "server": metadata}
+    # orjson は MappingProxyType を直列化できないため dict に変換
+    health_response = {"status": "healthy", "server": dict(metadata)}
 
     return Response(
-        json.dumps(health_response),
+        orjson.dumps(health_response),
         status=200,
         headers={"Content-Type": "application/json"},
     )
@@ -4,7 +4,9 @@ MCP サーバーセットアップ
 MCP サーバーを初期化し、ハンドラーを登録。
 """
 
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from ..utils.config import get_config
 from ..utils.logger import Logger
@@ -64,16 +66,22 @@ async def create_mcp_server(logger: Logger) -> Dict[str, Any]:
     return server_config
 
 
-def get_server_metadata() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def get_server_metadata() -> Mapping[str, Any]:
     """サーバーメタデータを取得
 
+    メタデータは固定値のため初回呼び出し時に一度だけ構築してキャッシュする。
+    全呼び出しで同じオブジェクトを共有するため、読み取り専用
+    （MappingProxyType とタプル）で返す。
+
     Returns:
-        サーバーメタデータ辞書
+        読み取り専用のサーバーメタデータ
     """
-    return {
+    metadata = {
         "name": "WBS Creation MCP Server",
         "version": "1.0.0",
         "description": "MCP server for automated WBS creation and Backlog registration",
-        "capabilities": ["create_wbs"],
-        "supported_services": ["Backlog", "Notion"],
+        "capabilities": ("create_wbs",),
+        "supported_services": ("Backlog", "Notion"),
     }
+    return MappingProxyType(metadata)
@@ -6,11 +6,28 @@ JSON/Markdown変換とタスクテキスト解析機能を提供。
 
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from ..models.enums import CategoryEnum
 from ..models.task import DEFAULT_CATEGORY, Task
 
+# 行単位のパースで毎回使う正規表現はモジュール読み込み時に一度だけコンパイル
+# 箇条書き行（- または * で始まる）
+_BULLET_RE = re.compile(r"^[-*]\s+(.+)$")
+# タスク行の追加情報（キー: 値 形式）
+_KEY_VALUE_RE = re.compile(r"(.+?):\s*(.+)")
+# Markdownの特徴的なパターン
+_MARKDOWN_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^#+\s",  # 見出し
+        r"^[-*]\s",  # 箇条書き
+        r"^\d+\.\s",  # 番号付きリスト
+        r"\[.+\]\(.+\)",  # リンク
+        r"^\>\s",  # 引用
+    )
+)
+
 
 class Converter:
     """データ変換クラス
@@ -93,21 +110,37 @@ class Converter:
         Returns:
             タスクのリスト
 
+        Raises:
+            ValueError: パースに失敗した場合
+        """
+        return self.parse_tasks_from_text_iter((text,))
+
+    def parse_tasks_from_text_iter(self, fragments: Iterable[str]) -> List[Task]:
+        """テキスト断片のイテラブルからタスクリストをパース
+
+        断片を1つずつ行に分解して処理するため、全体を結合した
+        文字列を生成せずにパースできる。
+
+        Args:
+            fragments: タスクを含むテキスト断片（Markdown形式、ブロック単位など）
+
+        Returns:
+            タスクのリスト
+
         Raises:
             ValueError: パースに失敗した場合
         """
         try:
             tasks = []
-            lines = text.split("\n")
 
             current_task = None
             current_description_lines = []
 
-            for line in lines:
+            for line in self._iter_lines(fragments):
                 stripped = line.strip()
 
                 # 箇条書き行の検出（- または * で始まる）
-                bullet_match = re.match(r"^[-*]\s+(.+)$", stripped)
+                bullet_match = _BULLET_RE.match(stripped)
 
                 if bullet_match:
                     # 前のタスクを保存
@@ -138,6 +171,18 @@ class Converter:
         except Exception as e:
             raise ValueError(f"タスクのパースに失敗しました: {str(e)}")
 
+    def _iter_lines(self, fragments: Iterable[str]) -> Iterable[str]:
+        """テキスト断片を行単位に分解
+
+        Args:
+            fragments: テキスト断片のイテラブル
+
+        Yields:
+            各行の文字列
+        """
+        for fragment in fragments:
+            yield from fragment.split("\n")
+
     def _is_markdown(self, text: str) -> bool:
         """テキストがMarkdown形式かどうかを判定
 
@@ -148,18 +193,10 @@ class Converter:
             Markdown形式の場合True
         """
         # Markdownの特徴的なパターンを検出
-        markdown_patterns = [
-            r"^#+\s",  # 見出し
-            r"^[-*]\s",  # 箇条書き
-            r"^\d+\.\s",  # 番号付きリスト
-            r"\[.+\]\(.+\)",  # リンク
-            r"^\>\s",  # 引用
-        ]
-
         for line in text.split("\n"):
             stripped = line.strip()
-            for pattern in markdown_patterns:
-                if re.match(pattern, stripped):
+            for pattern in _MARKDOWN_PATTERNS:
+                if pattern.match(stripped):
                     return True
 
         return False
@@ -185,7 +222,7 @@ class Converter:
         if len(parts) > 1:
             for part in parts[1:]:
                 # キー: 値 形式を解析
-                kv_match = re.match(r"(.+?):\s*(.+)", part.strip())
+                kv_match = _KEY_VALUE_RE.match(part.strip())
                 if kv_match:
                     key = kv_match.group(1).strip().lower()
                     value = kv_match.group(2).strip()
@@ -5,7 +5,8 @@ Backlogプロジェクトのマスターデータ（種別、カテゴリ、カ
 自動設定する機能を提供。
 """
 
-from typing import List, Set
+import asyncio
+from typing import List, Set, Tuple
 
 from ..integrations.backlog.client import BacklogMCPClient
 from ..integrations.backlog.models import CustomFieldInput
@@ -13,13 +14,14 @@ from ..models.enums import CategoryEnum, IssueTypeEnum
 from ..utils.logger import Logger
 
 # 必要な種別（課題、リスク）
-REQUIRED_ISSUE_TYPES = [
+# 作成順を保つためタプルで定義（存在確認は既存名のセットに対して行う）
+REQUIRED_ISSUE_TYPES: Tuple[str, ...] = (
     IssueTypeEnum.TASK.value,  # "課題"
     IssueTypeEnum.RISK.value,  # "リスク"
-]
+)
 
-# 必要なカテゴリ（7つすべて）
-REQUIRED_CATEGORIES = [
+# 必要なカテゴリ（7つすべて、作成順）
+REQUIRED_CATEGORIES: Tuple[str, ...] = (
     CategoryEnum.PREPARATION.value,  # "事前準備"
     CategoryEnum.REQUIREMENTS.value,  # "要件定義"
     CategoryEnum.BASIC_DESIGN.value,  # "基本設計"
@@ -27,7 +29,7 @@ REQUIRED_CATEGORIES = [
     CategoryEnum.TESTING.value,  # "テスト"
     CategoryEnum.RELEASE.value,  # "リリース"
     CategoryEnum.DELIVERY.value,  # "納品"
-]
+)
 
 # 必要なカスタム属性
 REQUIRED_CUSTOM_FIELDS = [
@@ -102,6 +104,9 @@ class MasterService:
         2. カテゴリ（7つすべて）を確認・追加
         3. カスタム属性（インプット、ゴール/アウトプット）を確認・追加
 
+        1〜3は互いに独立しているため並行して実行し、
+        いずれかが失敗しても他の処理は継続する。
+
         Args:
             project_key: プロジェクトキー
 
@@ -112,39 +117,33 @@ class MasterService:
 
         result = MasterDataResult()
 
-        # 種別をセットアップ
-        try:
-            created_types = await self._ensure_issue_types(project_key)
-            result.created_issue_types = created_types
-            self.logger.info(
-                f"Issue types setup complete: {len(created_types)} created"
-            )
-        except Exception as e:
-            error_msg = f"Failed to setup issue types: {str(e)}"
-            self.logger.error(error_msg)
-            result.errors.append(error_msg)
-
-        # カテゴリをセットアップ
-        try:
-            created_cats = await self._ensure_categories(project_key)
-            result.created_categories = created_cats
-            self.logger.info(f"Categories setup complete: {len(created_cats)} created")
-        except Exception as e:
-            error_msg = f"Failed to setup categories: {str(e)}"
-            self.logger.error(error_msg)
-            result.errors.append(error_msg)
-
-        # カスタム属性をセットアップ
-        try:
-            created_fields = await self._ensure_custom_fields(project_key)
-            result.created_custom_fields = created_fields
-            self.logger.info(
-                f"Custom fields setup complete: {len(created_fields)} created"
-            )
-        except Exception as e:
-            error_msg = f"Failed to setup custom fields: {str(e)}"
-            self.logger.error(error_msg)
-            result.errors.append(error_msg)
+        # 種別・カテゴリ・カスタム属性を並行してセットアップ
+        # （return_exceptions=True で1つの失敗が他をキャンセルしないようにする）
+        outcomes = await asyncio.gather(
+            self._ensure_issue_types(project_key),
+            self._ensure_categories(project_key),
+            self._ensure_custom_fields(project_key),
+            return_exceptions=True,
+        )
+        steps = (
+            ("issue types", "created_issue_types"),
+            ("categories", "created_categories"),
+            ("custom fields", "created_custom_fields"),
+        )
+
+        for (label, attr), outcome in zip(steps, outcomes):
+            if isinstance(outcome, Exception):
+                error_msg = f"Failed to setup {label}: {str(outcome)}"
+                self.logger.error(error_msg)
+                result.errors.append(error_msg)
+            elif isinstance(outcome, BaseException):
+                # キャンセル等はエラー扱いにせずそのまま伝播
+                raise outcome
+            else:
+                setattr(result, attr, outcome)
+                self.logger.info(
+                    f"{label.capitalize()} setup complete: {len(outcome)} created"
+                )
 
         # 結果サマリーをログ出力
         if result.success:
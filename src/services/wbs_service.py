@@ -5,7 +5,8 @@ WBS作成プロセス全体をオーケストレーションし、
 テンプレート取得から Backlog 登録までの完全なワークフローを実行。
 """
 
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..integrations.backlog.client import BacklogMCPClient
 from ..integrations.mcp_factory import MCPFactory
@@ -294,10 +295,10 @@ class WBSService:
         # Notionブロックからタスクを抽出する例
         if data.get("type") == "page" and "blocks" in data:
             blocks = data.get("blocks", [])
-            # ブロックをテキストに変換
-            text_content = self._extract_text_from_blocks(blocks)
-            # テキストからタスクをパース
-            return self.converter.parse_tasks_from_text(text_content)
+            # ブロック単位のテキストを結合せずにそのままパース
+            return self.converter.parse_tasks_from_text_iter(
+                self._iter_text_from_blocks(blocks)
+            )
 
         elif data.get("type") == "database" and "rows" in data:
             rows = data.get("rows", [])
@@ -310,18 +311,18 @@ class WBSService:
 
         return []
 
-    def _extract_text_from_blocks(self, blocks: List[Dict[str, Any]]) -> str:
-        """Notionブロックリストからテキストを抽出
+    def _iter_text_from_blocks(self, blocks: List[Dict[str, Any]]) -> Iterator[str]:
+        """Notionブロックリストからテキストをブロック単位で抽出
 
         Args:
             blocks: Notionブロックリスト
 
         Returns:
-            結合されたテキスト
+            ブロックごとのテキストのイテレーター
         """
         # TODO: 実際のNotionブロック構造に応じて実装
         # プレースホルダー実装
-        return ""
+        return iter(())
 
     async def _check_duplicates(
         self, project_key: str, tasks: List[Task]
@@ -335,7 +336,7 @@ class WBSService:
         Returns:
             (登録するタスク, 重複タスク) のタプル
         """
-        self.logger.debug(f"Checking duplicates for {len(tasks)} tasks")
+        self.logger.debug("Checking duplicates", task_count=len(tasks))
 
         try:
             # 既存タスクを取得
@@ -349,10 +350,16 @@ class WBSService:
             for task in tasks:
                 if task.title.lower() in existing_titles:
                     duplicates.append(task)
-                    self.logger.debug(f"Duplicate found: {task.title}")
                 else:
                     to_register.append(task)
 
+            if duplicates and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Duplicates found",
+                    duplicate_count=len(duplicates),
+                    titles=[t.title for t in duplicates],
+                )
+
             return (to_register, duplicates)
 
         except Exception as e:
@@ -71,13 +71,11 @@ class StorageManager:
                 "Starting data save operation", file_url=file_url, format=format
             )
 
-            # 最新バージョンを取得してバージョン番号を決定
-            latest_metadata = await self.firestore_client.get_latest_metadata(file_url)
-
-            if latest_metadata:
-                new_version = latest_metadata.version + 1
-            else:
-                new_version = 1
+            # 最新バージョン番号を取得して新しいバージョン番号を決定
+            latest_version = await self.firestore_client.get_latest_version_number(
+                file_url
+            )
+            new_version = latest_version + 1
 
             # GCS保存パスを生成
             gcs_path = self.config.get_gcs_path(file_url, new_version)
@@ -4,14 +4,40 @@ Firestoreクライアント
 ファイルメタデータのCRUD操作とバージョン管理を提供。
 """
 
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional
 
 from google.cloud import firestore
+from pydantic import TypeAdapter
 
 from ..models.metadata import FileMetadata
 from ..utils.config import get_config
 from ..utils.logger import Logger
 
+# プロジェクトIDごとに共有するAsyncClient（gRPCチャネルと認証情報を再利用）
+_CLIENT_CACHE: Dict[str, firestore.AsyncClient] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# メタデータリストの検証器（スキーマを一度だけ構築して再利用）
+_METADATA_LIST_ADAPTER = TypeAdapter(List[FileMetadata])
+
+
+def _get_shared_client(project_id: str) -> firestore.AsyncClient:
+    """プロジェクトIDに対応する共有AsyncClientを取得
+
+    Args:
+        project_id: GCPプロジェクトID
+
+    Returns:
+        共有Firestore AsyncClient
+    """
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(project_id)
+        if client is None:
+            client = firestore.AsyncClient(project=project_id)
+            _CLIENT_CACHE[project_id] = client
+        return client
+
 
 class FirestoreClient:
     """Firestoreクライアントクラス
@@ -42,7 +68,7 @@ class FirestoreClient:
             # 本番用: 設定から初期化
             config = get_config()
             self.collection_name = collection_name or config.firestore_collection
-            self.db = firestore.AsyncClient(project=config.gcp_project_id)
+            self.db = _get_shared_client(config.gcp_project_id)
 
         self.logger.info(
             "Firestore client initialized", collection=self.collection_name
@@ -144,6 +170,55 @@ class FirestoreClient:
             )
             raise
 
+    async def get_latest_version_number(self, file_url: str) -> int:
+        """最新バージョン番号のみを取得
+
+        versionフィールドのみを射影して取得するため、メタデータ全体の
+        転送とモデル構築を行わない。複合インデックス
+        （file_url ASC, version DESC）を前提とする。
+
+        Args:
+            file_url: ファイルURL
+
+        Returns:
+            最新バージョン番号。存在しない場合は0
+
+        Raises:
+            Exception: 取得に失敗した場合
+        """
+        try:
+            collection_ref = self.db.collection(self.collection_name)
+
+            # versionのみ射影し、versionで降順ソート、最初の1件を取得
+            query = (
+                collection_ref.where("file_url", "==", file_url)
+                .select(["version"])
+                .order_by("version", direction=firestore.Query.DESCENDING)
+                .limit(1)
+            )
+
+            docs = [doc async for doc in query.stream()]
+
+            if not docs:
+                self.logger.info("No version found for file_url", file_url=file_url)
+                return 0
+
+            version = docs[0].to_dict()["version"]
+
+            self.logger.info(
+                "Latest version number retrieved", file_url=file_url, version=version
+            )
+
+            return version
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to get latest version number from Firestore",
+                error=e,
+                file_url=file_url,
+            )
+            raise
+
     async def get_metadata_by_version(
         self, file_url: str, version: int
     ) -> Optional[FileMetadata]:
@@ -223,13 +298,10 @@ class FirestoreClient:
                 "version", direction=firestore.Query.DESCENDING
             )
 
-            docs = [doc async for doc in query.stream()]
+            rows = [{**doc.to_dict(), "id": doc.id} async for doc in query.stream()]
 
-            metadata_list = []
-            for doc in docs:
-                data = doc.to_dict()
-                data["id"] = doc.id
-                metadata_list.append(FileMetadata(**data))
+            # 全ドキュメントを1回の呼び出しでまとめて検証
+            metadata_list = _METADATA_LIST_ADAPTER.validate_python(rows)
 
             self.logger.info(
                 "All versions retrieved",
@@ -5,20 +5,75 @@ GCS（Google Cloud Storage）クライアント
 """
 
 import asyncio
-import json
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import orjson
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 
 from ..utils.config import get_config
 from ..utils.logger import Logger
 
+# プロジェクトIDごとに共有するstorage.Client、(プロジェクトID, バケット名)ごとのBucket
+# （HTTPセッションと認証情報を再利用）
+_CLIENT_CACHE: Dict[str, storage.Client] = {}
+_BUCKET_CACHE: Dict[Tuple[str, str], storage.Bucket] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# GCS IO専用のスレッドプール（全インスタンスで共有、初回利用時に生成）
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+# このサイズを超えるJSONはイベントループを止めないようエグゼキューターでパース
+_LARGE_JSON_BYTES = 1024 * 1024
+
+
+def _get_shared_bucket(project_id: str, bucket_name: str) -> storage.Bucket:
+    """プロジェクトIDとバケット名に対応する共有Bucketを取得
+
+    Args:
+        project_id: GCPプロジェクトID
+        bucket_name: バケット名
+
+    Returns:
+        共有GCS Bucket
+    """
+    with _CLIENT_LOCK:
+        bucket = _BUCKET_CACHE.get((project_id, bucket_name))
+        if bucket is None:
+            client = _CLIENT_CACHE.get(project_id)
+            if client is None:
+                client = storage.Client(project=project_id)
+                _CLIENT_CACHE[project_id] = client
+            bucket = client.bucket(bucket_name)
+            _BUCKET_CACHE[(project_id, bucket_name)] = bucket
+        return bucket
+
+
+def _get_shared_executor() -> ThreadPoolExecutor:
+    """GCS IO用の共有スレッドプールを取得
+
+    Returns:
+        共有ThreadPoolExecutor（デフォルトエグゼキューターと競合させない）
+    """
+    global _EXECUTOR
+    with _CLIENT_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=get_config().gcs_io_workers, thread_name_prefix="gcs-io"
+            )
+        return _EXECUTOR
+
 
 class GCSClient:
     """GCSクライアントクラス
 
     JSON/Markdownファイルのアップロード・ダウンロード機能を提供。
+    google-cloud-storage の同期HTTPトランスポートをエグゼキューター上で実行するため、
+    イベントループのセレクターはGCS通信のデータパスに関与しない。
 
     Attributes:
         client: GCSクライアント
@@ -47,10 +102,12 @@ class GCSClient:
 
             if client:
                 self.client = client
+                self.bucket = self.client.bucket(self.bucket_name)
             else:
-                self.client = storage.Client(project=config.gcp_project_id)
-
-            self.bucket = self.client.bucket(self.bucket_name)
+                self.bucket = _get_shared_bucket(
+                    config.gcp_project_id, self.bucket_name
+                )
+                self.client = self.bucket.client
 
         # リトライ設定
         self.max_retries = 3
@@ -58,18 +115,29 @@ class GCSClient:
 
         self.logger.info("GCS client initialized", bucket=self.bucket_name)
 
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """GCS IO用の共有スレッドプール"""
+        return _get_shared_executor()
+
     async def upload_data(
         self,
         path: str,
         data: Union[Dict[str, Any], str],
         content_type: str = "application/json",
+        pretty: bool = False,
     ) -> str:
         """データをGCSにアップロード
 
+        JSONはデフォルトでインデントなしのコンパクト形式で保存する。
+        JSONは空白に依存しないため、download_data(as_json=True) の結果は
+        pretty の指定に関わらず同じになる。
+
         Args:
             path: GCS内のパス
             data: アップロードするデータ（DictまたはMarkdown文字列）
             content_type: コンテンツタイプ（デフォルト: application/json）
+            pretty: JSONをインデント付きで保存する場合True（デバッグ用）
 
         Returns:
             アップロードされたGCS URI
@@ -80,19 +148,29 @@ class GCSClient:
         try:
             blob = self.bucket.blob(path)
 
-            # データを文字列に変換
+            # データをUTF-8バイト列に変換（dictはorjsonで直接バイト列に変換）
+            # 日本語などの非ASCII文字も \uXXXX にエスケープせずそのまま出力される
             if isinstance(data, dict):
-                content = json.dumps(data, ensure_ascii=False, indent=2)
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                content = orjson.dumps(data, option=option)
                 content_type = "application/json"
             else:
-                content = data
+                content = data.encode("utf-8")
                 content_type = "text/markdown"
 
             # 非同期実行（ブロッキングIOを別スレッドで実行）
-            loop = asyncio.get_event_loop()
+            # サイズを明示してファイルオブジェクトから直接アップロード
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
-                None,
-                partial(blob.upload_from_string, content, content_type=content_type),
+                self._executor,
+                partial(
+                    blob.upload_from_file,
+                    io.BytesIO(content),
+                    size=len(content),
+                    content_type=content_type,
+                ),
             )
 
             gcs_uri = f"gs://{self.bucket_name}/{path}"
@@ -111,6 +189,39 @@ class GCSClient:
             self.logger.error("Failed to upload data to GCS", error=e, path=path)
             raise
 
+    async def upload_many(
+        self,
+        items: List[Tuple[str, Union[Dict[str, Any], str]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """複数のデータを並行してGCSにアップロード
+
+        Args:
+            items: (GCS内のパス, データ) のリスト
+            max_concurrency: 同時アップロード数の上限
+                （デフォルト: 設定値 GCS_MAX_CONCURRENCY）
+
+        Returns:
+            アップロードされたGCS URIのリスト（itemsと同じ順序）
+
+        Raises:
+            ValueError: max_concurrencyが1未満の場合
+            Exception: いずれかのアップロードに失敗した場合
+        """
+        if max_concurrency is None:
+            max_concurrency = get_config().gcs_max_concurrency
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrencyは1以上を指定してください: {max_concurrency}"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _upload(path: str, data: Union[Dict[str, Any], str]) -> str:
+            async with semaphore:
+                return await self.upload_data(path, data)
+
+        return await asyncio.gather(*(_upload(path, data) for path, data in items))
+
     async def download_data(
         self, path: str, as_json: bool = True
     ) -> Union[Dict[str, Any], str]:
@@ -130,22 +241,26 @@ class GCSClient:
             blob = self.bucket.blob(path)
 
             # 非同期実行（ブロッキングIOを別スレッドで実行）
-            loop = asyncio.get_event_loop()
-            content_bytes = await loop.run_in_executor(None, blob.download_as_bytes)
-
-            content = content_bytes.decode("utf-8")
+            loop = asyncio.get_running_loop()
+            content_bytes = await loop.run_in_executor(
+                self._executor, blob.download_as_bytes
+            )
 
-            # JSONパースまたは文字列として返却
-            if as_json:
-                data = json.loads(content)
+            # JSONはバイト列のまま直接パースし、文字列の場合のみデコード
+            if as_json and len(content_bytes) > _LARGE_JSON_BYTES:
+                data = await loop.run_in_executor(
+                    self._executor, orjson.loads, content_bytes
+                )
+            elif as_json:
+                data = orjson.loads(content_bytes)
             else:
-                data = content
+                data = content_bytes.decode("utf-8")
 
             self.logger.info(
                 "Data downloaded from GCS",
                 path=path,
                 as_json=as_json,
-                size=len(content),
+                size=len(content_bytes),
             )
 
             return data
@@ -167,8 +282,8 @@ class GCSClient:
             blob = self.bucket.blob(path)
 
             # 非同期実行
-            loop = asyncio.get_event_loop()
-            exists = await loop.run_in_executor(None, blob.exists)
+            loop = asyncio.get_running_loop()
+            exists = await loop.run_in_executor(self._executor, blob.exists)
 
             self.logger.debug("File existence checked", path=path, exists=exists)
 
@@ -180,6 +295,43 @@ class GCSClient:
             )
             raise
 
+    async def try_download(self, path: str) -> Tuple[bool, Optional[bytes]]:
+        """存在確認とダウンロードを1回のリクエストで実行
+
+        file_exists → download_data の2往復の代わりに使用する。
+
+        Args:
+            path: GCS内のパス
+
+        Returns:
+            (True, バイト列) または ファイルが存在しない場合 (False, None)
+
+        Raises:
+            Exception: 404以外でダウンロードに失敗した場合
+        """
+        try:
+            blob = self.bucket.blob(path)
+
+            # 非同期実行（404はNotFoundとして送出される）
+            loop = asyncio.get_running_loop()
+            content_bytes = await loop.run_in_executor(
+                self._executor, blob.download_as_bytes
+            )
+
+        except NotFound:
+            self.logger.debug("File not found in GCS", path=path)
+            return False, None
+
+        except Exception as e:
+            self.logger.error("Failed to download data from GCS", error=e, path=path)
+            raise
+
+        self.logger.debug(
+            "Data downloaded from GCS", path=path, size=len(content_bytes)
+        )
+
+        return True, content_bytes
+
     async def delete_file(self, path: str) -> None:
         """ファイルを削除
 
@@ -193,11 +345,26 @@ class GCSClient:
             blob = self.bucket.blob(path)
 
             # 非同期実行
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, blob.delete)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, blob.delete)
 
             self.logger.info("File deleted from GCS", path=path)
 
         except Exception as e:
             self.logger.error("Failed to delete file from GCS", error=e, path=path)
             raise
+
+    @staticmethod
+    def close_shared() -> None:
+        """共有storage.ClientとBucketのキャッシュ、IO用スレッドプールを破棄
+
+        インスタンス単位で解放するリソースは持たないため、
+        GCSClientの後始末はこのメソッドで行う。
+        """
+        global _EXECUTOR
+        with _CLIENT_LOCK:
+            _BUCKET_CACHE.clear()
+            _CLIENT_CACHE.clear()
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+                _EXECUTOR = None
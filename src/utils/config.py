@@ -5,52 +5,63 @@
 """
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from hashlib import blake2b
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """設定管理クラス（シングルトン）
+    """設定管理クラス（イミュータブル）
 
-    環境変数と設定ファイルから設定を読み込み、
-    アプリケーション全体で共有する。
+    環境変数から設定を読み込み、モジュール読み込み時に生成した
+    単一インスタンスをアプリケーション全体で共有する。
     """
 
-    _instance: Optional["Config"] = None
+    # GCP設定
+    gcp_project_id: str = ""
+    gcs_bucket: str = "wbs-templates"
+    firestore_collection: str = "file_metadata"
+    gcs_io_workers: int = 32
+    gcs_max_concurrency: int = 16
 
-    def __new__(cls) -> "Config":
-        """シングルトンインスタンスを返却"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    # Backlog設定
+    backlog_api_key: str = field(default="", repr=False)
+    backlog_space_url: str = ""
 
-    def __init__(self) -> None:
-        """設定を初期化"""
-        if self._initialized:
-            return
+    # Notion設定
+    notion_api_key: str = field(default="", repr=False)
 
-        # GCP設定
-        self.gcp_project_id = os.getenv("GCP_PROJECT_ID", "")
-        self.gcs_bucket = os.getenv("GCS_BUCKET", "wbs-templates")
-        self.firestore_collection = os.getenv("FIRESTORE_COLLECTION", "file_metadata")
+    # Document AI設定
+    document_ai_processor_id: str = ""
+    document_ai_location: str = "us"
 
-        # Backlog設定
-        self.backlog_api_key = os.getenv("BACKLOG_API_KEY", "")
-        self.backlog_space_url = os.getenv("BACKLOG_SPACE_URL", "")
+    # アプリケーション設定
+    default_category: str = "要件定義"
+    max_retry_count: int = 3
+    api_timeout: int = 30
 
-        # Notion設定
-        self.notion_api_key = os.getenv("NOTION_API_KEY", "")
+    @classmethod
+    def from_env(cls) -> "Config":
+        """環境変数から設定を読み込み
 
-        # Document AI設定
-        self.document_ai_processor_id = os.getenv("DOCUMENT_AI_PROCESSOR_ID", "")
-        self.document_ai_location = os.getenv("DOCUMENT_AI_LOCATION", "us")
-
-        # アプリケーション設定
-        self.default_category = os.getenv("DEFAULT_CATEGORY", "要件定義")
-        self.max_retry_count = int(os.getenv("MAX_RETRY_COUNT", "3"))
-        self.api_timeout = int(os.getenv("API_TIMEOUT", "30"))
-
-        self._initialized = True
+        Returns:
+            Configインスタンス
+        """
+        return cls(
+            gcp_project_id=os.getenv("GCP_PROJECT_ID", ""),
+            gcs_bucket=os.getenv("GCS_BUCKET", "wbs-templates"),
+            firestore_collection=os.getenv("FIRESTORE_COLLECTION", "file_metadata"),
+            gcs_io_workers=int(os.getenv("GCS_IO_WORKERS", "32")),
+            gcs_max_concurrency=int(os.getenv("GCS_MAX_CONCURRENCY", "16")),
+            backlog_api_key=os.getenv("BACKLOG_API_KEY", ""),
+            backlog_space_url=os.getenv("BACKLOG_SPACE_URL", ""),
+            notion_api_key=os.getenv("NOTION_API_KEY", ""),
+            document_ai_processor_id=os.getenv("DOCUMENT_AI_PROCESSOR_ID", ""),
+            document_ai_location=os.getenv("DOCUMENT_AI_LOCATION", "us"),
+            default_category=os.getenv("DEFAULT_CATEGORY", "要件定義"),
+            max_retry_count=int(os.getenv("MAX_RETRY_COUNT", "3")),
+            api_timeout=int(os.getenv("API_TIMEOUT", "30")),
+        )
 
     def validate(self) -> bool:
         """必須設定の存在を確認
@@ -63,7 +74,7 @@ class Config:
             self.backlog_api_key,
         ]
 
-        return all(field for field in required_fields)
+        return all(value for value in required_fields)
 
     def get_gcs_path(self, file_url: str, version: int) -> str:
         """GCS保存パスを生成
@@ -75,17 +86,19 @@ class Config:
         Returns:
             GCS保存パス
         """
-        # URLからハッシュを生成してパス化
-        from hashlib import sha256
-
-        url_hash = sha256(file_url.encode()).hexdigest()[:16]
+        # URLから16桁（8バイト）のハッシュを生成してパス化
+        url_hash = blake2b(file_url.encode(), digest_size=8).hexdigest()
         return f"templates/{url_hash}/v{version}"
 
 
+# モジュール読み込み時に一度だけ生成する共有インスタンス
+_CONFIG = Config.from_env()
+
+
 def get_config() -> Config:
-    """Configインスタンスを取得（シングルトン）
+    """共有Configインスタンスを取得
 
     Returns:
         Configインスタンス
     """
-    return Config()
+    return _CONFIG
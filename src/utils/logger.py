@@ -6,9 +6,26 @@ Google Cloud Loggingとの統合とリクエストIDトレーシングを提供
 
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+# ログから除外する機密情報のキー
+_SENSITIVE_KEYS = frozenset({"api_key", "token", "password", "secret"})
+
+
+@lru_cache(maxsize=256)
+def _is_sensitive_key(key: str) -> bool:
+    """キーが機密情報かを判定（ログのキー名は固定的なため結果をキャッシュ）
+
+    Args:
+        key: ログフィールドのキー
+
+    Returns:
+        機密情報のキーの場合True
+    """
+    return key.lower() in _SENSITIVE_KEYS
+
 
 class Logger:
     """構造化ログラッパークラス
@@ -53,19 +70,50 @@ class Logger:
             構造化ログデータ
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
             "request_id": self.request_id,
             "message": message,
         }
 
         # 機密情報を除外
-        sensitive_keys = {"api_key", "token", "password", "secret"}
-        for key, value in kwargs.items():
-            if key.lower() not in sensitive_keys:
-                log_data[key] = value
+        if kwargs:
+            log_data.update(
+                (key, value)
+                for key, value in kwargs.items()
+                if not _is_sensitive_key(key)
+            )
 
         return log_data
 
+    def isEnabledFor(self, level: int) -> bool:
+        """指定レベルのログが出力対象かを判定
+
+        高コストなログコンテキストを構築する前の判定に使用する。
+
+        Args:
+            level: ログレベル（logging.DEBUG など）
+
+        Returns:
+            出力対象の場合True
+        """
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, message: str, **kwargs: Any) -> None:
+        """指定レベルでログを記録
+
+        出力対象外のレベルではログデータを構築せずに戻る。
+
+        Args:
+            level: ログレベル（logging.DEBUG など）
+            message: ログメッセージ
+            **kwargs: 追加のログフィールド
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        log_data = self._format_log(message, **kwargs)
+        self.logger.log(level, log_data)
+
     def info(self, message: str, **kwargs: Any) -> None:
         """INFOレベルログを記録
 
@@ -73,8 +121,7 @@ class Logger:
             message: ログメッセージ
             **kwargs: 追加のログフィールド
         """
-        log_data = self._format_log(message, **kwargs)
-        self.logger.info(log_data)
+        self._log(logging.INFO, message, **kwargs)
 
     def error(
         self, message: str, error: Optional[Exception] = None, **kwargs: Any
@@ -90,8 +137,7 @@ class Logger:
             kwargs["error_type"] = type(error).__name__
             kwargs["error_message"] = str(error)
 
-        log_data = self._format_log(message, **kwargs)
-        self.logger.error(log_data)
+        self._log(logging.ERROR, message, **kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """WARNINGレベルログを記録
@@ -100,8 +146,7 @@ class Logger:
             message: ログメッセージ
             **kwargs: 追加のログフィールド
         """
-        log_data = self._format_log(message, **kwargs)
-        self.logger.warning(log_data)
+        self._log(logging.WARNING, message, **kwargs)
 
     def debug(self, message: str, **kwargs: Any) -> None:
         """DEBUGレベルログを記録
@@ -110,8 +155,7 @@ class Logger:
             message: ログメッセージ
             **kwargs: 追加のログフィールド
         """
-        log_data = self._format_log(message, **kwargs)
-        self.logger.debug(log_data)
+        self._log(logging.DEBUG, message, **kwargs)
 
 
 def get_logger(request_id: str, name: str = "wbs-creation") -> Logger:
@@ -5,7 +5,14 @@ URL検証、入力検証などの機能を提供。
 """
 
 import re
-from urllib.parse import urlparse
+
+# 事前コンパイル済みの検証パターン
+# 先頭の制御文字・空白はurlparse同様に無視する
+_URL_RE = re.compile(r"[\x00-\x20]*([a-zA-Z][a-zA-Z0-9+.-]*)://[^/?#]+")
+_URL_SCHEMES = ("http", "https")
+_BACKLOG_RE = re.compile(r"https?://[^/]+\.backlog\.(jp|com)")
+_NOTION_RE = re.compile(r"https?://(www\.)?notion\.so")
+_PROJECT_KEY_RE = re.compile(r"[a-zA-Z0-9_-]+", re.ASCII)
 
 
 def validate_url(url: str) -> bool:
@@ -23,21 +30,16 @@ def validate_url(url: str) -> bool:
     if not url:
         raise ValueError("URLが空です")
 
-    try:
-        result = urlparse(url)
-
-        # スキームとネットワークロケーションの確認
-        if not all([result.scheme, result.netloc]):
-            raise ValueError("URLの形式が無効です")
+    # スキームとネットワークロケーションの確認
+    match = _URL_RE.match(url)
+    if not match:
+        raise ValueError("URL検証エラー: URLの形式が無効です")
 
-        # HTTPSスキームの確認
-        if result.scheme not in ["http", "https"]:
-            raise ValueError("HTTP/HTTPSスキームが必要です")
+    # HTTPSスキームの確認（スキームは大文字小文字を区別しない）
+    if match.group(1).lower() not in _URL_SCHEMES:
+        raise ValueError("URL検証エラー: HTTP/HTTPSスキームが必要です")
 
-        return True
-
-    except Exception as e:
-        raise ValueError(f"URL検証エラー: {str(e)}")
+    return True
 
 
 def validate_backlog_url(url: str) -> bool:
@@ -55,9 +57,7 @@ def validate_backlog_url(url: str) -> bool:
     validate_url(url)
 
     # Backlogのドメインパターンをチェック
-    backlog_pattern = r"https?://[^/]+\.backlog\.(jp|com)"
-
-    if not re.match(backlog_pattern, url):
+    if not _BACKLOG_RE.match(url):
         raise ValueError(
             "URLが無効です。BacklogのURLを指定してください "
             "(例: https://example.backlog.jp/...)"
@@ -81,9 +81,7 @@ def validate_notion_url(url: str) -> bool:
     validate_url(url)
 
     # Notionのドメインパターンをチェック
-    notion_pattern = r"https?://(www\.)?notion\.so"
-
-    if not re.match(notion_pattern, url):
+    if not _NOTION_RE.match(url):
         raise ValueError(
             "URLが無効です。NotionのURLを指定してください "
             "(例: https://www.notion.so/...)"
@@ -108,9 +106,7 @@ def validate_project_key(project_key: str) -> bool:
         raise ValueError("プロジェクトキーが空です")
 
     # プロジェクトキーのパターン（英数字とアンダースコア、ハイフン）
-    pattern = r"^[A-Z0-9_-]+$"
-
-    if not re.match(pattern, project_key.upper()):
+    if not _PROJECT_KEY_RE.fullmatch(project_key):
         raise ValueError(
             "プロジェクトキーの形式が無効です。"
             "英数字、アンダースコア、ハイフンのみ使用可能です"
@@ -128,11 +124,7 @@ def is_backlog_url(url: str) -> bool:
     Returns:
         Backlog URLの場合True
     """
-    try:
-        validate_backlog_url(url)
-        return True
-    except ValueError:
-        return False
+    return bool(url) and _BACKLOG_RE.match(url) is not None
 
 
 def is_notion_url(url: str) -> bool:
@@ -144,8 +136,4 @@ def is_notion_url(url: str) -> bool:
     Returns:
         Notion URLの場合True
     """
-    try:
-        validate_notion_url(url)
-        return True
-    except ValueError:
-        return False
+    return bool(url) and _NOTION_RE.match(url) is not None
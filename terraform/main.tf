@@ -123,6 +123,24 @@ resource "google_storage_bucket_iam_member" "wbs_data_access" {
 #   type        = "FIRESTORE_NATIVE"
 # }
 
+# Composite index for latest-version lookups (file_url ASC, version DESC)
+resource "google_firestore_index" "file_metadata_version" {
+  project    = var.project_id
+  collection = "file_metadata"
+
+  fields {
+    field_path = "file_url"
+    order      = "ASCENDING"
+  }
+
+  fields {
+    field_path = "version"
+    order      = "DESCENDING"
+  }
+
+  depends_on = [google_project_service.required_apis]
+}
+
 # Grant Firestore access to Service Account
 resource "google_project_iam_member" "firestore_access" {
   project = var.project_id
@@ -2,28 +2,74 @@
 Pytest configuration and shared fixtures
 """
 
-import os
-import sys
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from src.storage import firestore_client, gcs_client
+from src.utils.config import Config
+from src.utils.logger import Logger
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """Event loop shared by every async test in the session
+
+    Overriding event_loop is deprecated from pytest-asyncio 0.22, which is why
+    requirements-dev.txt pins it below that release.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
 def mock_logger():
-    """Mock Logger fixture"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.warning = Mock()
-    logger.error = Mock()
-    return logger
+    """Mock Logger fixture (spec=Logger so typos in method names fail fast)
 
+    Shared by the whole session; _reset_logger clears it before every test.
+    """
+    return Mock(spec=Logger)
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def _reset_logger(mock_logger):
+    """Start every test with no calls recorded on the shared logger"""
+    mock_logger.reset_mock()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_storage_client_caches():
+    """Drop module-level storage client caches after every test
+
+    Tests that patch firestore/storage (e.g. test_main) would otherwise leave
+    Mock clients cached for later tests.
+    """
+    yield
+    firestore_client._CLIENT_CACHE.clear()
+    gcs_client._BUCKET_CACHE.clear()
+    gcs_client._CLIENT_CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def async_return():
+    """Factory for plain coroutine stubs that return a fixed value
+
+    Lighter than AsyncMock where the test does not check calls.
+    """
+
+    def _async_return(value):
+        async def _stub(*args, **kwargs):
+            return value
+
+        return _stub
+
+    return _async_return
+
+
+@pytest.fixture(scope="session")
 def sample_task_data():
     """Sample task data for testing"""
     return {
@@ -35,7 +81,7 @@ def sample_task_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tasks_text():
     """Sample tasks text in Markdown format"""
     return """
@@ -45,13 +91,13 @@ def sample_tasks_text():
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_backlog_url():
     """Sample Backlog URL"""
     return "https://example.backlog.com/view/PROJ-123"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_notion_url():
     """Sample Notion URL"""
     return "https://www.notion.so/workspace/Page-Title-abc123def456"
@@ -60,11 +106,12 @@ def sample_notion_url():
 @pytest.fixture
 def mock_config():
     """Mock Config fixture"""
-    config = Mock()
-    config.gcp_project_id = "test-project"
-    config.gcs_bucket_name = "test-bucket"
-    config.backlog_api_key = "test-backlog-key"
-    config.backlog_space_url = "https://test.backlog.com"
-    config.notion_api_key = "test-notion-key"
-    config.document_ai_processor_id = "test-processor"
-    return config
+    return Mock(
+        spec=Config,
+        gcp_project_id="test-project",
+        gcs_bucket="test-bucket",
+        backlog_api_key="test-backlog-key",
+        backlog_space_url="https://test.backlog.com",
+        notion_api_key="test-notion-key",
+        document_ai_processor_id="test-processor",
+    )
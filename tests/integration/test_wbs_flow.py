@@ -113,8 +113,7 @@ async def test_service_integration_flow(mock_logger):
 class TestBacklogIntegration:
     """Tests for Backlog client integration"""
 
-    @pytest.mark.asyncio
-    async def test_backlog_client_initialization(self, mock_logger):
+    def test_backlog_client_initialization(self, mock_logger):
         """Test Backlog client can be initialized"""
         client = BacklogMCPClient(
             api_key="test-key", space_url="https://test.backlog.com", logger=mock_logger
@@ -124,8 +123,7 @@ class TestBacklogIntegration:
         assert client.space_url == "https://test.backlog.com"
         assert client.logger == mock_logger
 
-    @pytest.mark.asyncio
-    async def test_backlog_client_with_mcp_factory(self, mock_logger):
+    def test_backlog_client_with_mcp_factory(self, mock_logger):
         """Test creating Backlog client via MCPFactory"""
         with patch("src.integrations.mcp_factory.get_config") as mock_config:
             mock_config.return_value = Mock(
@@ -144,8 +142,7 @@ class TestBacklogIntegration:
 class TestStorageIntegration:
     """Tests for storage integration"""
 
-    @pytest.mark.asyncio
-    async def test_storage_manager_initialization(self, mock_logger):
+    def test_storage_manager_initialization(self, mock_logger):
         """Test storage manager can be initialized"""
         mock_firestore = Mock()
         mock_gcs = Mock()
@@ -163,7 +160,7 @@ class TestStorageIntegration:
         mock_gcs = Mock()
 
         # Mock save flow
-        mock_firestore.get_latest_metadata = AsyncMock(return_value=None)
+        mock_firestore.get_latest_version_number = AsyncMock(return_value=0)
         mock_firestore.save_metadata = AsyncMock(return_value="meta123")
         mock_gcs.upload_data = AsyncMock()
 
@@ -2,31 +2,63 @@
 Unit tests for BacklogMCPClient
 """
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
-from src.integrations.backlog.client import BacklogMCPClient
+from src.integrations.backlog.client import BacklogAPIError, BacklogMCPClient
+from src.integrations.backlog.models import Category, CustomFieldInput, IssueType
+from src.models.enums import CategoryEnum
+from src.models.task import Task
 
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.error = Mock()
-    return logger
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def backlog_client(mock_logger):
-    """Create BacklogMCPClient instance"""
+    """Create BacklogMCPClient instance (shared within the module)"""
     return BacklogMCPClient(
         api_key="test-api-key", space_url="https://test.backlog.com", logger=mock_logger
     )
 
 
+@pytest.fixture
+def mock_call_mcp(backlog_client, monkeypatch):
+    """Replace _call_mcp with an AsyncMock for the duration of a test"""
+    mock = AsyncMock(return_value={})
+    monkeypatch.setattr(backlog_client, "_call_mcp", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def sample_custom_field():
+    """Custom field input with description and required flag (read-only)"""
+    return CustomFieldInput(
+        name="テストフィールド",
+        type_id=1,
+        description="テスト用カスタムフィールド",
+        required=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def scoped_custom_field():
+    """Custom field input limited to specific issue types (read-only)"""
+    return CustomFieldInput(
+        name="フィールド", type_id=2, applicable_issue_types=[1, 2, 3]
+    )
+
+
+@pytest.fixture(scope="module")
+def full_task():
+    """Task with every optional field set (read-only)"""
+    return Task(
+        title="タスク1",
+        description="説明1",
+        category=CategoryEnum.IMPLEMENTATION,
+        priority="高",
+        assignee="user123",
+    )
+
+
 class TestBacklogMCPClientInit:
     """Tests for BacklogMCPClient initialization"""
 
@@ -44,269 +76,155 @@ class TestBacklogMCPClientInit:
         assert client.retry_delay == 1.0
 
 
-class TestBacklogMCPClientFetchData:
-    """Tests for fetch_data method"""
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_returns_dict(self, backlog_client):
-        """Test fetch_data returns empty dict (placeholder)"""
-        result = await backlog_client.fetch_data("https://test.backlog.com/view/TEST-1")
-        assert isinstance(result, dict)
-
-
-class TestBacklogMCPClientGetTasks:
-    """Tests for get_tasks method"""
-
-    @pytest.mark.asyncio
-    async def test_get_tasks_returns_list(self, backlog_client):
-        """Test get_tasks returns empty list (placeholder)"""
-        result = await backlog_client.get_tasks("TEST_PROJECT")
-        assert isinstance(result, list)
-
-
-class TestBacklogMCPClientCreateTasks:
-    """Tests for create_tasks method"""
-
-    @pytest.mark.asyncio
-    async def test_create_tasks_returns_list(self, backlog_client):
-        """Test create_tasks returns empty list (placeholder)"""
-        result = await backlog_client.create_tasks("TEST_PROJECT", [])
-        assert isinstance(result, list)
-
-
-class TestBacklogMCPClientGetIssueTypes:
-    """Tests for get_issue_types method"""
-
-    @pytest.mark.asyncio
-    async def test_get_issue_types_returns_list(self, backlog_client):
-        """Test get_issue_types returns empty list (placeholder)"""
-        result = await backlog_client.get_issue_types("TEST_PROJECT")
-        assert isinstance(result, list)
-
-
-class TestBacklogMCPClientCreateIssueType:
-    """Tests for create_issue_type method"""
-
-    @pytest.mark.asyncio
-    async def test_create_issue_type_completes(self, backlog_client):
-        """Test create_issue_type completes without error (placeholder)"""
-        await backlog_client.create_issue_type("TEST_PROJECT", "課題")
-
-
-class TestBacklogMCPClientGetCategories:
-    """Tests for get_categories method"""
+class TestBacklogMCPClientPlaceholderMethods:
+    """Tests for placeholder read/create methods"""
 
     @pytest.mark.asyncio
-    async def test_get_categories_returns_list(self, backlog_client):
-        """Test get_categories returns empty list (placeholder)"""
-        result = await backlog_client.get_categories("TEST_PROJECT")
-        assert isinstance(result, list)
-
-
-class TestBacklogMCPClientCreateCategory:
-    """Tests for create_category method"""
-
-    @pytest.mark.asyncio
-    async def test_create_category_completes(self, backlog_client):
-        """Test create_category completes without error (placeholder)"""
-        await backlog_client.create_category("TEST_PROJECT", "実装")
-
-
-class TestBacklogMCPClientGetCustomFields:
-    """Tests for get_custom_fields method"""
-
-    @pytest.mark.asyncio
-    async def test_get_custom_fields_returns_list(self, backlog_client):
-        """Test get_custom_fields returns empty list (placeholder)"""
-        result = await backlog_client.get_custom_fields("TEST_PROJECT")
-        assert isinstance(result, list)
+    @pytest.mark.parametrize(
+        "method,args,expected_type",
+        [
+            ("fetch_data", ("https://test.backlog.com/view/TEST-1",), dict),
+            ("get_tasks", ("TEST_PROJECT",), list),
+            ("create_tasks", ("TEST_PROJECT", []), list),
+            ("get_issue_types", ("TEST_PROJECT",), list),
+            ("create_issue_type", ("TEST_PROJECT", "課題"), IssueType),
+            ("get_categories", ("TEST_PROJECT",), list),
+            ("create_category", ("TEST_PROJECT", "実装"), Category),
+            ("get_custom_fields", ("TEST_PROJECT",), list),
+        ],
+    )
+    async def test_placeholder_returns(
+        self, backlog_client, method, args, expected_type
+    ):
+        """Test placeholder methods complete and return the expected type"""
+        result = await getattr(backlog_client, method)(*args)
+        assert isinstance(result, expected_type)
 
 
 class TestBacklogMCPClientCreateCustomField:
     """Tests for create_custom_field method"""
 
     @pytest.mark.asyncio
-    async def test_create_custom_field_success(self, backlog_client):
+    async def test_create_custom_field_success(
+        self, backlog_client, mock_call_mcp, sample_custom_field
+    ):
         """Test create_custom_field creates field successfully"""
-        from src.integrations.backlog.models import CustomFieldInput
-
-        field = CustomFieldInput(
-            name="テストフィールド",
-            type_id=1,
-            description="テスト用カスタムフィールド",
-            required=True,
+        # Mock _call_mcp to return successful response
+        mock_call_mcp.return_value = {
+            "id": 123,
+            "name": "テストフィールド",
+            "typeId": 1,
+        }
+
+        result = await backlog_client.create_custom_field(
+            "TEST_PROJECT", sample_custom_field
         )
 
-        # Mock _call_mcp to return successful response
-        with patch.object(
-            backlog_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {
-                "id": 123,
-                "name": "テストフィールド",
-                "typeId": 1,
-            }
-
-            result = await backlog_client.create_custom_field("TEST_PROJECT", field)
-
-            # Verify call was made with correct parameters
-            mock_call.assert_called_once()
-            call_args = mock_call.call_args
-            assert call_args[0][0] == "POST"
-            assert "customFields" in call_args[0][1]
-            assert call_args[1]["data"]["name"] == "テストフィールド"
-            assert call_args[1]["data"]["typeId"] == 1
-            assert call_args[1]["data"]["required"] is True
-            assert call_args[1]["data"]["description"] == "テスト用カスタムフィールド"
+        # Verify call was made with correct parameters
+        mock_call_mcp.assert_called_once()
+        call_args = mock_call_mcp.call_args
+        assert call_args[0][0] == "POST"
+        assert "customFields" in call_args[0][1]
+        assert call_args[1]["data"]["name"] == "テストフィールド"
+        assert call_args[1]["data"]["typeId"] == 1
+        assert call_args[1]["data"]["required"] is True
+        assert call_args[1]["data"]["description"] == "テスト用カスタムフィールド"
 
     @pytest.mark.asyncio
     async def test_create_custom_field_with_applicable_issue_types(
-        self, backlog_client
+        self, backlog_client, mock_call_mcp, scoped_custom_field
     ):
         """Test create_custom_field with applicable issue types"""
-        from src.integrations.backlog.models import CustomFieldInput
-
-        field = CustomFieldInput(
-            name="フィールド", type_id=2, applicable_issue_types=[1, 2, 3]
-        )
+        mock_call_mcp.return_value = {"id": 456}
 
-        with patch.object(
-            backlog_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"id": 456}
+        await backlog_client.create_custom_field("PROJ", scoped_custom_field)
 
-            await backlog_client.create_custom_field("PROJ", field)
-
-            call_args = mock_call.call_args
-            assert call_args[1]["data"]["applicableIssueTypes"] == [1, 2, 3]
+        call_args = mock_call_mcp.call_args
+        assert call_args[1]["data"]["applicableIssueTypes"] == [1, 2, 3]
 
 
 class TestBacklogMCPClientConvertPriority:
     """Tests for _convert_priority method"""
 
-    def test_convert_priority_high(self, backlog_client):
-        """Test converting high priority"""
-        assert backlog_client._convert_priority("高") == 2
-
-    def test_convert_priority_medium(self, backlog_client):
-        """Test converting medium priority"""
-        assert backlog_client._convert_priority("中") == 3
-
-    def test_convert_priority_low(self, backlog_client):
-        """Test converting low priority"""
-        assert backlog_client._convert_priority("低") == 4
-
-    def test_convert_priority_none(self, backlog_client):
-        """Test converting None priority returns default"""
-        assert backlog_client._convert_priority(None) == 3
-
-    def test_convert_priority_unknown(self, backlog_client):
-        """Test converting unknown priority returns default"""
-        assert backlog_client._convert_priority("不明") == 3
+    @pytest.mark.parametrize(
+        "priority,expected",
+        [("高", 2), ("中", 3), ("低", 4), (None, 3), ("不明", 3)],
+    )
+    def test_convert_priority(self, backlog_client, priority, expected):
+        """Test priority labels map to Backlog priority IDs (default 3)"""
+        assert backlog_client._convert_priority(priority) == expected
 
 
-class TestBacklogMCPClientCallMCPRetry:
-    """Tests for _call_mcp retry logic"""
+class TestBacklogMCPClientCallMCP:
+    """Tests for _call_mcp error handling"""
 
     @pytest.mark.asyncio
-    async def test_call_mcp_retry_on_failure(self, backlog_client):
-        """Test _call_mcp retries on failure"""
-        with patch.object(backlog_client, "_call_mcp", wraps=backlog_client._call_mcp):
-            # Mock MCP to fail twice then succeed
-            call_count = 0
-
-            async def mock_mcp_failure(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                if call_count < 3:
-                    raise Exception("MCP connection failed")
-                return {}
-
-            # We can't easily test the retry logic without mocking internal MCP calls
-            # So we'll just verify the method exists and has correct signature
-            assert hasattr(backlog_client, "_call_mcp")
+    async def test_call_mcp_wraps_failure_after_retries(
+        self, backlog_client, monkeypatch
+    ):
+        """Test transport errors surface as BacklogAPIError after max retries"""
+        send = AsyncMock(side_effect=ConnectionError("connection reset"))
+        monkeypatch.setattr(backlog_client, "_send_request", send)
+        monkeypatch.setattr(backlog_client, "retry_delay", 0)
 
-    @pytest.mark.asyncio
-    async def test_call_mcp_max_retries_exceeded(self, backlog_client):
-        """Test _call_mcp raises after max retries"""
-        # This tests the error path that would be covered in integration tests
-        # For unit tests, we verify the method signature exists
-        assert backlog_client.max_retries == 3
-        assert backlog_client.retry_delay == 1.0
+        with pytest.raises(BacklogAPIError, match="connection reset"):
+            await backlog_client._call_mcp("GET", "/api/v2/issues")
+
+        assert send.call_count == backlog_client.max_retries
 
 
 class TestBacklogMCPClientCreateTasksImplementation:
     """Tests for create_tasks implementation details"""
 
     @pytest.mark.asyncio
-    async def test_create_tasks_with_task_data(self, backlog_client):
+    async def test_create_tasks_with_task_data(
+        self, backlog_client, mock_call_mcp, full_task
+    ):
         """Test create_tasks builds correct task data"""
-        from src.models.enums import CategoryEnum
-        from src.models.task import Task
-
-        tasks = [
-            Task(
-                title="タスク1",
-                description="説明1",
-                category=CategoryEnum.IMPLEMENTATION,
-                priority="高",
-                assignee="user123",
-            )
-        ]
-
-        with patch.object(
-            backlog_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"id": 1, "summary": "タスク1"}
-
-            try:
-                await backlog_client.create_tasks("PROJ", tasks)
-            except Exception:
-                pass  # May fail on conversion, but we want to verify the call was made
-
-            # Verify _call_mcp was called with task data
-            if mock_call.called:
-                call_args = mock_call.call_args
-                assert call_args[0][0] == "POST"
-                assert "/issues" in call_args[0][1]
-                task_data = call_args[1]["data"]
-                assert task_data["summary"] == "タスク1"
-                assert task_data["description"] == "説明1"
-                assert task_data["priorityId"] == 2  # "高" -> 2
+        tasks = [full_task]
+
+        mock_call_mcp.return_value = {"id": 1, "summary": "タスク1"}
+
+        try:
+            await backlog_client.create_tasks("PROJ", tasks)
+        except Exception:
+            pass  # May fail on conversion, but we want to verify the call was made
+
+        # Verify _call_mcp was called with task data
+        if mock_call_mcp.called:
+            call_args = mock_call_mcp.call_args
+            assert call_args[0][0] == "POST"
+            assert "/issues" in call_args[0][1]
+            task_data = call_args[1]["data"]
+            assert task_data["summary"] == "タスク1"
+            assert task_data["description"] == "説明1"
+            assert task_data["priorityId"] == 2  # "高" -> 2
 
     @pytest.mark.asyncio
-    async def test_create_tasks_with_optional_fields(self, backlog_client):
+    async def test_create_tasks_with_optional_fields(
+        self, backlog_client, mock_call_mcp
+    ):
         """Test create_tasks handles optional fields"""
-        from src.models.task import Task
-
         tasks = [Task(title="最小タスク")]
 
-        with patch.object(
-            backlog_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"id": 2}
+        mock_call_mcp.return_value = {"id": 2}
 
-            try:
-                await backlog_client.create_tasks("PROJ", tasks)
-            except Exception:
-                pass
+        try:
+            await backlog_client.create_tasks("PROJ", tasks)
+        except Exception:
+            pass
 
-            if mock_call.called:
-                task_data = mock_call.call_args[1]["data"]
-                assert task_data["summary"] == "最小タスク"
-                assert task_data["description"] == ""  # Default empty
+        if mock_call_mcp.called:
+            task_data = mock_call_mcp.call_args[1]["data"]
+            assert task_data["summary"] == "最小タスク"
+            assert task_data["description"] == ""  # Default empty
 
     @pytest.mark.asyncio
-    async def test_create_tasks_error_handling(self, backlog_client):
+    async def test_create_tasks_error_handling(self, backlog_client, mock_call_mcp):
         """Test create_tasks handles errors properly"""
-        from src.models.task import Task
-
         tasks = [Task(title="エラータスク")]
 
-        with patch.object(
-            backlog_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.side_effect = Exception("API Error")
+        mock_call_mcp.side_effect = BacklogAPIError("API Error")
 
-            with pytest.raises(Exception, match="API Error"):
-                await backlog_client.create_tasks("PROJ", tasks)
+        with pytest.raises(BacklogAPIError, match="API Error"):
+            await backlog_client.create_tasks("PROJ", tasks)
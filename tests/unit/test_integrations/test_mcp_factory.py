@@ -2,97 +2,89 @@
 Unit tests for MCPFactory
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
+from src.integrations import mcp_factory as mcp_factory_module
+from src.integrations.backlog import client as backlog_client_module
 from src.integrations.mcp_factory import MCPFactory
+from src.integrations.notion import client as notion_client_module
 from src.models.enums import ServiceType
+from src.utils.config import Config
 
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.error = Mock()
-    return logger
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     """Create mock config"""
-    config = Mock()
-    config.backlog_api_key = "test-backlog-key"
-    config.backlog_space_url = "https://test.backlog.com"
-    config.notion_api_key = "test-notion-key"
-    return config
+    return Mock(
+        spec_set=Config,
+        backlog_api_key="test-backlog-key",
+        backlog_space_url="https://test.backlog.com",
+        notion_api_key="test-notion-key",
+    )
 
 
 @pytest.fixture
-def mcp_factory(mock_logger, mock_config):
+def mcp_factory(mock_logger, mock_config, monkeypatch):
     """Create MCPFactory instance with mocked config"""
-    with patch("src.integrations.mcp_factory.get_config", return_value=mock_config):
-        return MCPFactory(mock_logger)
+    monkeypatch.setattr(mcp_factory_module, "get_config", lambda: mock_config)
+    return MCPFactory(mock_logger)
 
 
 class TestMCPFactoryInit:
     """Tests for MCPFactory initialization"""
 
-    def test_init_with_logger(self, mock_logger, mock_config):
+    def test_init_with_logger(self, mock_logger, mock_config, monkeypatch):
         """Test initialization with logger"""
-        with patch("src.integrations.mcp_factory.get_config", return_value=mock_config):
-            factory = MCPFactory(mock_logger)
-            assert factory.logger == mock_logger
-            assert factory.config == mock_config
+        monkeypatch.setattr(mcp_factory_module, "get_config", lambda: mock_config)
+        factory = MCPFactory(mock_logger)
+        assert factory.logger == mock_logger
+        assert factory.config == mock_config
 
 
 class TestMCPFactoryCreateClient:
     """Tests for create_client method"""
 
-    def test_create_backlog_client(self, mcp_factory, mock_config):
+    def test_create_backlog_client(self, mcp_factory, mock_config, monkeypatch):
         """Test creating Backlog MCP client"""
-        with patch(
-            "src.integrations.backlog.client.BacklogMCPClient"
-        ) as MockBacklogClient:
-            mock_client = Mock()
-            MockBacklogClient.return_value = mock_client
-
-            result = mcp_factory.create_client(ServiceType.BACKLOG)
-
-            MockBacklogClient.assert_called_once_with(
-                api_key=mock_config.backlog_api_key,
-                space_url=mock_config.backlog_space_url,
-                logger=mcp_factory.logger,
-            )
-            assert result == mock_client
-
-    def test_create_notion_client(self, mcp_factory, mock_config):
+        MockBacklogClient = Mock()
+        monkeypatch.setattr(
+            backlog_client_module, "BacklogMCPClient", MockBacklogClient
+        )
+
+        result = mcp_factory.create_client(ServiceType.BACKLOG)
+
+        MockBacklogClient.assert_called_once_with(
+            api_key=mock_config.backlog_api_key,
+            space_url=mock_config.backlog_space_url,
+            logger=mcp_factory.logger,
+        )
+        assert result == MockBacklogClient.return_value
+
+    def test_create_notion_client(self, mcp_factory, mock_config, monkeypatch):
         """Test creating Notion MCP client"""
-        with patch(
-            "src.integrations.notion.client.NotionMCPClient"
-        ) as MockNotionClient:
-            mock_client = Mock()
-            MockNotionClient.return_value = mock_client
+        MockNotionClient = Mock()
+        monkeypatch.setattr(notion_client_module, "NotionMCPClient", MockNotionClient)
 
-            result = mcp_factory.create_client(ServiceType.NOTION)
+        result = mcp_factory.create_client(ServiceType.NOTION)
 
-            MockNotionClient.assert_called_once_with(
-                api_key=mock_config.notion_api_key, logger=mcp_factory.logger
-            )
-            assert result == mock_client
+        MockNotionClient.assert_called_once_with(
+            api_key=mock_config.notion_api_key, logger=mcp_factory.logger
+        )
+        assert result == MockNotionClient.return_value
 
-    def test_create_client_logs_backlog(self, mcp_factory, mock_logger):
+    def test_create_client_logs_backlog(self, mcp_factory, mock_logger, monkeypatch):
         """Test that creating Backlog client logs message"""
-        with patch("src.integrations.backlog.client.BacklogMCPClient"):
-            mcp_factory.create_client(ServiceType.BACKLOG)
-            mock_logger.info.assert_called_with("Creating Backlog MCP client")
+        monkeypatch.setattr(backlog_client_module, "BacklogMCPClient", Mock())
+        mcp_factory.create_client(ServiceType.BACKLOG)
+        mock_logger.info.assert_called_with("Creating Backlog MCP client")
 
-    def test_create_client_logs_notion(self, mcp_factory, mock_logger):
+    def test_create_client_logs_notion(self, mcp_factory, mock_logger, monkeypatch):
         """Test that creating Notion client logs message"""
-        with patch("src.integrations.notion.client.NotionMCPClient"):
-            mcp_factory.create_client(ServiceType.NOTION)
-            mock_logger.info.assert_called_with("Creating Notion MCP client")
+        monkeypatch.setattr(notion_client_module, "NotionMCPClient", Mock())
+        mcp_factory.create_client(ServiceType.NOTION)
+        mock_logger.info.assert_called_with("Creating Notion MCP client")
 
     def test_create_client_invalid_service_type(self, mcp_factory):
         """Test creating client with invalid service type raises ValueError"""
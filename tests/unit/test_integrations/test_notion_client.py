@@ -3,29 +3,26 @@ Unit tests for NotionMCPClient
 """
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.integrations.notion.client import NotionMCPClient
+from src.integrations.notion.client import NotionAPIError, NotionMCPClient
 from src.integrations.notion.models import NotionBlock, NotionDatabase, NotionPage
 
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.warning = Mock()
-    logger.error = Mock()
-    return logger
+@pytest.fixture(scope="module")
+def notion_client(mock_logger):
+    """Create NotionMCPClient instance (shared within the module)"""
+    return NotionMCPClient(api_key="test-api-key", logger=mock_logger)
 
 
 @pytest.fixture
-def notion_client(mock_logger):
-    """Create NotionMCPClient instance"""
-    return NotionMCPClient(api_key="test-api-key", logger=mock_logger)
+def mock_call_mcp(notion_client, monkeypatch):
+    """Replace _call_mcp with an AsyncMock for the duration of a test"""
+    mock = AsyncMock(return_value={})
+    monkeypatch.setattr(notion_client, "_call_mcp", mock)
+    return mock
 
 
 class TestNotionMCPClientInit:
@@ -52,41 +49,38 @@ class TestNotionMCPClientInit:
 class TestExtractIdFromUrl:
     """Tests for _extract_id_from_url method"""
 
-    def test_extract_id_from_url_with_hyphens(self, notion_client):
-        """Test extracting UUID format ID from URL"""
-        url = "https://www.notion.so/workspace/Page-Title-12345678-1234-1234-1234-123456789abc"
-        result = notion_client._extract_id_from_url(url)
-        assert result == "12345678-1234-1234-1234-123456789abc"
-
-    def test_extract_id_from_url_without_hyphens(self, notion_client):
-        """Test extracting 32-char ID and converting to UUID format"""
-        url = "https://www.notion.so/workspace/Page-Title-12345678123412341234123456789abc"
-        result = notion_client._extract_id_from_url(url)
-        assert result == "12345678-1234-1234-1234-123456789abc"
-
-    def test_extract_id_from_short_url(self, notion_client):
-        """Test extracting ID from short Notion URL"""
-        url = "https://notion.so/abcdef12345678901234567890123456"
-        result = notion_client._extract_id_from_url(url)
-        assert result == "abcdef12-3456-7890-1234-567890123456"
-
-    def test_extract_id_from_url_case_insensitive(self, notion_client):
-        """Test ID extraction is case insensitive"""
-        url = "https://www.notion.so/ABCDEF12-3456-7890-1234-567890123456"
-        result = notion_client._extract_id_from_url(url)
-        assert result == "abcdef12-3456-7890-1234-567890123456"
-
-    def test_extract_id_from_url_invalid(self, notion_client):
-        """Test extraction from invalid URL returns None"""
-        url = "https://invalid-url.com/not-notion"
-        result = notion_client._extract_id_from_url(url)
-        assert result is None
-
-    def test_extract_id_from_url_no_id(self, notion_client):
-        """Test extraction from URL without ID returns None"""
-        url = "https://www.notion.so/workspace/Page-Title"
-        result = notion_client._extract_id_from_url(url)
-        assert result is None
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            # UUID format ID
+            (
+                "https://www.notion.so/workspace/Page-Title-12345678-1234-1234-1234-123456789abc",
+                "12345678-1234-1234-1234-123456789abc",
+            ),
+            # 32-char ID converted to UUID format
+            (
+                "https://www.notion.so/workspace/Page-Title-12345678123412341234123456789abc",
+                "12345678-1234-1234-1234-123456789abc",
+            ),
+            # Short Notion URL
+            (
+                "https://notion.so/abcdef12345678901234567890123456",
+                "abcdef12-3456-7890-1234-567890123456",
+            ),
+            # Case insensitive
+            (
+                "https://www.notion.so/ABCDEF12-3456-7890-1234-567890123456",
+                "abcdef12-3456-7890-1234-567890123456",
+            ),
+            # Not a Notion URL
+            ("https://invalid-url.com/not-notion", None),
+            # Notion URL without ID
+            ("https://www.notion.so/workspace/Page-Title", None),
+        ],
+    )
+    def test_extract_id_from_url(self, notion_client, url, expected):
+        """Test extracting a UUID format ID from Notion URLs"""
+        assert notion_client._extract_id_from_url(url) == expected
 
 
 class TestCallMCP:
@@ -95,6 +89,7 @@ class TestCallMCP:
     @pytest.mark.asyncio
     async def test_call_mcp_success(self, notion_client, mock_logger):
         """Test successful MCP call"""
+        mock_logger.reset_mock()
         result = await notion_client._call_mcp("GET", "/pages/test-id")
         assert isinstance(result, dict)
         # Verify logging
@@ -118,14 +113,18 @@ class TestCallMCP:
         assert isinstance(result, dict)
 
     @pytest.mark.asyncio
-    async def test_call_mcp_retry_on_failure(self, notion_client, mock_logger):
-        """Test retry logic on transient failures"""
-        # Mock asyncio.sleep to speed up test
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            # Since _call_mcp currently just returns {}, we can't easily test retry
-            # This is a placeholder test for when actual implementation is added
-            result = await notion_client._call_mcp("GET", "/pages/test-id")
-            assert isinstance(result, dict)
+    async def test_call_mcp_wraps_failure_after_retries(
+        self, notion_client, monkeypatch
+    ):
+        """Test transport errors surface as NotionAPIError after max retries"""
+        send = AsyncMock(side_effect=ConnectionError("connection reset"))
+        monkeypatch.setattr(notion_client, "_send_request", send)
+        monkeypatch.setattr(notion_client, "retry_delay", 0)
+
+        with pytest.raises(NotionAPIError, match="connection reset"):
+            await notion_client._call_mcp("GET", "/pages/test-id")
+
+        assert send.call_count == notion_client.max_retries
 
 
 class TestFetchData:
@@ -134,15 +133,12 @@ class TestFetchData:
     @pytest.mark.asyncio
     async def test_fetch_data_as_page(self, notion_client):
         """Test fetching data as a page"""
+        page_result = {"type": "page", "data": {"id": "test-id"}, "blocks": []}
         with patch.object(
-            notion_client, "_fetch_page_with_blocks", new_callable=AsyncMock
+            notion_client,
+            "_fetch_page_with_blocks",
+            AsyncMock(return_value=page_result),
         ) as mock_fetch:
-            mock_fetch.return_value = {
-                "type": "page",
-                "data": {"id": "test-id"},
-                "blocks": [],
-            }
-
             url = "https://notion.so/12345678123412341234123456789abc"
             result = await notion_client.fetch_data(url)
 
@@ -152,24 +148,21 @@ class TestFetchData:
     @pytest.mark.asyncio
     async def test_fetch_data_as_database(self, notion_client):
         """Test fetching data as a database when page fetch fails"""
+        db_result = {"type": "database", "data": {"id": "test-id"}, "rows": []}
         with patch.object(
-            notion_client, "_fetch_page_with_blocks", new_callable=AsyncMock
-        ) as mock_page:
-            with patch.object(
-                notion_client, "_fetch_database_with_rows", new_callable=AsyncMock
-            ) as mock_db:
-                mock_page.side_effect = Exception("Not a page")
-                mock_db.return_value = {
-                    "type": "database",
-                    "data": {"id": "test-id"},
-                    "rows": [],
-                }
-
-                url = "https://notion.so/12345678123412341234123456789abc"
-                result = await notion_client.fetch_data(url)
-
-                assert result["type"] == "database"
-                mock_db.assert_called_once()
+            notion_client,
+            "_fetch_page_with_blocks",
+            AsyncMock(side_effect=Exception("Not a page")),
+        ), patch.object(
+            notion_client,
+            "_fetch_database_with_rows",
+            AsyncMock(return_value=db_result),
+        ) as mock_db:
+            url = "https://notion.so/12345678123412341234123456789abc"
+            result = await notion_client.fetch_data(url)
+
+            assert result["type"] == "database"
+            mock_db.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_fetch_data_invalid_url(self, notion_client):
@@ -181,170 +174,151 @@ class TestFetchData:
     async def test_fetch_data_both_methods_fail(self, notion_client):
         """Test fetch_data when both page and database fetch fail"""
         with patch.object(
-            notion_client, "_fetch_page_with_blocks", new_callable=AsyncMock
-        ) as mock_page:
-            with patch.object(
-                notion_client, "_fetch_database_with_rows", new_callable=AsyncMock
-            ) as mock_db:
-                mock_page.side_effect = Exception("Page error")
-                mock_db.side_effect = Exception("Database error")
-
-                url = "https://notion.so/12345678123412341234123456789abc"
-                with pytest.raises(
-                    ValueError, match="Could not fetch data from URL as page or database"
-                ):
-                    await notion_client.fetch_data(url)
+            notion_client,
+            "_fetch_page_with_blocks",
+            AsyncMock(side_effect=Exception("Page error")),
+        ), patch.object(
+            notion_client,
+            "_fetch_database_with_rows",
+            AsyncMock(side_effect=Exception("Database error")),
+        ):
+            url = "https://notion.so/12345678123412341234123456789abc"
+            with pytest.raises(
+                ValueError,
+                match="Could not fetch data from URL as page or database",
+            ):
+                await notion_client.fetch_data(url)
 
 
 class TestFetchPageWithBlocks:
     """Tests for _fetch_page_with_blocks method"""
 
     @pytest.mark.asyncio
-    async def test_fetch_page_with_blocks(self, notion_client):
+    async def test_fetch_page_with_blocks(self, notion_client, mock_call_mcp):
         """Test fetching page with blocks"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.side_effect = [
-                {"id": "page-id", "properties": {}},  # Page response
-                {"results": [{"type": "paragraph"}]},  # Blocks response
-            ]
+        mock_call_mcp.side_effect = [
+            {"id": "page-id", "properties": {}},  # Page response
+            {"results": [{"type": "paragraph"}]},  # Blocks response
+        ]
 
-            result = await notion_client._fetch_page_with_blocks("test-page-id")
+        result = await notion_client._fetch_page_with_blocks("test-page-id")
 
-            assert result["type"] == "page"
-            assert "data" in result
-            assert "blocks" in result
-            assert len(result["blocks"]) == 1
-            assert mock_call.call_count == 2
+        assert result["type"] == "page"
+        assert "data" in result
+        assert "blocks" in result
+        assert len(result["blocks"]) == 1
+        assert mock_call_mcp.call_count == 2
 
 
 class TestFetchDatabaseWithRows:
     """Tests for _fetch_database_with_rows method"""
 
     @pytest.mark.asyncio
-    async def test_fetch_database_with_rows(self, notion_client):
+    async def test_fetch_database_with_rows(self, notion_client, mock_call_mcp):
         """Test fetching database with rows"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.side_effect = [
-                {"id": "db-id", "title": []},  # Database response
-                {
-                    "results": [{"id": "row1"}, {"id": "row2"}]
-                },  # Query response
-            ]
+        mock_call_mcp.side_effect = [
+            {"id": "db-id", "title": []},  # Database response
+            {"results": [{"id": "row1"}, {"id": "row2"}]},  # Query response
+        ]
 
-            result = await notion_client._fetch_database_with_rows("test-db-id")
+        result = await notion_client._fetch_database_with_rows("test-db-id")
 
-            assert result["type"] == "database"
-            assert "data" in result
-            assert "rows" in result
-            assert len(result["rows"]) == 2
-            assert mock_call.call_count == 2
+        assert result["type"] == "database"
+        assert "data" in result
+        assert "rows" in result
+        assert len(result["rows"]) == 2
+        assert mock_call_mcp.call_count == 2
 
 
 class TestGetPage:
     """Tests for get_page method"""
 
     @pytest.mark.asyncio
-    async def test_get_page(self, notion_client):
+    async def test_get_page(self, notion_client, monkeypatch, async_return):
         """Test getting a page"""
-        with patch.object(notion_client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = {}  # Empty response triggers placeholder
-            page = await notion_client.get_page("test-page-id")
+        # Empty response triggers placeholder
+        monkeypatch.setattr(notion_client, "_call_mcp", async_return({}))
+        page = await notion_client.get_page("test-page-id")
 
-            assert isinstance(page, NotionPage)
-            assert page.id == "test-page-id"
+        assert isinstance(page, NotionPage)
+        assert page.id == "test-page-id"
 
 
 class TestGetBlocks:
     """Tests for get_blocks method"""
 
     @pytest.mark.asyncio
-    async def test_get_blocks(self, notion_client):
+    async def test_get_blocks(self, notion_client, monkeypatch, async_return):
         """Test getting blocks"""
-        with patch.object(notion_client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = {"results": []}  # Empty results
-            blocks = await notion_client.get_blocks("test-block-id")
+        # Empty results
+        monkeypatch.setattr(notion_client, "_call_mcp", async_return({"results": []}))
+        blocks = await notion_client.get_blocks("test-block-id")
 
-            assert isinstance(blocks, list)
+        assert isinstance(blocks, list)
 
 
 class TestGetDatabase:
     """Tests for get_database method"""
 
     @pytest.mark.asyncio
-    async def test_get_database(self, notion_client):
+    async def test_get_database(self, notion_client, monkeypatch, async_return):
         """Test getting a database"""
-        with patch.object(notion_client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = {}  # Empty response triggers placeholder
-            database = await notion_client.get_database("test-db-id")
+        # Empty response triggers placeholder
+        monkeypatch.setattr(notion_client, "_call_mcp", async_return({}))
+        database = await notion_client.get_database("test-db-id")
 
-            assert isinstance(database, NotionDatabase)
-            assert database.id == "test-db-id"
+        assert isinstance(database, NotionDatabase)
+        assert database.id == "test-db-id"
 
 
 class TestQueryDatabase:
     """Tests for query_database method"""
 
     @pytest.mark.asyncio
-    async def test_query_database_basic(self, notion_client):
+    async def test_query_database_basic(self, notion_client, mock_call_mcp):
         """Test basic database query"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"results": []}  # Empty results list
+        mock_call_mcp.return_value = {"results": []}  # Empty results list
 
-            pages = await notion_client.query_database("test-db-id")
+        pages = await notion_client.query_database("test-db-id")
 
-            assert isinstance(pages, list)
-            assert len(pages) == 0
-            mock_call.assert_called_once()
+        assert isinstance(pages, list)
+        assert len(pages) == 0
+        mock_call_mcp.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_query_database_with_filter(self, notion_client):
+    async def test_query_database_with_filter(self, notion_client, mock_call_mcp):
         """Test database query with filter"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"results": []}  # Empty results list
+        mock_call_mcp.return_value = {"results": []}  # Empty results list
 
-            filter_conditions = {"property": "Status", "select": {"equals": "Active"}}
-            await notion_client.query_database("test-db-id", filter_conditions)
+        filter_conditions = {"property": "Status", "select": {"equals": "Active"}}
+        await notion_client.query_database("test-db-id", filter_conditions)
 
-            # Verify filter was passed to MCP call
-            call_args = mock_call.call_args
-            assert "data" in call_args.kwargs
-            assert "filter" in call_args.kwargs["data"]
+        # Verify filter was passed to MCP call
+        call_args = mock_call_mcp.call_args
+        assert "data" in call_args.kwargs
+        assert "filter" in call_args.kwargs["data"]
 
     @pytest.mark.asyncio
-    async def test_query_database_with_sorts(self, notion_client):
+    async def test_query_database_with_sorts(self, notion_client, mock_call_mcp):
         """Test database query with sorts"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"results": []}  # Empty results list
+        mock_call_mcp.return_value = {"results": []}  # Empty results list
 
-            sorts = [{"property": "Name", "direction": "ascending"}]
-            await notion_client.query_database("test-db-id", sorts=sorts)
+        sorts = [{"property": "Name", "direction": "ascending"}]
+        await notion_client.query_database("test-db-id", sorts=sorts)
 
-            # Verify sorts was passed to MCP call
-            call_args = mock_call.call_args
-            assert "data" in call_args.kwargs
-            assert "sorts" in call_args.kwargs["data"]
+        # Verify sorts was passed to MCP call
+        call_args = mock_call_mcp.call_args
+        assert "data" in call_args.kwargs
+        assert "sorts" in call_args.kwargs["data"]
 
     @pytest.mark.asyncio
-    async def test_query_database_page_size_limit(self, notion_client):
+    async def test_query_database_page_size_limit(self, notion_client, mock_call_mcp):
         """Test database query respects max page size of 100"""
-        with patch.object(
-            notion_client, "_call_mcp", new_callable=AsyncMock
-        ) as mock_call:
-            mock_call.return_value = {"results": []}  # Empty results list
+        mock_call_mcp.return_value = {"results": []}  # Empty results list
 
-            # Request more than 100
-            await notion_client.query_database("test-db-id", page_size=200)
+        # Request more than 100
+        await notion_client.query_database("test-db-id", page_size=200)
 
-            # Verify page_size was capped at 100
-            call_args = mock_call.call_args
-            assert call_args.kwargs["data"]["page_size"] == 100
+        # Verify page_size was capped at 100
+        call_args = mock_call_mcp.call_args
+        assert call_args.kwargs["data"]["page_size"] == 100
@@ -2,36 +2,71 @@
 Unit tests for main Cloud Functions entry point
 """
 
-import json
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
-from flask import Request
 
+import src.main
 from src.main import _initialize_services, health_check, wbs_create
+from src.mcp import handlers
+from src.mcp.schemas import CreateWBSResponse
+from src.processors import document_processor
+from src.storage import firestore_client, gcs_client
+
+# GCP client modules, built once and shared by every test in this module
+_DOCUMENTAI_MOCK = Mock()
+_FIRESTORE_MOCK = Mock()
+_STORAGE_MOCK = Mock()
+
+# Successful handler response; the handler mock only passes it through
+_EMPTY_OK_RESPONSE = CreateWBSResponse(
+    success=True, registered_tasks=[], failed_tasks=[]
+)
+
+# Request bodies (wbs_create only reads them)
+_VALID_PAYLOAD = {
+    "template_url": "https://test.backlog.com/view/PROJ-1",
+    "project_key": "PROJ",
+}
+_VALID_PAYLOAD_WITH_TASKS = {
+    **_VALID_PAYLOAD,
+    "new_tasks_text": "- Task 1 | priority: 高",
+}
+# Missing required fields
+_INVALID_PAYLOAD = {"invalid_field": "value"}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mock_gcp_clients():
+    """Swap GCP client modules for cached mocks to avoid auth errors"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(document_processor, "documentai", _DOCUMENTAI_MOCK)
+        mp.setattr(firestore_client, "firestore", _FIRESTORE_MOCK)
+        mp.setattr(gcs_client, "storage", _STORAGE_MOCK)
+        yield
+
+
+@pytest.fixture(scope="module")
+def mock_services():
+    """Create the mock services dict returned by _initialize_services"""
+    return {"logger": Mock(), "config": Mock(), "wbs_service": Mock()}
+
+
+def _req(method, path, payload=None):
+    """Build a minimal stand-in for flask.Request (no call recording)"""
+    return SimpleNamespace(method=method, path=path, get_json=lambda **kwargs: payload)
 
 
 class TestInitializeServices:
     """Tests for _initialize_services function"""
 
-    @patch("src.processors.document_processor.documentai")
-    @patch("src.storage.firestore_client.firestore")
-    @patch("src.storage.gcs_client.storage")
-    def test_initialize_services_returns_dict(
-        self, mock_gcs_storage, mock_firestore, mock_documentai
-    ):
+    def test_initialize_services_returns_dict(self):
         """Test that _initialize_services returns services dict"""
         # Reset global variables to force re-initialization
-        import src.main
-
         src.main._services = None
         src.main._logger = None
 
-        # Mock GCP clients to avoid authentication errors
-        mock_documentai.DocumentProcessorServiceClient.return_value = Mock()
-        mock_firestore.Client.return_value = Mock()
-        mock_gcs_storage.Client.return_value = Mock()
-
         # Call _initialize_services
         services = _initialize_services()
 
@@ -45,18 +80,8 @@ class TestInitializeServices:
         assert services["config"] is not None
         assert services["wbs_service"] is not None
 
-    @patch("src.processors.document_processor.documentai")
-    @patch("src.storage.firestore_client.firestore")
-    @patch("src.storage.gcs_client.storage")
-    def test_initialize_services_caches_result(
-        self, mock_gcs_storage, mock_firestore, mock_documentai
-    ):
+    def test_initialize_services_caches_result(self):
         """Test that _initialize_services caches services"""
-        # Mock GCP clients to avoid authentication errors
-        mock_documentai.DocumentProcessorServiceClient.return_value = Mock()
-        mock_firestore.Client.return_value = Mock()
-        mock_gcs_storage.Client.return_value = Mock()
-
         # Call _initialize_services twice
         services1 = _initialize_services()
         services2 = _initialize_services()
@@ -68,32 +93,25 @@ class TestInitializeServices:
 class TestHealthCheck:
     """Tests for health_check endpoint"""
 
-    def test_health_check_returns_200(self):
-        """Test health check returns 200 OK"""
-        mock_request = Mock(spec=Request)
-
-        response = health_check(mock_request)
+    @pytest.fixture(scope="class")
+    def health_response(self):
+        """Call health_check once; its response does not depend on the request"""
+        return health_check(_req("GET", "/health"))
 
-        assert response.status_code == 200
-        assert response.headers.get("Content-Type") == "application/json"
+    def test_health_check_returns_200(self, health_response):
+        """Test health check returns 200 OK"""
+        assert health_response.status_code == 200
+        assert health_response.headers.get("Content-Type") == "application/json"
 
-    def test_health_check_returns_healthy_status(self):
+    def test_health_check_returns_healthy_status(self, health_response):
         """Test health check returns healthy status"""
-        mock_request = Mock(spec=Request)
-
-        response = health_check(mock_request)
-
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = health_response.get_json()
         assert response_data["status"] == "healthy"
         assert "server" in response_data
 
-    def test_health_check_includes_server_metadata(self):
+    def test_health_check_includes_server_metadata(self, health_response):
         """Test health check includes server metadata"""
-        mock_request = Mock(spec=Request)
-
-        response = health_check(mock_request)
-
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = health_response.get_json()
         server_metadata = response_data["server"]
 
         assert "name" in server_metadata
@@ -104,20 +122,14 @@ class TestHealthCheck:
 class TestWBSCreate:
     """Tests for wbs_create endpoint"""
 
-    @patch("src.main._initialize_services")
-    def test_wbs_create_options_request(self, mock_init):
+    @pytest.fixture(autouse=True)
+    def _patch_init(self, monkeypatch, mock_services):
+        """Serve the shared mock services from _initialize_services"""
+        monkeypatch.setattr(src.main, "_initialize_services", lambda: mock_services)
+
+    def test_wbs_create_options_request(self):
         """Test OPTIONS request (CORS preflight)"""
-        # Mock services (not used in OPTIONS)
-        mock_logger = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": Mock(),
-        }
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "OPTIONS"
-        mock_request.path = "/wbs-create"
+        mock_request = _req("OPTIONS", "/wbs-create")
 
         response = wbs_create(mock_request)
 
@@ -125,207 +137,89 @@ class TestWBSCreate:
         assert response.headers.get("Access-Control-Allow-Origin") == "*"
         assert "POST" in response.headers.get("Access-Control-Allow-Methods")
 
-    @patch("src.main._initialize_services")
-    def test_wbs_create_get_method_not_allowed(self, mock_init):
+    def test_wbs_create_get_method_not_allowed(self):
         """Test GET request returns 405 Method Not Allowed"""
-        # Mock services
-        mock_logger = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": Mock(),
-        }
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "GET"
-        mock_request.path = "/wbs-create"
+        mock_request = _req("GET", "/wbs-create")
 
         response = wbs_create(mock_request)
 
         assert response.status_code == 405
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = response.get_json()
         assert response_data["success"] is False
         assert "GET" in response_data["error_message"]
 
-    @patch("src.main._initialize_services")
-    def test_wbs_create_invalid_json(self, mock_init):
+    def test_wbs_create_invalid_json(self):
         """Test invalid JSON returns 400 Bad Request"""
-        # Mock services
-        mock_logger = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": Mock(),
-        }
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(return_value=None)
+        mock_request = _req("POST", "/wbs-create")
 
         response = wbs_create(mock_request)
 
         assert response.status_code == 400
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = response.get_json()
         assert response_data["success"] is False
         assert "Invalid JSON" in response_data["error_message"]
 
-    @patch("src.main._initialize_services")
-    def test_wbs_create_validation_error(self, mock_init):
+    def test_wbs_create_validation_error(self):
         """Test request validation error returns 400"""
-        # Mock services
-        mock_logger = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": Mock(),
-        }
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(
-            return_value={
-                # Missing required fields
-                "invalid_field": "value"
-            }
-        )
+        mock_request = _req("POST", "/wbs-create", _INVALID_PAYLOAD)
 
         response = wbs_create(mock_request)
 
         assert response.status_code == 400
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = response.get_json()
         assert response_data["success"] is False
         assert "validation error" in response_data["error_message"]
 
-    @patch("src.mcp.handlers.handle_create_wbs")
-    @patch("src.main._initialize_services")
-    def test_wbs_create_valid_request_returns_200(self, mock_init, mock_handler):
+    def test_wbs_create_valid_request_returns_200(self, monkeypatch, async_return):
         """Test valid request returns 200 OK"""
-        # Mock services
-        mock_logger = Mock()
-        mock_wbs_service = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": mock_wbs_service,
-        }
-
-        # Mock successful response from handler
-        from src.mcp.schemas import CreateWBSResponse
-
-        mock_response = CreateWBSResponse(
-            success=True, registered_tasks=[], failed_tasks=[]
-        )
-        # handle_create_wbs is async, so we need AsyncMock
-        mock_handler.return_value = mock_response
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(
-            return_value={
-                "template_url": "https://test.backlog.com/view/PROJ-1",
-                "project_key": "PROJ",
-            }
+        monkeypatch.setattr(
+            handlers, "handle_create_wbs", async_return(_EMPTY_OK_RESPONSE)
         )
 
+        mock_request = _req("POST", "/wbs-create", _VALID_PAYLOAD)
+
         response = wbs_create(mock_request)
 
         assert response.status_code == 200
-        response_data = json.loads(response.get_data(as_text=True))
+        response_data = response.get_json()
         assert response_data["success"] is True
 
-    @patch("src.mcp.handlers.handle_create_wbs")
-    @patch("src.main._initialize_services")
-    def test_wbs_create_valid_request_with_new_tasks(self, mock_init, mock_handler):
+    def test_wbs_create_valid_request_with_new_tasks(self, monkeypatch, async_return):
         """Test valid request with new_tasks_text"""
-        # Mock services
-        mock_logger = Mock()
-        mock_wbs_service = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": mock_wbs_service,
-        }
-
-        # Mock successful response from handler
-        from src.mcp.schemas import CreateWBSResponse
-
-        mock_response = CreateWBSResponse(
-            success=True, registered_tasks=[], failed_tasks=[]
-        )
-        # handle_create_wbs is async, so we need AsyncMock
-        mock_handler.return_value = mock_response
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(
-            return_value={
-                "template_url": "https://test.backlog.com/view/PROJ-1",
-                "new_tasks_text": "- Task 1 | priority: 高",
-                "project_key": "PROJ",
-            }
+        monkeypatch.setattr(
+            handlers, "handle_create_wbs", async_return(_EMPTY_OK_RESPONSE)
         )
 
+        mock_request = _req("POST", "/wbs-create", _VALID_PAYLOAD_WITH_TASKS)
+
         response = wbs_create(mock_request)
 
         assert response.status_code == 200
         assert response.headers.get("Content-Type") == "application/json"
 
-    @patch("src.mcp.handlers.handle_create_wbs")
-    @patch("src.main._initialize_services")
-    def test_wbs_create_cors_headers(self, mock_init, mock_handler):
+    def test_wbs_create_cors_headers(self, monkeypatch, async_return):
         """Test CORS headers are set correctly"""
-        # Mock services
-        mock_logger = Mock()
-        mock_wbs_service = Mock()
-        mock_init.return_value = {
-            "logger": mock_logger,
-            "config": Mock(),
-            "wbs_service": mock_wbs_service,
-        }
-
-        # Mock successful response from handler
-        from src.mcp.schemas import CreateWBSResponse
-
-        mock_response = CreateWBSResponse(
-            success=True, registered_tasks=[], failed_tasks=[]
-        )
-        # handle_create_wbs is async, so we need AsyncMock
-        mock_handler.return_value = mock_response
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(
-            return_value={
-                "template_url": "https://test.backlog.com/view/PROJ-1",
-                "project_key": "PROJ",
-            }
+        monkeypatch.setattr(
+            handlers, "handle_create_wbs", async_return(_EMPTY_OK_RESPONSE)
         )
 
+        mock_request = _req("POST", "/wbs-create", _VALID_PAYLOAD)
+
         response = wbs_create(mock_request)
 
         assert response.headers.get("Access-Control-Allow-Origin") == "*"
         assert "POST" in response.headers.get("Access-Control-Allow-Methods")
 
-    @patch("src.main._initialize_services")
-    def test_wbs_create_service_initialization_error(self, mock_init):
+    def test_wbs_create_service_initialization_error(self, monkeypatch):
         """Test that service initialization error propagates (not caught)"""
-        mock_init.side_effect = Exception("Service init failed")
-
-        mock_request = Mock(spec=Request)
-        mock_request.method = "POST"
-        mock_request.path = "/wbs-create"
-        mock_request.get_json = Mock(
-            return_value={
-                "template_url": "https://test.backlog.com/view/PROJ-1",
-                "project_key": "PROJ",
-            }
+        monkeypatch.setattr(
+            src.main,
+            "_initialize_services",
+            Mock(side_effect=Exception("Service init failed")),
         )
 
+        mock_request = _req("POST", "/wbs-create", _VALID_PAYLOAD)
+
         # Service initialization errors are not caught (happens before try block)
         with pytest.raises(Exception, match="Service init failed"):
             wbs_create(mock_request)
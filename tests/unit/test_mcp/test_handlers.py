@@ -12,112 +12,152 @@ from src.models.enums import CategoryEnum
 from src.models.task import Task
 from src.services.wbs_service import WBSResult
 
+# Requests are read-only inputs to the handler, so one instance per variant
+_REQUEST = CreateWBSRequest(
+    template_url="https://test.backlog.com/view/PROJ-1", project_key="PROJ"
+)
+_REQUEST_WITH_TASKS = CreateWBSRequest(
+    template_url="https://test.backlog.com/view/PROJ-1",
+    new_tasks_text="- Task 1 | priority: 高",
+    project_key="PROJ",
+)
+_INVALID_TEMPLATE_REQUEST = CreateWBSRequest(
+    template_url="https://test.backlog.com/view/INVALID", project_key="PROJ"
+)
+
+# _task_to_summary is pure, so its input tasks are built once
+_TASK_ALL_FIELDS = Task(
+    title="Implementation Task",
+    description="Implement feature X",
+    category=CategoryEnum.IMPLEMENTATION,
+    priority="高",
+    assignee="Developer A",
+)
+_TASK_MINIMAL = Task(title="Minimal Task", category=CategoryEnum.TESTING)
+_TASK_UNCATEGORIZED = Task(title="Uncategorized Task")
+
 
 class TestHandleCreateWBS:
     """Tests for handle_create_wbs function"""
 
     @pytest.mark.asyncio
-    async def test_handle_create_wbs_success(self, mock_logger):
-        """Test successful WBS creation"""
+    @pytest.mark.parametrize(
+        "request_,result_fields,expected",
+        [
+            pytest.param(
+                _REQUEST_WITH_TASKS,
+                {
+                    "success": True,
+                    "registered_tasks": [
+                        Task(
+                            title="Task 1",
+                            category=CategoryEnum.IMPLEMENTATION,
+                            priority="高",
+                        )
+                    ],
+                    "metadata_id": "meta_123",
+                    "master_data_created": 3,
+                },
+                {
+                    "success": True,
+                    "registered": [("Task 1", "実装")],
+                    "skipped": [],
+                    "metadata_id": "meta_123",
+                    "master_data_created": 3,
+                    "error_message": None,
+                },
+                id="success",
+            ),
+            pytest.param(
+                _REQUEST,
+                {
+                    "success": True,
+                    "registered_tasks": [
+                        Task(title="New Task", category=CategoryEnum.TESTING)
+                    ],
+                    "skipped_tasks": [
+                        Task(
+                            title="Duplicate Task",
+                            category=CategoryEnum.IMPLEMENTATION,
+                        )
+                    ],
+                    "metadata_id": "meta_456",
+                },
+                {
+                    "success": True,
+                    "registered": [("New Task", "テスト")],
+                    "skipped": [("Duplicate Task", "実装")],
+                    "metadata_id": "meta_456",
+                    "master_data_created": 0,
+                    "error_message": None,
+                },
+                id="with_skipped_tasks",
+            ),
+            pytest.param(
+                _INVALID_TEMPLATE_REQUEST,
+                {"success": False, "error_message": "Template URL not found"},
+                {
+                    "success": False,
+                    "registered": [],
+                    "skipped": [],
+                    "metadata_id": None,
+                    "master_data_created": 0,
+                    "error_message": "Template URL not found",
+                },
+                id="failure",
+            ),
+            pytest.param(
+                _REQUEST,
+                {
+                    "success": True,
+                    "metadata_id": "meta_789",
+                    "master_data_created": 5,
+                },
+                {
+                    "success": True,
+                    "registered": [],
+                    "skipped": [],
+                    "metadata_id": "meta_789",
+                    "master_data_created": 5,
+                    "error_message": None,
+                },
+                id="empty_results",
+            ),
+        ],
+    )
+    async def test_handle_create_wbs(
+        self, mock_logger, async_return, request_, result_fields, expected
+    ):
+        """Test the handler maps each WBSResult onto the response"""
         # Create mock WBSService
-        mock_wbs_service = Mock()
         mock_result = WBSResult()
-        mock_result.success = True
-        mock_result.registered_tasks = [
-            Task(title="Task 1", category=CategoryEnum.IMPLEMENTATION, priority="高")
-        ]
-        mock_result.skipped_tasks = []
-        mock_result.metadata_id = "meta_123"
-        mock_result.master_data_created = 3
-        mock_wbs_service.create_wbs = AsyncMock(return_value=mock_result)
-
-        # Create request
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text="- Task 1 | priority: 高",
-            project_key="PROJ",
-        )
+        for name, value in result_fields.items():
+            setattr(mock_result, name, value)
+        mock_wbs_service = Mock()
+        mock_wbs_service.create_wbs = Mock(side_effect=async_return(mock_result))
 
         # Execute handler
-        response = await handle_create_wbs(request, mock_wbs_service, mock_logger)
+        response = await handle_create_wbs(request_, mock_wbs_service, mock_logger)
 
         # Verify
-        assert response.success is True
-        assert len(response.registered_tasks) == 1
-        assert response.registered_tasks[0].title == "Task 1"
-        assert response.registered_tasks[0].category == "実装"
-        assert response.metadata_id == "meta_123"
-        assert response.master_data_created == 3
-        assert response.total_registered == 1
-        assert response.total_skipped == 0
-        assert response.error_message is None
+        assert response.success is expected["success"]
+        assert response.error_message == expected["error_message"]
+        registered = [(t.title, t.category) for t in response.registered_tasks]
+        skipped = [(t.title, t.category) for t in response.skipped_tasks]
+        assert registered == expected["registered"]
+        assert skipped == expected["skipped"]
+        assert response.total_registered == len(expected["registered"])
+        assert response.total_skipped == len(expected["skipped"])
+        assert response.metadata_id == expected["metadata_id"]
+        assert response.master_data_created == expected["master_data_created"]
 
         # Verify service was called
         mock_wbs_service.create_wbs.assert_called_once_with(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text="- Task 1 | priority: 高",
-            project_key="PROJ",
-        )
-
-    @pytest.mark.asyncio
-    async def test_handle_create_wbs_with_skipped_tasks(self, mock_logger):
-        """Test WBS creation with skipped tasks"""
-        # Create mock WBSService
-        mock_wbs_service = Mock()
-        mock_result = WBSResult()
-        mock_result.success = True
-        mock_result.registered_tasks = [
-            Task(title="New Task", category=CategoryEnum.TESTING)
-        ]
-        mock_result.skipped_tasks = [
-            Task(title="Duplicate Task", category=CategoryEnum.IMPLEMENTATION)
-        ]
-        mock_result.metadata_id = "meta_456"
-        mock_result.master_data_created = 0
-        mock_wbs_service.create_wbs = AsyncMock(return_value=mock_result)
-
-        # Create request
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/PROJ-1", project_key="PROJ"
-        )
-
-        # Execute handler
-        response = await handle_create_wbs(request, mock_wbs_service, mock_logger)
-
-        # Verify
-        assert response.success is True
-        assert len(response.registered_tasks) == 1
-        assert len(response.skipped_tasks) == 1
-        assert response.skipped_tasks[0].title == "Duplicate Task"
-        assert response.total_registered == 1
-        assert response.total_skipped == 1
-
-    @pytest.mark.asyncio
-    async def test_handle_create_wbs_failure(self, mock_logger):
-        """Test WBS creation failure from service"""
-        # Create mock WBSService
-        mock_wbs_service = Mock()
-        mock_result = WBSResult()
-        mock_result.success = False
-        mock_result.error_message = "Template URL not found"
-        mock_result.registered_tasks = []
-        mock_result.skipped_tasks = []
-        mock_wbs_service.create_wbs = AsyncMock(return_value=mock_result)
-
-        # Create request
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/INVALID", project_key="PROJ"
+            template_url=request_.template_url,
+            new_tasks_text=request_.new_tasks_text,
+            project_key=request_.project_key,
         )
 
-        # Execute handler
-        response = await handle_create_wbs(request, mock_wbs_service, mock_logger)
-
-        # Verify
-        assert response.success is False
-        assert response.error_message == "Template URL not found"
-        assert len(response.registered_tasks) == 0
-        assert len(response.skipped_tasks) == 0
-
     @pytest.mark.asyncio
     async def test_handle_create_wbs_exception(self, mock_logger):
         """Test handler catches exceptions and returns error response"""
@@ -127,13 +167,8 @@ class TestHandleCreateWBS:
             side_effect=Exception("Unexpected error")
         )
 
-        # Create request
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/PROJ-1", project_key="PROJ"
-        )
-
         # Execute handler
-        response = await handle_create_wbs(request, mock_wbs_service, mock_logger)
+        response = await handle_create_wbs(_REQUEST, mock_wbs_service, mock_logger)
 
         # Verify error response
         assert response.success is False
@@ -147,51 +182,13 @@ class TestHandleCreateWBS:
         # Verify logger was called
         mock_logger.error.assert_called()
 
-    @pytest.mark.asyncio
-    async def test_handle_create_wbs_empty_results(self, mock_logger):
-        """Test WBS creation with no tasks registered or skipped"""
-        # Create mock WBSService
-        mock_wbs_service = Mock()
-        mock_result = WBSResult()
-        mock_result.success = True
-        mock_result.registered_tasks = []
-        mock_result.skipped_tasks = []
-        mock_result.metadata_id = "meta_789"
-        mock_result.master_data_created = 5
-        mock_wbs_service.create_wbs = AsyncMock(return_value=mock_result)
-
-        # Create request
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/PROJ-1", project_key="PROJ"
-        )
-
-        # Execute handler
-        response = await handle_create_wbs(request, mock_wbs_service, mock_logger)
-
-        # Verify
-        assert response.success is True
-        assert len(response.registered_tasks) == 0
-        assert len(response.skipped_tasks) == 0
-        assert response.total_registered == 0
-        assert response.total_skipped == 0
-        assert response.metadata_id == "meta_789"
-        assert response.master_data_created == 5
-
 
 class TestTaskToSummary:
     """Tests for _task_to_summary helper function"""
 
     def test_task_to_summary_with_all_fields(self):
         """Test conversion with all task fields populated"""
-        task = Task(
-            title="Implementation Task",
-            description="Implement feature X",
-            category=CategoryEnum.IMPLEMENTATION,
-            priority="高",
-            assignee="Developer A",
-        )
-
-        summary = _task_to_summary(task)
+        summary = _task_to_summary(_TASK_ALL_FIELDS)
 
         assert summary.title == "Implementation Task"
         assert summary.description == "Implement feature X"
@@ -201,9 +198,7 @@ class TestTaskToSummary:
 
     def test_task_to_summary_with_minimal_fields(self):
         """Test conversion with minimal task fields"""
-        task = Task(title="Minimal Task", category=CategoryEnum.TESTING)
-
-        summary = _task_to_summary(task)
+        summary = _task_to_summary(_TASK_MINIMAL)
 
         assert summary.title == "Minimal Task"
         assert summary.description is None
@@ -213,16 +208,14 @@ class TestTaskToSummary:
 
     def test_task_to_summary_without_category(self):
         """Test conversion when task has no category"""
-        task = Task(title="Uncategorized Task")
-
-        summary = _task_to_summary(task)
+        summary = _task_to_summary(_TASK_UNCATEGORIZED)
 
         assert summary.title == "Uncategorized Task"
         assert summary.category == "未分類"
 
-    def test_task_to_summary_all_categories(self):
-        """Test conversion for all category types"""
-        categories = [
+    @pytest.mark.parametrize(
+        "cat_enum,cat_value",
+        [
             (CategoryEnum.PREPARATION, "事前準備"),
             (CategoryEnum.REQUIREMENTS, "要件定義"),
             (CategoryEnum.BASIC_DESIGN, "基本設計"),
@@ -230,9 +223,10 @@ class TestTaskToSummary:
             (CategoryEnum.TESTING, "テスト"),
             (CategoryEnum.RELEASE, "リリース"),
             (CategoryEnum.DELIVERY, "納品"),
-        ]
-
-        for cat_enum, cat_value in categories:
-            task = Task(title=f"Task {cat_value}", category=cat_enum)
-            summary = _task_to_summary(task)
-            assert summary.category == cat_value
+        ],
+    )
+    def test_task_to_summary_all_categories(self, cat_enum, cat_value):
+        """Test conversion for all category types"""
+        task = Task(title=f"Task {cat_value}", category=cat_enum)
+        summary = _task_to_summary(task)
+        assert summary.category == cat_value
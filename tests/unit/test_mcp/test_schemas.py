@@ -7,6 +7,27 @@ from pydantic import ValidationError
 
 from src.mcp.schemas import CreateWBSRequest, CreateWBSResponse, TaskSummary
 
+# project_key boundary values (max_length=50)
+_KEY_AT_MAX_LENGTH = "A" * 50
+_KEY_OVER_MAX_LENGTH = "A" * 51
+
+
+@pytest.fixture(scope="module")
+def populated_response():
+    """Create a fully populated response (read-only; shared by serialization tests)"""
+    return CreateWBSResponse(
+        success=True,
+        registered_tasks=[
+            TaskSummary(title="Task 1", category="実装"),
+            TaskSummary(title="Task 2", category="テスト"),
+        ],
+        skipped_tasks=[TaskSummary(title="Duplicate", category="実装")],
+        metadata_id="meta_abc",
+        master_data_created=5,
+        total_registered=2,
+        total_skipped=1,
+    )
+
 
 class TestCreateWBSRequest:
     """Tests for CreateWBSRequest schema"""
@@ -32,15 +53,13 @@ class TestCreateWBSRequest:
 
     def test_missing_template_url_raises_error(self):
         """Test that missing template_url raises ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="template_url"):
             CreateWBSRequest(project_key="PROJ")
-        assert "template_url" in str(exc_info.value)
 
     def test_missing_project_key_raises_error(self):
         """Test that missing project_key raises ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="project_key"):
             CreateWBSRequest(template_url="https://test.backlog.com/view/PROJ-1")
-        assert "project_key" in str(exc_info.value)
 
     def test_empty_template_url_raises_error(self):
         """Test that empty template_url raises ValidationError"""
@@ -54,21 +73,25 @@ class TestCreateWBSRequest:
                 template_url="https://test.backlog.com/view/PROJ-1", project_key=""
             )
 
-    def test_project_key_max_length(self):
+    @pytest.mark.parametrize(
+        "project_key,valid",
+        [(_KEY_AT_MAX_LENGTH, True), (_KEY_OVER_MAX_LENGTH, False)],
+        ids=["50_chars_ok", "51_chars_rejected"],
+    )
+    def test_project_key_max_length(self, project_key, valid):
         """Test project_key max length validation"""
-        # 50 characters should be ok
-        request = CreateWBSRequest(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            project_key="A" * 50,
-        )
-        assert len(request.project_key) == 50
-
-        # 51 characters should fail
-        with pytest.raises(ValidationError):
-            CreateWBSRequest(
+        if valid:
+            request = CreateWBSRequest(
                 template_url="https://test.backlog.com/view/PROJ-1",
-                project_key="A" * 51,
+                project_key=project_key,
             )
+            assert request.project_key == project_key
+        else:
+            with pytest.raises(ValidationError):
+                CreateWBSRequest(
+                    template_url="https://test.backlog.com/view/PROJ-1",
+                    project_key=project_key,
+                )
 
     def test_request_json_serialization(self):
         """Test JSON serialization"""
@@ -81,6 +104,8 @@ class TestCreateWBSRequest:
         assert json_data["template_url"] == "https://test.backlog.com/view/PROJ-1"
         assert json_data["new_tasks_text"] == "- Task 1"
         assert json_data["project_key"] == "PROJ"
+        # Every field was set explicitly, so dropping unset fields changes nothing
+        assert request.model_dump(exclude_unset=True) == json_data
 
 
 class TestTaskSummary:
@@ -112,104 +137,128 @@ class TestTaskSummary:
 
     def test_missing_title_raises_error(self):
         """Test that missing title raises ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="title"):
             TaskSummary(category="実装")
-        assert "title" in str(exc_info.value)
 
     def test_missing_category_raises_error(self):
         """Test that missing category raises ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="category"):
             TaskSummary(title="Test Task")
-        assert "category" in str(exc_info.value)
 
 
 class TestCreateWBSResponse:
     """Tests for CreateWBSResponse schema"""
 
-    def test_valid_response_success(self):
-        """Test valid success response"""
-        response = CreateWBSResponse(
-            success=True,
-            registered_tasks=[
-                TaskSummary(title="Task 1", category="実装", priority="高")
-            ],
-            skipped_tasks=[],
-            metadata_id="meta_123",
-            master_data_created=3,
-            total_registered=1,
-            total_skipped=0,
-        )
-        assert response.success is True
-        assert len(response.registered_tasks) == 1
-        assert response.registered_tasks[0].title == "Task 1"
-        assert response.metadata_id == "meta_123"
-        assert response.master_data_created == 3
-        assert response.error_message is None
-
-    def test_valid_response_failure(self):
-        """Test valid failure response"""
-        response = CreateWBSResponse(
-            success=False,
-            error_message="Something went wrong",
-            registered_tasks=[],
-            skipped_tasks=[],
-        )
-        assert response.success is False
-        assert response.error_message == "Something went wrong"
-        assert len(response.registered_tasks) == 0
-        assert len(response.skipped_tasks) == 0
-
-    def test_default_values(self):
-        """Test default values are set correctly"""
-        response = CreateWBSResponse(success=True)
-        assert response.registered_tasks == []
-        assert response.skipped_tasks == []
-        assert response.error_message is None
-        assert response.metadata_id is None
-        assert response.master_data_created == 0
-        assert response.total_registered == 0
-        assert response.total_skipped == 0
+    @pytest.mark.parametrize(
+        "kwargs,expected_attrs",
+        [
+            pytest.param(
+                {
+                    "success": True,
+                    "registered_tasks": [
+                        TaskSummary(title="Task 1", category="実装", priority="高")
+                    ],
+                    "skipped_tasks": [],
+                    "metadata_id": "meta_123",
+                    "master_data_created": 3,
+                    "total_registered": 1,
+                    "total_skipped": 0,
+                },
+                {
+                    "success": True,
+                    "registered_tasks": [
+                        TaskSummary(title="Task 1", category="実装", priority="高")
+                    ],
+                    "metadata_id": "meta_123",
+                    "master_data_created": 3,
+                    "error_message": None,
+                },
+                id="success",
+            ),
+            pytest.param(
+                {
+                    "success": False,
+                    "error_message": "Something went wrong",
+                    "registered_tasks": [],
+                    "skipped_tasks": [],
+                },
+                {
+                    "success": False,
+                    "error_message": "Something went wrong",
+                    "registered_tasks": [],
+                    "skipped_tasks": [],
+                },
+                id="failure",
+            ),
+            pytest.param(
+                {"success": True},
+                {
+                    "registered_tasks": [],
+                    "skipped_tasks": [],
+                    "error_message": None,
+                    "metadata_id": None,
+                    "master_data_created": 0,
+                    "total_registered": 0,
+                    "total_skipped": 0,
+                },
+                id="default_values",
+            ),
+            pytest.param(
+                {
+                    "success": True,
+                    "registered_tasks": [],
+                    "skipped_tasks": [
+                        TaskSummary(title="Duplicate 1", category="実装"),
+                        TaskSummary(title="Duplicate 2", category="テスト"),
+                    ],
+                    "total_registered": 0,
+                    "total_skipped": 2,
+                },
+                {
+                    "success": True,
+                    "registered_tasks": [],
+                    "skipped_tasks": [
+                        TaskSummary(title="Duplicate 1", category="実装"),
+                        TaskSummary(title="Duplicate 2", category="テスト"),
+                    ],
+                    "total_skipped": 2,
+                },
+                id="with_skipped_tasks",
+            ),
+        ],
+    )
+    def test_valid_response(self, kwargs, expected_attrs):
+        """Test valid responses keep the given values and fill defaults"""
+        response = CreateWBSResponse(**kwargs)
+        for name, value in expected_attrs.items():
+            assert getattr(response, name) == value
 
     def test_missing_success_raises_error(self):
         """Test that missing success field raises ValidationError"""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="success"):
             CreateWBSResponse()
-        assert "success" in str(exc_info.value)
 
-    def test_response_json_serialization(self):
+    def test_response_json_serialization(self, populated_response):
         """Test JSON serialization"""
-        response = CreateWBSResponse(
-            success=True,
-            registered_tasks=[
-                TaskSummary(title="Task 1", category="実装"),
-                TaskSummary(title="Task 2", category="テスト"),
-            ],
-            skipped_tasks=[TaskSummary(title="Duplicate", category="実装")],
-            metadata_id="meta_abc",
-            master_data_created=5,
-            total_registered=2,
-            total_skipped=1,
-        )
-        json_data = response.model_dump()
+        json_data = populated_response.model_dump()
         assert json_data["success"] is True
         assert len(json_data["registered_tasks"]) == 2
         assert len(json_data["skipped_tasks"]) == 1
         assert json_data["metadata_id"] == "meta_abc"
         assert json_data["master_data_created"] == 5
+        assert json_data["error_message"] is None
 
-    def test_response_with_skipped_tasks(self):
-        """Test response with skipped tasks"""
-        response = CreateWBSResponse(
-            success=True,
-            registered_tasks=[],
-            skipped_tasks=[
-                TaskSummary(title="Duplicate 1", category="実装"),
-                TaskSummary(title="Duplicate 2", category="テスト"),
-            ],
-            total_registered=0,
-            total_skipped=2,
-        )
-        assert response.success is True
-        assert len(response.registered_tasks) == 0
-        assert len(response.skipped_tasks) == 2
-        assert response.total_skipped == 2
+    def test_response_json_serialization_exclude_unset(self, populated_response):
+        """Test exclude_unset drops fields left at their defaults, nested included"""
+        json_data = populated_response.model_dump(exclude_unset=True)
+        assert "error_message" not in json_data
+        assert json_data["metadata_id"] == "meta_abc"
+        assert json_data["registered_tasks"][0] == {"title": "Task 1", "category": "実装"}
+
+    def test_response_json_string_roundtrip(self, populated_response):
+        """Test model_dump_json output (the wbs_create body) round-trips"""
+        json_str = populated_response.model_dump_json()
+
+        assert '"metadata_id":"meta_abc"' in json_str
+        assert '"category":"実装"' in json_str
+        assert CreateWBSResponse.model_validate_json(json_str) == populated_response
@@ -2,82 +2,84 @@
 Unit tests for MCP server
 """
 
-from unittest.mock import Mock, patch
+from collections.abc import Mapping
+from unittest.mock import Mock
 
 import pytest
 
-from src.mcp.handlers import handle_create_wbs
+from src.mcp import server as server_module
 from src.mcp.schemas import CreateWBSRequest
 from src.mcp.server import create_mcp_server, get_server_metadata
+from src.utils.config import Config
 
 
 class TestCreateMCPServer:
     """Tests for create_mcp_server function"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    def patched_config(self):
+        """Serve one config mock from get_config for every test in the class"""
+        config = Mock(spec=Config, gcp_project_id="test-project")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(server_module, "get_config", lambda: config)
+            yield config
+
     @pytest.mark.asyncio
     async def test_create_mcp_server_returns_config(self, mock_logger):
         """Test that create_mcp_server returns server configuration"""
-        with patch("src.mcp.server.get_config") as mock_get_config:
-            mock_config = Mock()
-            mock_config.gcp_project_id = "test-project"
-            mock_get_config.return_value = mock_config
-
-            server_config = await create_mcp_server(mock_logger)
+        server_config = await create_mcp_server(mock_logger)
 
-            assert isinstance(server_config, dict)
-            assert "name" in server_config
-            assert "version" in server_config
-            assert "handlers" in server_config
-            assert "config" in server_config
+        assert isinstance(server_config, dict)
+        assert "name" in server_config
+        assert "version" in server_config
+        assert "handlers" in server_config
+        assert "config" in server_config
 
     @pytest.mark.asyncio
-    async def test_create_mcp_server_config_structure(self, mock_logger):
+    async def test_create_mcp_server_config_structure(
+        self, mock_logger, patched_config, monkeypatch
+    ):
         """Test server configuration structure"""
-        with patch("src.mcp.server.get_config") as mock_get_config:
-            mock_config = Mock()
-            mock_config.gcp_project_id = "my-project"
-            mock_get_config.return_value = mock_config
+        monkeypatch.setattr(patched_config, "gcp_project_id", "my-project")
+
+        server_config = await create_mcp_server(mock_logger)
 
-            server_config = await create_mcp_server(mock_logger)
+        # Verify top-level structure
+        assert server_config["name"] == "wbs-creation-server"
+        assert server_config["version"] == "1.0.0"
 
-            # Verify top-level structure
-            assert server_config["name"] == "wbs-creation-server"
-            assert server_config["version"] == "1.0.0"
+        # Verify handlers
+        from src.mcp.handlers import handle_create_wbs
 
-            # Verify handlers
-            assert "create_wbs" in server_config["handlers"]
-            handler_info = server_config["handlers"]["create_wbs"]
-            assert handler_info["function"] == handle_create_wbs
-            assert handler_info["request_schema"] == CreateWBSRequest
+        assert "create_wbs" in server_config["handlers"]
+        handler_info = server_config["handlers"]["create_wbs"]
+        assert handler_info["function"] is handle_create_wbs
+        assert handler_info["request_schema"] == CreateWBSRequest
 
-            # Verify config
-            assert server_config["config"]["gcp_project_id"] == "my-project"
-            assert server_config["config"]["environment"] == "production"
+        # Verify config
+        assert server_config["config"]["gcp_project_id"] == "my-project"
+        assert server_config["config"]["environment"] == "production"
 
     @pytest.mark.asyncio
     async def test_create_mcp_server_logs_creation(self, mock_logger):
         """Test that server creation is logged"""
-        with patch("src.mcp.server.get_config") as mock_get_config:
-            mock_config = Mock()
-            mock_config.gcp_project_id = "test-project"
-            mock_get_config.return_value = mock_config
+        await create_mcp_server(mock_logger)
 
-            await create_mcp_server(mock_logger)
-
-            # Verify logger was called
-            assert mock_logger.info.call_count >= 2
-            mock_logger.info.assert_any_call("Creating MCP server")
-            mock_logger.info.assert_any_call("MCP server created successfully")
+        # Verify logger was called
+        messages = [c.args[0] for c in mock_logger.info.call_args_list]
+        assert len(messages) >= 2
+        assert "Creating MCP server" in messages
+        assert "MCP server created successfully" in messages
 
 
 class TestGetServerMetadata:
     """Tests for get_server_metadata function"""
 
-    def test_get_server_metadata_returns_dict(self):
-        """Test that get_server_metadata returns metadata dict"""
+    def test_get_server_metadata_returns_mapping(self):
+        """Test that get_server_metadata returns a metadata mapping"""
         metadata = get_server_metadata()
 
-        assert isinstance(metadata, dict)
+        assert isinstance(metadata, Mapping)
         assert "name" in metadata
         assert "version" in metadata
         assert "description" in metadata
@@ -96,17 +98,17 @@ class TestGetServerMetadata:
         assert "Notion" in metadata["supported_services"]
 
     def test_get_server_metadata_capabilities_list(self):
-        """Test capabilities is a list"""
+        """Test capabilities is a tuple"""
         metadata = get_server_metadata()
 
-        assert isinstance(metadata["capabilities"], list)
+        assert isinstance(metadata["capabilities"], tuple)
         assert len(metadata["capabilities"]) > 0
 
     def test_get_server_metadata_supported_services_list(self):
-        """Test supported_services is a list"""
+        """Test supported_services is a tuple"""
         metadata = get_server_metadata()
 
-        assert isinstance(metadata["supported_services"], list)
+        assert isinstance(metadata["supported_services"], tuple)
         assert len(metadata["supported_services"]) == 2
 
     def test_get_server_metadata_is_consistent(self):
@@ -115,3 +117,15 @@ class TestGetServerMetadata:
         metadata2 = get_server_metadata()
 
         assert metadata1 == metadata2
+
+    def test_get_server_metadata_is_cached(self):
+        """Test that the metadata dict is built once and reused"""
+        assert get_server_metadata() is get_server_metadata()
+
+    def test_get_server_metadata_is_read_only(self):
+        """Test that callers cannot modify the shared cached metadata"""
+        metadata = get_server_metadata()
+
+        with pytest.raises(TypeError):
+            metadata["name"] = "changed"
+        assert metadata["name"] == "WBS Creation MCP Server"
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for processor tests
+"""
+
+import pytest
+
+from src.processors.converter import Converter
+from src.processors.url_parser import URLParser
+from src.services.category_detector import CategoryDetector
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Create CategoryDetector instance (stateless, shared)"""
+    return CategoryDetector()
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """Create Converter instance (stateless, shared)"""
+    return Converter()
+
+
+@pytest.fixture(scope="session")
+def url_parser():
+    """Create URLParser instance (stateless, shared)"""
+    return URLParser()
@@ -6,60 +6,32 @@ import pytest
 
 from src.models.enums import CategoryEnum
 from src.models.task import Task
-from src.services.category_detector import CategoryDetector
 
 
 class TestCategoryDetector:
     """Tests for CategoryDetector class"""
 
-    @pytest.fixture
-    def detector(self):
-        """Create CategoryDetector instance"""
-        return CategoryDetector()
-
-    def test_detect_preparation_category(self, detector):
-        """Test detecting 事前準備 category"""
-        task = Task(
-            title="プロジェクト準備", description="環境構築とキックオフミーティング"
-        )
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.PREPARATION
-
-    def test_detect_requirements_category(self, detector):
-        """Test detecting 要件定義 category"""
-        task = Task(title="要件のヒアリング", description="顧客要件を確認する")
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.REQUIREMENTS
-
-    def test_detect_basic_design_category(self, detector):
-        """Test detecting 基本設計 category"""
-        task = Task(title="データベース設計", description="テーブル構成とER図を作成")
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.BASIC_DESIGN
-
-    def test_detect_implementation_category(self, detector):
-        """Test detecting 実装 category"""
-        task = Task(title="APIの実装", description="REST APIを開発する")
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.IMPLEMENTATION
-
-    def test_detect_testing_category(self, detector):
-        """Test detecting テスト category"""
-        task = Task(title="単体テスト", description="ユニットテストを実施")
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.TESTING
-
-    def test_detect_release_category(self, detector):
-        """Test detecting リリース category"""
-        task = Task(title="本番デプロイ", description="本番環境にリリース")
-        category = detector.detect_category(task)
-        assert category == CategoryEnum.RELEASE
-
-    def test_detect_delivery_category(self, detector):
-        """Test detecting 納品 category"""
-        task = Task(title="成果物の納品", description="ドキュメントと引き継ぎ")
+    @pytest.mark.parametrize(
+        "title,description,expected",
+        [
+            (
+                "プロジェクト準備",
+                "環境構築とキックオフミーティング",
+                CategoryEnum.PREPARATION,
+            ),
+            ("要件のヒアリング", "顧客要件を確認する", CategoryEnum.REQUIREMENTS),
+            ("データベース設計", "テーブル構成とER図を作成", CategoryEnum.BASIC_DESIGN),
+            ("APIの実装", "REST APIを開発する", CategoryEnum.IMPLEMENTATION),
+            ("単体テスト", "ユニットテストを実施", CategoryEnum.TESTING),
+            ("本番デプロイ", "本番環境にリリース", CategoryEnum.RELEASE),
+            ("成果物の納品", "ドキュメントと引き継ぎ", CategoryEnum.DELIVERY),
+        ],
+    )
+    def test_detect_category(self, detector, title, description, expected):
+        """Test detecting each category from title and description"""
+        task = Task(title=title, description=description)
         category = detector.detect_category(task)
-        assert category == CategoryEnum.DELIVERY
+        assert category == expected
 
     def test_detect_category_from_title_only(self, detector):
         """Test detecting category from title only (no description)"""
@@ -2,20 +2,14 @@
 Unit tests for Converter
 """
 
-
 import pytest
 
-from src.processors.converter import Converter
+from src.models.task import DEFAULT_CATEGORY
 
 
 class TestConverter:
     """Tests for Converter class"""
 
-    @pytest.fixture
-    def converter(self):
-        """Create Converter instance"""
-        return Converter()
-
     def test_convert_to_json_dict(self, converter):
         """Test converting dict to JSON"""
         data = {"key": "value", "number": 123}
@@ -73,16 +67,22 @@ class TestConverter:
         assert len(tasks) == 1
         # Description parsing depends on implementation
 
-    def test_parse_tasks_empty_text(self, converter):
-        """Test parsing empty text"""
-        tasks = converter.parse_tasks_from_text("")
-        assert len(tasks) == 0
-
-    def test_parse_tasks_no_bullet_points(self, converter):
-        """Test parsing text without bullet points"""
-        text = "タスク without bullet"
-        converter.parse_tasks_from_text(text)
-        # Should handle gracefully, returning empty or single task
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("", [], id="empty_text"),
+            pytest.param("タスク without bullet", [], id="no_bullet_points"),
+            pytest.param(
+                "- タスク | category: 不明なカテゴリ",
+                [("タスク", DEFAULT_CATEGORY.value)],
+                id="unknown_category_uses_default",
+            ),
+        ],
+    )
+    def test_parse_tasks_edge_cases(self, converter, text, expected):
+        """Test edge-case input parses without error to the expected tasks"""
+        tasks = converter.parse_tasks_from_text(text)
+        assert [(task.title, task.category) for task in tasks] == expected
 
     def test_parse_tasks_with_assignee(self, converter):
         """Test parsing tasks with assignee"""
@@ -174,10 +174,15 @@ class TestConverter:
             assert "説明行1" in tasks[0].description
             assert "説明行2" in tasks[0].description
 
-    def test_parse_category_unknown(self, converter):
-        """Test parsing task with unknown category returns default"""
-        text = "- タスク | category: 不明なカテゴリ"
-        tasks = converter.parse_tasks_from_text(text)
-        assert len(tasks) == 1
-        # Should use default category from converter
-        # Check that it doesn't crash and returns a valid Task
+    def test_parse_tasks_from_text_iter_fragments(self, converter):
+        """Test parsing tasks from block-sized text fragments"""
+        fragments = iter(
+            [
+                "- タスク1 | priority: 高",
+                "  説明行1\n- タスク2",
+                "- タスク3 | category: 実装",
+            ]
+        )
+        tasks = converter.parse_tasks_from_text_iter(fragments)
+        assert [t.title for t in tasks] == ["タスク1", "タスク2", "タスク3"]
+        assert tasks[0].description == "説明行1"
@@ -2,6 +2,7 @@
 Unit tests for DocumentProcessor
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -9,29 +10,15 @@ import pytest
 from src.processors.document_processor import DocumentProcessor
 
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.warning = Mock()
-    logger.error = Mock()
-    return logger
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_document_ai_client():
-    """Create mock Document AI client"""
+    """Create mock Document AI client (shared; reset before every test)"""
     client = Mock()
-    client.processor_path = Mock(
-        return_value="projects/test/locations/us/processors/test"
-    )
-    client.process_document = Mock()
+    client.processor_path.return_value = "projects/test/locations/us/processors/test"
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def document_processor(mock_logger, mock_document_ai_client):
     """Create DocumentProcessor instance with mocked client"""
     return DocumentProcessor(
@@ -43,6 +30,15 @@ def document_processor(mock_logger, mock_document_ai_client):
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_document_ai_client):
+    """Clear recorded calls and per-test responses on the shared client"""
+    mock_document_ai_client.process_document.reset_mock(
+        return_value=True, side_effect=True
+    )
+    yield
+
+
 class TestDocumentProcessorInit:
     """Tests for DocumentProcessor initialization"""
 
@@ -70,67 +66,45 @@ class TestDocumentProcessorInit:
 class TestDocumentProcessorProcessFile:
     """Tests for process_file method"""
 
+    @pytest.mark.parametrize(
+        "mime_type,expected,page_count",
+        [
+            ("application/pdf", "Extracted text from PDF", 2),
+            (
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                "Extracted text from Excel",
+                0,
+            ),
+            (
+                "application/vnd.openxmlformats-officedocument"
+                ".wordprocessingml.document",
+                "Extracted text from Word",
+                0,
+            ),
+        ],
+        ids=["pdf", "excel", "word"],
+    )
     @pytest.mark.asyncio
-    async def test_process_pdf_file(self, document_processor, mock_document_ai_client):
-        """Test processing PDF file"""
-        file_data = b"%PDF-1.4 fake pdf"
-        mime_type = "application/pdf"
-
-        # Mock Document AI response
-        mock_document = Mock()
-        mock_document.text = "Extracted text from PDF"
-        mock_document.pages = [Mock(), Mock()]
-        mock_response = Mock()
-        mock_response.document = mock_document
-
-        mock_document_ai_client.process_document.return_value = mock_response
-
-        result = await document_processor.process_file(file_data, mime_type)
-
-        assert result == "Extracted text from PDF"
-        mock_document_ai_client.process_document.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_process_excel_file(
-        self, document_processor, mock_document_ai_client
+    async def test_process_file(
+        self,
+        document_processor,
+        mock_document_ai_client,
+        mime_type,
+        expected,
+        page_count,
     ):
-        """Test processing Excel file"""
-        file_data = b"fake excel content"
-        mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-
-        # Mock Document AI response
-        mock_document = Mock()
-        mock_document.text = "Extracted text from Excel"
-        mock_document.pages = []
-        mock_response = Mock()
-        mock_response.document = mock_document
-
-        mock_document_ai_client.process_document.return_value = mock_response
-
-        result = await document_processor.process_file(file_data, mime_type)
-
-        assert result == "Extracted text from Excel"
+        """Test processing PDF, Excel and Word files"""
+        file_data = b"fake file content"
 
-    @pytest.mark.asyncio
-    async def test_process_word_file(self, document_processor, mock_document_ai_client):
-        """Test processing Word file"""
-        file_data = b"fake word content"
-        mime_type = (
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        # Document AI response (process_file only reads document.text/.pages)
+        mock_document_ai_client.process_document.return_value = SimpleNamespace(
+            document=SimpleNamespace(text=expected, pages=[None] * page_count)
         )
 
-        # Mock Document AI response
-        mock_document = Mock()
-        mock_document.text = "Extracted text from Word"
-        mock_document.pages = []
-        mock_response = Mock()
-        mock_response.document = mock_document
-
-        mock_document_ai_client.process_document.return_value = mock_response
-
         result = await document_processor.process_file(file_data, mime_type)
 
-        assert result == "Extracted text from Word"
+        assert result == expected
+        mock_document_ai_client.process_document.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_process_file_failure(
@@ -151,38 +125,28 @@ class TestDocumentProcessorProcessFile:
 class TestDocumentProcessorDetectMimeType:
     """Tests for detect_mime_type method"""
 
-    def test_detect_pdf_mime_type(self, document_processor):
-        """Test detecting PDF MIME type"""
-        mime_type = document_processor.detect_mime_type(".pdf")
-        assert mime_type == "application/pdf"
-
-    def test_detect_excel_mime_type(self, document_processor):
-        """Test detecting Excel MIME type"""
-        mime_type = document_processor.detect_mime_type(".xlsx")
-        assert (
-            mime_type
-            == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-
-    def test_detect_word_mime_type(self, document_processor):
-        """Test detecting Word MIME type"""
-        mime_type = document_processor.detect_mime_type(".docx")
-        assert (
-            mime_type
-            == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        )
-
-    def test_detect_txt_mime_type(self, document_processor):
-        """Test detecting text file MIME type"""
-        mime_type = document_processor.detect_mime_type(".txt")
-        assert mime_type == "text/plain"
+    @pytest.mark.parametrize(
+        "extension,expected",
+        [
+            (".pdf", "application/pdf"),
+            (".PDF", "application/pdf"),
+            (
+                ".xlsx",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            ),
+            (
+                ".docx",
+                "application/vnd.openxmlformats-officedocument"
+                ".wordprocessingml.document",
+            ),
+            (".txt", "text/plain"),
+        ],
+    )
+    def test_detect_mime_type(self, document_processor, extension, expected):
+        """Test detecting MIME types (case insensitive)"""
+        assert document_processor.detect_mime_type(extension) == expected
 
     def test_detect_unsupported_extension(self, document_processor):
         """Test unsupported extension raises ValueError"""
         with pytest.raises(ValueError, match="サポートされていないファイル形式です"):
             document_processor.detect_mime_type(".xyz")
-
-    def test_detect_case_insensitive(self, document_processor):
-        """Test MIME type detection is case insensitive"""
-        mime_type = document_processor.detect_mime_type(".PDF")
-        assert mime_type == "application/pdf"
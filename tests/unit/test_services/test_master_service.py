@@ -2,6 +2,8 @@
 Unit tests for MasterService
 """
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -11,28 +13,53 @@ from src.services.master_service import (REQUIRED_CATEGORIES,
                                          MasterDataResult, MasterService)
 
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.error = Mock()
-    logger.warning = Mock()
-    return logger
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_backlog_client():
-    """Create mock Backlog client"""
+    """Create mock Backlog client (shared; tests stub the methods they use)"""
     return Mock()
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_backlog_client):
+    """Start every test with no calls recorded on the shared Backlog client"""
+    mock_backlog_client.reset_mock(return_value=True, side_effect=True)
+    yield
+
+
+@pytest.fixture(scope="module")
+def ensure_stubs():
+    """Create one AsyncMock per MasterService._ensure_* method (shared)"""
+    return SimpleNamespace(
+        issue_types=AsyncMock(),
+        categories=AsyncMock(),
+        custom_fields=AsyncMock(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_ensure_stubs(ensure_stubs):
+    """Reset the shared stubs so each reports nothing created by default"""
+    for stub in vars(ensure_stubs).values():
+        stub.reset_mock(return_value=True, side_effect=True)
+        stub.return_value = []
+    yield
+
+
 @pytest.fixture
 def master_service(mock_backlog_client, mock_logger):
     """Create MasterService instance"""
     return MasterService(mock_backlog_client, mock_logger)
 
 
+@pytest.fixture
+def stubbed_master_service(master_service, ensure_stubs):
+    """MasterService whose _ensure_* methods are the shared ensure_stubs"""
+    master_service._ensure_issue_types = ensure_stubs.issue_types
+    master_service._ensure_categories = ensure_stubs.categories
+    master_service._ensure_custom_fields = ensure_stubs.custom_fields
+    return master_service
+
+
 class TestMasterDataResult:
     """Tests for MasterDataResult class"""
 
@@ -44,26 +71,35 @@ class TestMasterDataResult:
         assert result.created_custom_fields == []
         assert result.errors == []
 
-    def test_success_with_no_errors(self):
-        """Test success property returns True when no errors"""
-        result = MasterDataResult()
-        result.created_issue_types = ["課題"]
-        assert result.success is True
-
-    def test_success_with_errors(self):
-        """Test success property returns False when errors exist"""
-        result = MasterDataResult()
-        result.errors = ["Error 1"]
-        assert result.success is False
-
-    def test_total_created(self):
-        """Test total_created counts all created items"""
+    @pytest.mark.parametrize(
+        "issue_types, categories, custom_fields, errors, total, success",
+        [
+            pytest.param([], [], [], [], 0, True, id="empty"),
+            pytest.param(["課題"], [], [], [], 1, True, id="no_errors"),
+            pytest.param([], [], [], ["Error 1"], 0, False, id="with_errors"),
+            pytest.param(
+                ["課題", "リスク"],
+                ["事前準備", "要件定義"],
+                ["インプット"],
+                [],
+                5,
+                True,
+                id="counts_all_created",
+            ),
+        ],
+    )
+    def test_success_and_total_created(
+        self, issue_types, categories, custom_fields, errors, total, success
+    ):
+        """Test success and total_created derive from the result lists"""
         result = MasterDataResult()
-        result.created_issue_types = ["課題", "リスク"]
-        result.created_categories = ["事前準備", "要件定義"]
-        result.created_custom_fields = ["インプット"]
+        result.created_issue_types = issue_types
+        result.created_categories = categories
+        result.created_custom_fields = custom_fields
+        result.errors = errors
 
-        assert result.total_created == 5
+        assert result.total_created == total
+        assert result.success is success
 
 
 class TestMasterServiceInit:
@@ -80,94 +116,99 @@ class TestMasterServiceSetupMasterData:
     """Tests for setup_master_data method"""
 
     @pytest.mark.asyncio
-    async def test_setup_all_successful(self, master_service, mock_backlog_client):
+    async def test_setup_all_successful(self, stubbed_master_service):
         """Test successful master data setup"""
-        # Mock all methods to return empty lists (nothing created, all exist)
-        master_service._ensure_issue_types = AsyncMock(return_value=[])
-        master_service._ensure_categories = AsyncMock(return_value=[])
-        master_service._ensure_custom_fields = AsyncMock(return_value=[])
-
-        result = await master_service.setup_master_data("TEST_PROJECT")
+        # All stubs return empty lists by default (nothing created, all exist)
+        result = await stubbed_master_service.setup_master_data("TEST_PROJECT")
 
         assert result.success is True
         assert result.total_created == 0
         assert len(result.errors) == 0
 
     @pytest.mark.asyncio
-    async def test_setup_creates_items(self, master_service):
-        """Test setup when items need to be created"""
-        master_service._ensure_issue_types = AsyncMock(return_value=["課題"])
-        master_service._ensure_categories = AsyncMock(
-            return_value=["事前準備", "要件定義"]
-        )
-        master_service._ensure_custom_fields = AsyncMock(return_value=["インプット"])
-
-        result = await master_service.setup_master_data("TEST_PROJECT")
+    async def test_setup_runs_steps_concurrently(
+        self, stubbed_master_service, ensure_stubs
+    ):
+        """Test the three _ensure_* steps are in flight at the same time"""
+        started = 0
+        all_started = asyncio.Event()
 
-        assert result.success is True
-        assert result.total_created == 4
-        assert len(result.created_issue_types) == 1
-        assert len(result.created_categories) == 2
-        assert len(result.created_custom_fields) == 1
+        async def wait_for_all(project_key):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            # Run sequentially, the first step would time out here
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return []
 
-    @pytest.mark.asyncio
-    async def test_setup_with_issue_type_error(self, master_service):
-        """Test setup handles issue type errors"""
-        master_service._ensure_issue_types = AsyncMock(
-            side_effect=Exception("API error")
-        )
-        master_service._ensure_categories = AsyncMock(return_value=[])
-        master_service._ensure_custom_fields = AsyncMock(return_value=[])
+        for stub in vars(ensure_stubs).values():
+            stub.side_effect = wait_for_all
 
-        result = await master_service.setup_master_data("TEST_PROJECT")
+        result = await stubbed_master_service.setup_master_data("TEST_PROJECT")
 
-        assert result.success is False
-        assert len(result.errors) == 1
-        assert "Failed to setup issue types" in result.errors[0]
+        assert result.errors == []
+        assert started == 3
 
     @pytest.mark.asyncio
-    async def test_setup_with_category_error(self, master_service):
-        """Test setup handles category errors"""
-        master_service._ensure_issue_types = AsyncMock(return_value=[])
-        master_service._ensure_categories = AsyncMock(
-            side_effect=Exception("Category API error")
-        )
-        master_service._ensure_custom_fields = AsyncMock(return_value=[])
+    async def test_setup_creates_items(self, stubbed_master_service, ensure_stubs):
+        """Test setup when items need to be created"""
+        ensure_stubs.issue_types.return_value = ["課題"]
+        ensure_stubs.categories.return_value = ["事前準備", "要件定義"]
+        ensure_stubs.custom_fields.return_value = ["インプット"]
 
-        result = await master_service.setup_master_data("TEST_PROJECT")
+        result = await stubbed_master_service.setup_master_data("TEST_PROJECT")
 
-        assert result.success is False
-        assert len(result.errors) == 1
-        assert "Failed to setup categories" in result.errors[0]
+        assert result.success is True
+        assert result.total_created == 4
+        assert len(result.created_issue_types) == 1
+        assert len(result.created_categories) == 2
+        assert len(result.created_custom_fields) == 1
 
     @pytest.mark.asyncio
-    async def test_setup_with_custom_field_error(self, master_service):
-        """Test setup handles custom field errors"""
-        master_service._ensure_issue_types = AsyncMock(return_value=[])
-        master_service._ensure_categories = AsyncMock(return_value=[])
-        master_service._ensure_custom_fields = AsyncMock(
-            side_effect=Exception("Custom field error")
-        )
+    @pytest.mark.parametrize(
+        "failing_stub, expected_msg",
+        [
+            pytest.param(
+                "issue_types", "Failed to setup issue types", id="issue_types"
+            ),
+            pytest.param("categories", "Failed to setup categories", id="categories"),
+            pytest.param(
+                "custom_fields", "Failed to setup custom fields", id="custom_fields"
+            ),
+        ],
+    )
+    async def test_setup_with_single_error(
+        self, stubbed_master_service, ensure_stubs, failing_stub, expected_msg
+    ):
+        """Test setup records the error of whichever step fails"""
+        getattr(ensure_stubs, failing_stub).side_effect = Exception("boom")
 
-        result = await master_service.setup_master_data("TEST_PROJECT")
+        result = await stubbed_master_service.setup_master_data("TEST_PROJECT")
 
         assert result.success is False
         assert len(result.errors) == 1
-        assert "Failed to setup custom fields" in result.errors[0]
+        assert expected_msg in result.errors[0]
 
     @pytest.mark.asyncio
-    async def test_setup_with_multiple_errors(self, master_service):
+    async def test_setup_with_multiple_errors(
+        self, stubbed_master_service, ensure_stubs
+    ):
         """Test setup handles multiple errors"""
-        master_service._ensure_issue_types = AsyncMock(side_effect=Exception("Error 1"))
-        master_service._ensure_categories = AsyncMock(side_effect=Exception("Error 2"))
-        master_service._ensure_custom_fields = AsyncMock(
-            side_effect=Exception("Error 3")
-        )
+        ensure_stubs.issue_types.side_effect = Exception("Error 1")
+        ensure_stubs.categories.side_effect = Exception("Error 2")
+        ensure_stubs.custom_fields.side_effect = Exception("Error 3")
 
-        result = await master_service.setup_master_data("TEST_PROJECT")
+        result = await stubbed_master_service.setup_master_data("TEST_PROJECT")
 
         assert result.success is False
         assert len(result.errors) == 3
+        # One failure does not cancel the others; errors keep the step order
+        assert [msg.split(":")[0] for msg in result.errors] == [
+            "Failed to setup issue types",
+            "Failed to setup categories",
+            "Failed to setup custom fields",
+        ]
 
 
 class TestMasterServiceEnsureIssueTypes:
@@ -178,40 +219,39 @@ class TestMasterServiceEnsureIssueTypes:
         self, master_service, mock_backlog_client
     ):
         """Test when all required issue types already exist"""
-        # Mock existing types - properly set .name attribute
-        type1 = Mock()
-        type1.name = "課題"
-        type2 = Mock()
-        type2.name = "リスク"
-        type3 = Mock()
-        type3.name = "バグ"
-        existing_types = [type1, type2, type3]
-
-        mock_backlog_client.get_issue_types = AsyncMock(return_value=existing_types)
-        mock_backlog_client.create_issue_type = AsyncMock()
+        # The service only reads .name from the existing types
+        existing_types = [
+            SimpleNamespace(name=name) for name in ("課題", "リスク", "バグ")
+        ]
+
+        get_issue_types = AsyncMock(return_value=existing_types)
+        create_issue_type = AsyncMock()
+        mock_backlog_client.get_issue_types = get_issue_types
+        mock_backlog_client.create_issue_type = create_issue_type
 
         result = await master_service._ensure_issue_types("TEST_PROJECT")
 
         assert result == []  # Nothing created
-        mock_backlog_client.get_issue_types.assert_called_once_with("TEST_PROJECT")
-        mock_backlog_client.create_issue_type.assert_not_called()
+        get_issue_types.assert_called_once_with("TEST_PROJECT")
+        create_issue_type.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ensure_issue_types_creates_missing(
         self, master_service, mock_backlog_client
     ):
         """Test when issue types need to be created"""
-        # Mock only one existing type
-        existing_types = [Mock(name="バグ")]
-        mock_backlog_client.get_issue_types = AsyncMock(return_value=existing_types)
-        mock_backlog_client.create_issue_type = AsyncMock()
+        # Only one existing type, which is not a required one
+        existing_types = [SimpleNamespace(name="バグ")]
+        get_issue_types = AsyncMock(return_value=existing_types)
+        create_issue_type = AsyncMock()
+        mock_backlog_client.get_issue_types = get_issue_types
+        mock_backlog_client.create_issue_type = create_issue_type
 
         result = await master_service._ensure_issue_types("TEST_PROJECT")
 
         assert len(result) == 2
-        assert "課題" in result
-        assert "リスク" in result
-        assert mock_backlog_client.create_issue_type.call_count == 2
+        assert set(result) == {"課題", "リスク"}
+        assert create_issue_type.call_count == 2
 
 
 class TestMasterServiceEnsureCategories:
@@ -222,7 +262,6 @@ class TestMasterServiceEnsureCategories:
         self, master_service, mock_backlog_client
     ):
         """Test when all required categories already exist"""
-        # Properly set .name attribute
         cat_names = [
             "事前準備",
             "要件定義",
@@ -232,20 +271,18 @@ class TestMasterServiceEnsureCategories:
             "リリース",
             "納品",
         ]
-        existing_categories = []
-        for cat_name in cat_names:
-            cat = Mock()
-            cat.name = cat_name
-            existing_categories.append(cat)
+        existing_categories = [SimpleNamespace(name=name) for name in cat_names]
 
-        mock_backlog_client.get_categories = AsyncMock(return_value=existing_categories)
-        mock_backlog_client.create_category = AsyncMock()
+        get_categories = AsyncMock(return_value=existing_categories)
+        create_category = AsyncMock()
+        mock_backlog_client.get_categories = get_categories
+        mock_backlog_client.create_category = create_category
 
         result = await master_service._ensure_categories("TEST_PROJECT")
 
         assert result == []
-        mock_backlog_client.get_categories.assert_called_once_with("TEST_PROJECT")
-        mock_backlog_client.create_category.assert_not_called()
+        get_categories.assert_called_once_with("TEST_PROJECT")
+        create_category.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ensure_categories_creates_missing(
@@ -254,14 +291,16 @@ class TestMasterServiceEnsureCategories:
         """Test when categories need to be created"""
         # Mock NO existing categories
         existing_categories = []
-        mock_backlog_client.get_categories = AsyncMock(return_value=existing_categories)
-        mock_backlog_client.create_category = AsyncMock()
+        get_categories = AsyncMock(return_value=existing_categories)
+        create_category = AsyncMock()
+        mock_backlog_client.get_categories = get_categories
+        mock_backlog_client.create_category = create_category
 
         result = await master_service._ensure_categories("TEST_PROJECT")
 
         # Should create all 7 required categories
         assert len(result) == 7
-        assert mock_backlog_client.create_category.call_count == 7
+        assert create_category.call_count == 7
 
 
 class TestMasterServiceEnsureCustomFields:
@@ -272,21 +311,21 @@ class TestMasterServiceEnsureCustomFields:
         self, master_service, mock_backlog_client
     ):
         """Test when all required custom fields already exist"""
-        # Properly set .name attribute
-        field1 = Mock()
-        field1.name = "インプット"
-        field2 = Mock()
-        field2.name = "ゴール/アウトプット"
-        existing_fields = [field1, field2]
+        existing_fields = [
+            SimpleNamespace(name="インプット"),
+            SimpleNamespace(name="ゴール/アウトプット"),
+        ]
 
-        mock_backlog_client.get_custom_fields = AsyncMock(return_value=existing_fields)
-        mock_backlog_client.create_custom_field = AsyncMock()
+        get_custom_fields = AsyncMock(return_value=existing_fields)
+        create_custom_field = AsyncMock()
+        mock_backlog_client.get_custom_fields = get_custom_fields
+        mock_backlog_client.create_custom_field = create_custom_field
 
         result = await master_service._ensure_custom_fields("TEST_PROJECT")
 
         assert result == []
-        mock_backlog_client.get_custom_fields.assert_called_once_with("TEST_PROJECT")
-        mock_backlog_client.create_custom_field.assert_not_called()
+        get_custom_fields.assert_called_once_with("TEST_PROJECT")
+        create_custom_field.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ensure_custom_fields_creates_missing(
@@ -295,36 +334,36 @@ class TestMasterServiceEnsureCustomFields:
         """Test when custom fields need to be created"""
         # Mock NO existing custom fields
         existing_fields = []
-        mock_backlog_client.get_custom_fields = AsyncMock(return_value=existing_fields)
-        mock_backlog_client.create_custom_field = AsyncMock()
+        get_custom_fields = AsyncMock(return_value=existing_fields)
+        create_custom_field = AsyncMock()
+        mock_backlog_client.get_custom_fields = get_custom_fields
+        mock_backlog_client.create_custom_field = create_custom_field
 
         result = await master_service._ensure_custom_fields("TEST_PROJECT")
 
         # Should create 2 required custom fields
         assert len(result) == 2
-        assert "インプット" in result
-        assert "ゴール/アウトプット" in result
-        assert mock_backlog_client.create_custom_field.call_count == 2
+        assert set(result) == {"インプット", "ゴール/アウトプット"}
+        assert create_custom_field.call_count == 2
 
     @pytest.mark.asyncio
     async def test_ensure_custom_fields_creates_partial(
         self, master_service, mock_backlog_client
     ):
         """Test when some custom fields need to be created"""
-        # Mock only one existing field
-        field1 = Mock()
-        field1.name = "インプット"
-        existing_fields = [field1]
+        # Only one existing field
+        existing_fields = [SimpleNamespace(name="インプット")]
 
-        mock_backlog_client.get_custom_fields = AsyncMock(return_value=existing_fields)
-        mock_backlog_client.create_custom_field = AsyncMock()
+        get_custom_fields = AsyncMock(return_value=existing_fields)
+        create_custom_field = AsyncMock()
+        mock_backlog_client.get_custom_fields = get_custom_fields
+        mock_backlog_client.create_custom_field = create_custom_field
 
         result = await master_service._ensure_custom_fields("TEST_PROJECT")
 
         # Should create 1 missing custom field
-        assert len(result) == 1
-        assert "ゴール/アウトプット" in result
-        assert mock_backlog_client.create_custom_field.call_count == 1
+        assert result == ["ゴール/アウトプット"]
+        assert create_custom_field.call_count == 1
 
 
 class TestMasterServiceConstants:
@@ -333,16 +372,23 @@ class TestMasterServiceConstants:
     def test_required_issue_types(self):
         """Test REQUIRED_ISSUE_TYPES constant"""
         assert len(REQUIRED_ISSUE_TYPES) == 2
-        assert "課題" in REQUIRED_ISSUE_TYPES
-        assert "リスク" in REQUIRED_ISSUE_TYPES
+        assert set(REQUIRED_ISSUE_TYPES) == {"課題", "リスク"}
 
     def test_required_categories(self):
         """Test REQUIRED_CATEGORIES constant"""
         assert len(REQUIRED_CATEGORIES) == 7
-        assert "事前準備" in REQUIRED_CATEGORIES
-        assert "要件定義" in REQUIRED_CATEGORIES
-        assert "基本設計" in REQUIRED_CATEGORIES
-        assert "実装" in REQUIRED_CATEGORIES
-        assert "テスト" in REQUIRED_CATEGORIES
-        assert "リリース" in REQUIRED_CATEGORIES
-        assert "納品" in REQUIRED_CATEGORIES
+        assert set(REQUIRED_CATEGORIES) == {
+            "事前準備",
+            "要件定義",
+            "基本設計",
+            "実装",
+            "テスト",
+            "リリース",
+            "納品",
+        }
+
+    def test_required_names_are_immutable_and_ordered(self):
+        """Test required names are tuples (fixed creation order, not mutable)"""
+        assert isinstance(REQUIRED_ISSUE_TYPES, tuple)
+        assert isinstance(REQUIRED_CATEGORIES, tuple)
+        assert REQUIRED_CATEGORIES[:2] == ("事前準備", "要件定義")
@@ -2,92 +2,109 @@
 Unit tests for TaskMerger
 """
 
-from unittest.mock import Mock
-
 import pytest
 
 from src.models.enums import CategoryEnum
 from src.models.task import Task
-from src.services.category_detector import CategoryDetector
 from src.services.task_merger import TaskMerger
 
+# TaskMerger never mutates its inputs, so the tasks are built once per module
+_TEMPLATE_TASKS = (
+    Task(title="Template1", category=CategoryEnum.REQUIREMENTS),
+    Task(title="Template2", category=CategoryEnum.IMPLEMENTATION),
+)
+_NEW_TASKS = (Task(title="New1"), Task(title="New2"))
+_UNORDERED_TASKS = (
+    Task(title="Task1", category=CategoryEnum.TESTING),
+    Task(title="Task2", category=CategoryEnum.REQUIREMENTS),
+    Task(title="Task3", category=CategoryEnum.IMPLEMENTATION),
+)
+_TEMPLATE_IMPLEMENTATION_TASK = Task(
+    title="Template", category=CategoryEnum.IMPLEMENTATION
+)
+_NEW_TASK = Task(title="New")
+_UNSORTED_TASKS = (
+    Task(title="T1", category=CategoryEnum.DELIVERY),
+    Task(title="T2", category=CategoryEnum.PREPARATION),
+)
+
+
+class _StubDetector:
+    """CategoryDetector stand-in that returns a fixed category"""
+
+    def __init__(self, return_value: CategoryEnum = CategoryEnum.IMPLEMENTATION):
+        self.return_value = return_value
+
+    def detect_category(self, task: Task) -> CategoryEnum:
+        return self.return_value
+
 
 @pytest.fixture
-def mock_category_detector():
-    """Mock CategoryDetector"""
-    detector = Mock(spec=CategoryDetector)
-    detector.detect_category = Mock(return_value=CategoryEnum.IMPLEMENTATION)
-    return detector
+def stub_detector():
+    """Stub CategoryDetector (a fresh one per test)"""
+    return _StubDetector()
 
 
 @pytest.fixture
-def task_merger(mock_logger, mock_category_detector):
+def task_merger(mock_logger, stub_detector):
     """Create TaskMerger instance with mocks"""
-    return TaskMerger(mock_category_detector, mock_logger)
+    return TaskMerger(stub_detector, mock_logger)
 
 
 class TestTaskMerger:
     """Tests for TaskMerger class"""
 
-    def test_merge_tasks_empty_lists(self, task_merger):
-        """Test merging empty task lists"""
-        result = task_merger.merge_tasks([], [])
-        assert len(result) == 0
-
-    def test_merge_tasks_template_only(self, task_merger):
-        """Test merging with template tasks only"""
-        template_tasks = [
-            Task(title="Template1", category=CategoryEnum.REQUIREMENTS),
-            Task(title="Template2", category=CategoryEnum.IMPLEMENTATION),
-        ]
-        result = task_merger.merge_tasks(template_tasks, [])
-        assert len(result) == 2
-        assert result[0].title == "Template1"
-
-    def test_merge_tasks_new_only(self, task_merger, mock_category_detector):
-        """Test merging with new tasks only"""
-        new_tasks = [Task(title="New1"), Task(title="New2")]
-        mock_category_detector.detect_category.return_value = CategoryEnum.TESTING
-
-        result = task_merger.merge_tasks([], new_tasks)
-        assert len(result) == 2
-
-    def test_merge_tasks_preserves_category_order(self, task_merger):
-        """Test tasks are sorted by category order"""
-        tasks = [
-            Task(title="Task1", category=CategoryEnum.TESTING),
-            Task(title="Task2", category=CategoryEnum.REQUIREMENTS),
-            Task(title="Task3", category=CategoryEnum.IMPLEMENTATION),
-        ]
-        result = task_merger.merge_tasks(tasks, [])
-        assert result[0].category == CategoryEnum.REQUIREMENTS
-        assert result[1].category == CategoryEnum.IMPLEMENTATION
-        assert result[2].category == CategoryEnum.TESTING
-
-    def test_merge_tasks_template_before_new(self, task_merger, mock_category_detector):
-        """Test template tasks come before new tasks in same category"""
-        template = [Task(title="Template", category=CategoryEnum.IMPLEMENTATION)]
-        new = [Task(title="New")]
-        mock_category_detector.detect_category.return_value = (
-            CategoryEnum.IMPLEMENTATION
-        )
-
-        result = task_merger.merge_tasks(template, new)
-        assert result[0].title == "Template"
-        assert result[1].title == "New"
-
-    def test_get_category_order_index(self, task_merger):
-        """Test category order index retrieval"""
-        assert task_merger.get_category_order_index(CategoryEnum.PREPARATION) == 0
-        assert task_merger.get_category_order_index(CategoryEnum.REQUIREMENTS) == 1
-        assert task_merger.get_category_order_index(CategoryEnum.DELIVERY) == 6
+    @pytest.mark.parametrize(
+        "templates, news, detected, expected_titles",
+        [
+            pytest.param((), (), None, [], id="empty_lists"),
+            pytest.param(
+                _TEMPLATE_TASKS,
+                (),
+                None,
+                ["Template1", "Template2"],
+                id="template_only",
+            ),
+            pytest.param(
+                (), _NEW_TASKS, CategoryEnum.TESTING, ["New1", "New2"], id="new_only"
+            ),
+            pytest.param(
+                _UNORDERED_TASKS,
+                (),
+                None,
+                ["Task2", "Task3", "Task1"],
+                id="preserves_category_order",
+            ),
+            pytest.param(
+                (_TEMPLATE_IMPLEMENTATION_TASK,),
+                (_NEW_TASK,),
+                CategoryEnum.IMPLEMENTATION,
+                ["Template", "New"],
+                id="template_before_new",
+            ),
+        ],
+    )
+    def test_merge_tasks(
+        self, task_merger, stub_detector, templates, news, detected, expected_titles
+    ):
+        """Test merged tasks come out in category order, templates first"""
+        if detected is not None:
+            stub_detector.return_value = detected
+
+        result = task_merger.merge_tasks(list(templates), list(news))
+
+        assert [task.title for task in result] == expected_titles
+
+    @pytest.mark.parametrize(
+        "index, category",
+        [pytest.param(i, c, id=c.name) for i, c in enumerate(CategoryEnum)],
+    )
+    def test_get_category_order_index(self, task_merger, index, category):
+        """Test category order index follows the CategoryEnum declaration order"""
+        assert task_merger.get_category_order_index(category) == index
 
     def test_sort_tasks_by_category(self, task_merger):
         """Test sorting tasks by category"""
-        tasks = [
-            Task(title="T1", category=CategoryEnum.DELIVERY),
-            Task(title="T2", category=CategoryEnum.PREPARATION),
-        ]
-        result = task_merger.sort_tasks_by_category(tasks)
+        result = task_merger.sort_tasks_by_category(list(_UNSORTED_TASKS))
         assert result[0].category == CategoryEnum.PREPARATION
         assert result[1].category == CategoryEnum.DELIVERY
@@ -2,6 +2,7 @@
 Unit tests for WBSService
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -10,21 +11,86 @@ from src.models.enums import CategoryEnum, ServiceType
 from src.models.task import Task
 from src.services.wbs_service import WBSResult, WBSService
 
+_DEPENDENCY_NAMES = (
+    "master_service",
+    "url_parser",
+    "mcp_factory",
+    "document_processor",
+    "converter",
+    "task_merger",
+    "backlog_client",
+    "storage_manager",
+)
+
+
+# WBSService only reads the tasks it is given, so they are built once per module
+_MERGED_TASK = Task(title="タスク", category=CategoryEnum.IMPLEMENTATION)
+_DUPLICATE_TASK = Task(title="既存タスク", category=CategoryEnum.IMPLEMENTATION)
+_UNIQUE_TASK = Task(title="新規タスク", category=CategoryEnum.TESTING)
+
+# Read-only return values (the service only reads these attributes)
+_SAVED_METADATA = SimpleNamespace(id="meta", version=1)
+_MASTER_DATA_OK = SimpleNamespace(success=True, total_created=0, errors=[])
+_EXISTING_BACKLOG_TASK = SimpleNamespace(summary="既存タスク")
+
+# Scenario keys test_create_wbs fills in when a row leaves them out
+_CREATE_WBS_DEFAULTS = {
+    "new_tasks_text": None,
+    "merged_tasks": [],
+    "get_tasks_error": None,
+    "master_result": None,
+    "url_error": None,
+}
+
+
+@pytest.fixture(scope="module")
+def _shared_dependencies():
+    """Create the WBSService dependency mocks once per module"""
+    return {name: Mock() for name in _DEPENDENCY_NAMES}
+
+
+@pytest.fixture(scope="module")
+def _shared_async_stubs():
+    """Create one AsyncMock per awaited dependency method once per module"""
+    return SimpleNamespace(
+        fetch_data=AsyncMock(),
+        save_data=AsyncMock(),
+        get_tasks=AsyncMock(),
+        create_tasks=AsyncMock(),
+        setup_master_data=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def mock_dependencies(_shared_dependencies, _shared_async_stubs, mock_logger):
+    """Mock dependencies for WBSService (shared; reset before every test)
+
+    The awaited methods are the shared async stubs, reset to a successful run.
+    """
+    for dependency in _shared_dependencies.values():
+        dependency.reset_mock(return_value=True, side_effect=True)
+
+    stubs = _shared_async_stubs
+    for stub in vars(stubs).values():
+        stub.reset_mock(return_value=True, side_effect=True)
+    stubs.fetch_data.return_value = {}
+    stubs.save_data.return_value = _SAVED_METADATA
+    stubs.get_tasks.return_value = []
+    stubs.create_tasks.return_value = []
+    stubs.setup_master_data.return_value = _MASTER_DATA_OK
+
+    _shared_dependencies["backlog_client"].fetch_data = stubs.fetch_data
+    _shared_dependencies["backlog_client"].get_tasks = stubs.get_tasks
+    _shared_dependencies["backlog_client"].create_tasks = stubs.create_tasks
+    _shared_dependencies["storage_manager"].save_data = stubs.save_data
+    _shared_dependencies["master_service"].setup_master_data = stubs.setup_master_data
+    return {**_shared_dependencies, "logger": mock_logger}
+
 
 @pytest.fixture
-def mock_dependencies(mock_logger):
-    """Create mock dependencies for WBSService"""
-    return {
-        "master_service": Mock(),
-        "url_parser": Mock(),
-        "mcp_factory": Mock(),
-        "document_processor": Mock(),
-        "converter": Mock(),
-        "task_merger": Mock(),
-        "backlog_client": Mock(),
-        "storage_manager": Mock(),
-        "logger": mock_logger,
-    }
+def async_stubs(mock_dependencies, _shared_async_stubs):
+    """Awaited dependency methods wired into mock_dependencies"""
+    return _shared_async_stubs
 
 
 @pytest.fixture
@@ -33,6 +99,15 @@ def wbs_service(mock_dependencies):
     return WBSService(**mock_dependencies)
 
 
+@pytest.fixture(scope="module")
+def wbs_service_ro(_shared_dependencies, mock_logger):
+    """WBSService over the shared mocks for tests that never patch the instance
+
+    Request mock_dependencies alongside it so the mocks are reset first.
+    """
+    return WBSService(**_shared_dependencies, logger=mock_logger)
+
+
 class TestWBSResult:
     """Tests for WBSResult class"""
 
@@ -53,112 +128,91 @@ class TestWBSService:
     """Tests for WBSService class"""
 
     @pytest.mark.asyncio
-    async def test_create_wbs_success_flow(self, wbs_service, mock_dependencies):
-        """Test successful WBS creation workflow"""
-        # Setup mocks
-        mock_dependencies["url_parser"].parse_service_type.return_value = (
-            ServiceType.BACKLOG
-        )
+    @pytest.mark.parametrize(
+        "scenario",
+        [
+            pytest.param(
+                {
+                    "master_result": SimpleNamespace(
+                        success=True, total_created=3, errors=[]
+                    )
+                },
+                id="success_flow",
+            ),
+            pytest.param(
+                {"new_tasks_text": "- 新しいタスク", "merged_tasks": [_MERGED_TASK]},
+                id="with_new_tasks",
+            ),
+            pytest.param(
+                {
+                    "master_result": SimpleNamespace(
+                        success=False, total_created=0, errors=["Error 1", "Error 2"]
+                    )
+                },
+                id="master_data_with_errors",
+            ),
+            pytest.param(
+                {
+                    "merged_tasks": [_MERGED_TASK],
+                    "get_tasks_error": Exception("API connection failed"),
+                },
+                id="duplicate_check_error",
+            ),
+            pytest.param(
+                {"url_error": ValueError("Invalid URL")},
+                id="url_parse_error",
+            ),
+        ],
+    )
+    async def test_create_wbs(
+        self, wbs_service, mock_dependencies, async_stubs, scenario
+    ):
+        """Test create_wbs outcome for each workflow scenario"""
+        scenario = {**_CREATE_WBS_DEFAULTS, **scenario}
+        parse_service_type = mock_dependencies["url_parser"].parse_service_type
+        if scenario["url_error"] is not None:
+            parse_service_type.side_effect = scenario["url_error"]
+        else:
+            parse_service_type.return_value = ServiceType.BACKLOG
         mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
             "backlog_client"
         ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta123", version=1)
-        )
-        mock_dependencies["converter"].parse_tasks_from_text.return_value = []
-        mock_dependencies["task_merger"].merge_tasks.return_value = []
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(return_value=[])
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(return_value=[])
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=3)
-        )
-
-        # Execute
-        result = await wbs_service.create_wbs(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text=None,
-            project_key="PROJ",
-        )
-
-        # Verify
-        assert result.success is True
-        assert result.master_data_created == 3
-
-    @pytest.mark.asyncio
-    async def test_create_wbs_with_error(self, wbs_service, mock_dependencies):
-        """Test WBS creation with error"""
-        # Setup mocks - need AsyncMock for async methods called before the error
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
-        # Setup mock to raise error at URL parsing
-        mock_dependencies["url_parser"].parse_service_type.side_effect = ValueError(
-            "Invalid URL"
-        )
-
-        # Execute
-        result = await wbs_service.create_wbs(
-            template_url="invalid", new_tasks_text=None, project_key="PROJ"
-        )
-
-        # Verify
-        assert result.success is False
-        assert result.error_message is not None
-        assert "Invalid URL" in result.error_message
-
-    @pytest.mark.asyncio
-    async def test_create_wbs_with_new_tasks(self, wbs_service, mock_dependencies):
-        """Test WBS creation with new tasks text"""
-        # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
-        mock_dependencies["url_parser"].parse_service_type.return_value = (
-            ServiceType.BACKLOG
-        )
-        mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
-            "backlog_client"
+        parse_tasks = mock_dependencies["converter"].parse_tasks_from_text
+        parse_tasks.return_value = scenario["merged_tasks"]
+        mock_dependencies["task_merger"].merge_tasks.return_value = scenario[
+            "merged_tasks"
         ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta123", version=1)
-        )
+        async_stubs.create_tasks.return_value = scenario["merged_tasks"]
+        async_stubs.get_tasks.side_effect = scenario["get_tasks_error"]
+        if scenario["master_result"] is not None:
+            async_stubs.setup_master_data.return_value = scenario["master_result"]
 
-        # Mock new tasks parsing
-        new_task = Task(title="新しいタスク", category=CategoryEnum.IMPLEMENTATION)
-        mock_dependencies["converter"].parse_tasks_from_text.return_value = [new_task]
-
-        # Mock task merger
-        merged_task = Task(title="新しいタスク", category=CategoryEnum.IMPLEMENTATION)
-        mock_dependencies["task_merger"].merge_tasks.return_value = [merged_task]
-
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(return_value=[])
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(
-            return_value=[merged_task]
-        )
-
-        # Execute
         result = await wbs_service.create_wbs(
             template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text="- 新しいタスク",
+            new_tasks_text=scenario["new_tasks_text"],
             project_key="PROJ",
         )
 
-        # Verify
+        if scenario["url_error"] is not None:
+            assert result.success is False
+            assert str(scenario["url_error"]) in result.error_message
+            return
+
         assert result.success is True
-        assert len(result.registered_tasks) == 1
-        mock_dependencies["converter"].parse_tasks_from_text.assert_called_once_with(
-            "- 新しいタスク"
-        )
+        # A failed duplicate check registers every merged task unfiltered
+        assert result.registered_tasks == scenario["merged_tasks"]
+        master_result = async_stubs.setup_master_data.return_value
+        if master_result.success:
+            assert result.master_data_created == master_result.total_created
+        if scenario["new_tasks_text"]:
+            parse_tasks.assert_called_once_with(scenario["new_tasks_text"])
 
     @pytest.mark.asyncio
-    async def test_create_wbs_storage_saves_data(self, wbs_service, mock_dependencies):
+    async def test_create_wbs_storage_saves_data(
+        self, wbs_service, mock_dependencies, async_stubs
+    ):
         """Test that storage manager saves template data"""
         # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
         mock_dependencies["url_parser"].parse_service_type.return_value = (
             ServiceType.NOTION
         )
@@ -167,16 +221,12 @@ class TestWBSService:
         mock_dependencies["mcp_factory"].create_client.return_value = mock_notion_client
 
         template_data = {"title": "Template", "tasks": []}
-        mock_notion_client.fetch_data = AsyncMock(return_value=template_data)
+        mock_notion_client.fetch_data = async_stubs.fetch_data
+        async_stubs.fetch_data.return_value = template_data
 
-        mock_metadata = Mock(id="meta456", version=2)
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=mock_metadata
-        )
+        async_stubs.save_data.return_value = SimpleNamespace(id="meta456", version=2)
         mock_dependencies["converter"].parse_tasks_from_text.return_value = []
         mock_dependencies["task_merger"].merge_tasks.return_value = []
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(return_value=[])
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(return_value=[])
 
         # Execute
         result = await wbs_service.create_wbs(
@@ -186,50 +236,34 @@ class TestWBSService:
         )
 
         # Verify storage was called
-        mock_dependencies["storage_manager"].save_data.assert_called_once()
-        call_args = mock_dependencies["storage_manager"].save_data.call_args
+        async_stubs.save_data.assert_called_once()
+        call_args = async_stubs.save_data.call_args
         assert call_args[1]["file_url"] == "https://notion.so/page123"
         assert call_args[1]["data"] == template_data
 
     @pytest.mark.asyncio
-    async def test_create_wbs_duplicate_detection(self, wbs_service, mock_dependencies):
+    async def test_create_wbs_duplicate_detection(
+        self, wbs_service, mock_dependencies, async_stubs
+    ):
         """Test duplicate task detection"""
         # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
         mock_dependencies["url_parser"].parse_service_type.return_value = (
             ServiceType.BACKLOG
         )
         mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
             "backlog_client"
         ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta", version=1)
-        )
         mock_dependencies["converter"].parse_tasks_from_text.return_value = []
 
-        # Mock existing task in Backlog (must have .summary attribute, not .title)
-        existing_task = Mock()
-        existing_task.summary = "既存タスク"
-
         # Mock merged tasks (including duplicate)
-        merged_tasks = [
-            Task(title="既存タスク", category=CategoryEnum.IMPLEMENTATION),
-            Task(title="新規タスク", category=CategoryEnum.TESTING),
-        ]
+        merged_tasks = [_DUPLICATE_TASK, _UNIQUE_TASK]
         mock_dependencies["task_merger"].merge_tasks.return_value = merged_tasks
 
-        # Mock get_tasks to return existing task with .summary attribute
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(
-            return_value=[existing_task]
-        )
+        # Existing Backlog tasks expose .summary, not .title
+        async_stubs.get_tasks.return_value = [_EXISTING_BACKLOG_TASK]
 
         # Only new task should be created
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(
-            return_value=[merged_tasks[1]]
-        )
+        async_stubs.create_tasks.return_value = [_UNIQUE_TASK]
 
         # Execute
         result = await wbs_service.create_wbs(
@@ -242,51 +276,11 @@ class TestWBSService:
         assert result.success is True
         assert len(result.registered_tasks) == 1
 
-    @pytest.mark.asyncio
-    async def test_create_wbs_master_data_with_errors(
-        self, wbs_service, mock_dependencies
-    ):
-        """Test WBS creation when master data setup has errors"""
-        # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(
-                success=False, total_created=0, errors=["Error 1", "Error 2"]
-            )
-        )
-        mock_dependencies["url_parser"].parse_service_type.return_value = (
-            ServiceType.BACKLOG
-        )
-        mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
-            "backlog_client"
-        ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta", version=1)
-        )
-        mock_dependencies["converter"].parse_tasks_from_text.return_value = []
-        mock_dependencies["task_merger"].merge_tasks.return_value = []
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(return_value=[])
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(return_value=[])
-
-        # Execute - should continue despite master data errors
-        result = await wbs_service.create_wbs(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text=None,
-            project_key="PROJ",
-        )
-
-        # Verify it still completes
-        assert result.success is True
-
     @pytest.mark.asyncio
     async def test_create_wbs_unsupported_service_type(
         self, wbs_service, mock_dependencies
     ):
         """Test WBS creation with unsupported service type"""
-        # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
         # Return an invalid service type by raising in _process_template_data
         mock_dependencies["url_parser"].parse_service_type.return_value = (
             ServiceType.BACKLOG
@@ -294,10 +288,6 @@ class TestWBSService:
         mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
             "backlog_client"
         ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta", version=1)
-        )
 
         # Mock _process_template_data to raise ValueError for unsupported service
         async def raise_unsupported(*args, **kwargs):
@@ -317,54 +307,10 @@ class TestWBSService:
         assert "Unsupported service type" in result.error_message
 
     @pytest.mark.asyncio
-    async def test_create_wbs_duplicate_check_error(
-        self, wbs_service, mock_dependencies
+    async def test_process_template_data_notion_with_blocks(
+        self, wbs_service_ro, mock_dependencies
     ):
-        """Test WBS creation when duplicate check fails"""
-        # Setup mocks
-        mock_dependencies["master_service"].setup_master_data = AsyncMock(
-            return_value=Mock(success=True, total_created=0)
-        )
-        mock_dependencies["url_parser"].parse_service_type.return_value = (
-            ServiceType.BACKLOG
-        )
-        mock_dependencies["mcp_factory"].create_client.return_value = mock_dependencies[
-            "backlog_client"
-        ]
-        mock_dependencies["backlog_client"].fetch_data = AsyncMock(return_value={})
-        mock_dependencies["storage_manager"].save_data = AsyncMock(
-            return_value=Mock(id="meta", version=1)
-        )
-        mock_dependencies["converter"].parse_tasks_from_text.return_value = []
-
-        merged_task = Task(title="タスク", category=CategoryEnum.IMPLEMENTATION)
-        mock_dependencies["task_merger"].merge_tasks.return_value = [merged_task]
-
-        # Mock get_tasks to raise an error
-        mock_dependencies["backlog_client"].get_tasks = AsyncMock(
-            side_effect=Exception("API connection failed")
-        )
-        # Should still try to create tasks despite error
-        mock_dependencies["backlog_client"].create_tasks = AsyncMock(
-            return_value=[merged_task]
-        )
-
-        # Execute - should continue with all tasks despite duplicate check error
-        result = await wbs_service.create_wbs(
-            template_url="https://test.backlog.com/view/PROJ-1",
-            new_tasks_text=None,
-            project_key="PROJ",
-        )
-
-        # Verify it completes and registers all tasks (no filtering)
-        assert result.success is True
-        assert len(result.registered_tasks) == 1
-
-    @pytest.mark.asyncio
-    async def test_process_template_data_notion_with_blocks(self, wbs_service):
         """Test _process_template_data with Notion blocks"""
-        from src.models.enums import ServiceType
-
         template_data = {
             "type": "page",
             "blocks": [
@@ -374,22 +320,22 @@ class TestWBSService:
         }
 
         # Mock converter to return tasks
-        wbs_service.converter.parse_tasks_from_text = Mock(
-            return_value=[Task(title="タスク1", category=CategoryEnum.IMPLEMENTATION)]
-        )
+        parse_iter = mock_dependencies["converter"].parse_tasks_from_text_iter
+        parse_iter.return_value = [_MERGED_TASK]
 
-        result = await wbs_service._process_template_data(
+        result = await wbs_service_ro._process_template_data(
             template_data, ServiceType.NOTION
         )
 
-        # Verify it attempts to parse tasks from extracted text
+        # Verify it parses tasks from the streamed block text
         assert isinstance(result, list)
+        parse_iter.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_process_template_data_notion_with_database(self, wbs_service):
+    async def test_process_template_data_notion_with_database(
+        self, wbs_service_ro, mock_dependencies
+    ):
         """Test _process_template_data with Notion database"""
-        from src.models.enums import ServiceType
-
         template_data = {
             "type": "database",
             "rows": [
@@ -398,7 +344,7 @@ class TestWBSService:
             ],
         }
 
-        result = await wbs_service._process_template_data(
+        result = await wbs_service_ro._process_template_data(
             template_data, ServiceType.NOTION
         )
 
@@ -3,47 +3,103 @@ Unit tests for FirestoreClient
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from src.models.metadata import FileMetadata
+from src.storage import firestore_client as firestore_client_module
 from src.storage.firestore_client import FirestoreClient
 
-
-class AsyncIterator:
-    """Helper class for async iteration in tests"""
-
-    def __init__(self, items):
-        self.items = items
-        self.index = 0
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        if self.index >= len(self.items):
-            raise StopAsyncIteration
-        item = self.items[self.index]
-        self.index += 1
-        return item
-
-
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.warning = Mock()
-    logger.error = Mock()
-    return logger
+_FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+# Inputs FirestoreClient only reads, built once per module
+_NEW_METADATA = FileMetadata(
+    source_file_name="test.json",
+    parent_url="https://example.com",
+    file_url="https://example.com/file",
+    file_name="test",
+    version=1,
+    format="json",
+    gcs_path="path/to/file",
+)
+_EXISTING_METADATA = FileMetadata(
+    id="existing_123",
+    source_file_name="test.json",
+    parent_url="https://example.com",
+    file_url="https://example.com/file",
+    file_name="test",
+    version=2,
+    format="json",
+    gcs_path="path/to/file",
+)
+
+
+def _stored_metadata(version, gcs_path):
+    """Build a metadata document payload as Firestore returns it"""
+    return {
+        "source_file_name": "test.json",
+        "parent_url": "https://example.com",
+        "file_url": "https://example.com/file",
+        "file_name": "test",
+        "version": version,
+        "format": "json",
+        "gcs_path": gcs_path,
+        "updated_at": _FIXED_TS,
+    }
+
+
+_STORED_V3 = _stored_metadata(3, "path/to/file")
+_STORED_V2 = _stored_metadata(2, "path/to/file/v2")
+_STORED_VERSIONS = tuple(
+    (f"doc_v{version}", _stored_metadata(version, f"path/to/file/v{version}"))
+    for version in (3, 2, 1)
+)
+
+
+def _doc(doc_id, payload):
+    """Mock Firestore snapshot (to_dict returns a copy; the client adds "id")"""
+    doc = Mock()
+    doc.id = doc_id
+    doc.to_dict.return_value = dict(payload)
+    return doc
+
+
+async def _async_iter(items):
+    """Yield items as an async iterator (stands in for a Firestore stream)"""
+    for item in items:
+        yield item
+
+
+def _stub_stream(db, chain, docs):
+    """Make db.collection(...).<chain>(...).stream() yield docs
+
+    Args:
+        db: Mock Firestore database
+        chain: Query method names called in order, e.g. ("where", "limit")
+        docs: Documents the stream yields
+
+    Returns:
+        The mock query whose stream() was stubbed
+    """
+    query = db.collection.return_value
+    for method in chain:
+        query = getattr(query, method).return_value
+    query.stream.return_value = _async_iter(docs)
+    return query
+
+
+@pytest.fixture(scope="module")
+def _shared_db():
+    """Create mock Firestore database once per module"""
+    return Mock()
 
 
 @pytest.fixture
-def mock_db():
-    """Create mock Firestore database"""
-    return Mock()
+def mock_db(_shared_db):
+    """Mock Firestore database (shared; reset before every test)"""
+    _shared_db.reset_mock(return_value=True, side_effect=True)
+    return _shared_db
 
 
 @pytest.fixture
@@ -66,6 +122,21 @@ class TestFirestoreClientInit:
         client = FirestoreClient(mock_logger, db=mock_db)
         assert client.collection_name == "test_metadata"
 
+    def test_init_reuses_shared_async_client(self, mock_logger, mock_config):
+        """Test instances for the same project share one AsyncClient"""
+        mock_config.firestore_collection = "file_metadata"
+
+        with patch.dict(firestore_client_module._CLIENT_CACHE, clear=True), patch(
+            "src.storage.firestore_client.get_config", return_value=mock_config
+        ), patch(
+            "src.storage.firestore_client.firestore.AsyncClient"
+        ) as mock_async_client:
+            first = FirestoreClient(mock_logger)
+            second = FirestoreClient(mock_logger)
+
+        assert first.db is second.db
+        mock_async_client.assert_called_once_with(project="test-project")
+
 
 class TestFirestoreClientSaveMetadata:
     """Tests for save_metadata method"""
@@ -73,16 +144,6 @@ class TestFirestoreClientSaveMetadata:
     @pytest.mark.asyncio
     async def test_save_metadata_new(self, firestore_client, mock_db):
         """Test saving new metadata"""
-        metadata = FileMetadata(
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=1,
-            format="json",
-            gcs_path="path/to/file",
-        )
-
         # Mock Firestore collection and document
         mock_doc_ref = Mock()
         mock_doc_ref.id = "new_doc_123"
@@ -90,7 +151,7 @@ class TestFirestoreClientSaveMetadata:
         mock_collection.add = AsyncMock(return_value=(Mock(), mock_doc_ref))
         mock_db.collection.return_value = mock_collection
 
-        result = await firestore_client.save_metadata(metadata)
+        result = await firestore_client.save_metadata(_NEW_METADATA)
 
         assert result == "new_doc_123"
         mock_collection.add.assert_called_once()
@@ -98,17 +159,6 @@ class TestFirestoreClientSaveMetadata:
     @pytest.mark.asyncio
     async def test_save_metadata_update_existing(self, firestore_client, mock_db):
         """Test updating existing metadata"""
-        metadata = FileMetadata(
-            id="existing_123",
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=2,
-            format="json",
-            gcs_path="path/to/file",
-        )
-
         # Mock Firestore document
         mock_doc = Mock()
         mock_doc.set = AsyncMock()
@@ -116,7 +166,7 @@ class TestFirestoreClientSaveMetadata:
         mock_collection.document.return_value = mock_doc
         mock_db.collection.return_value = mock_collection
 
-        result = await firestore_client.save_metadata(metadata)
+        result = await firestore_client.save_metadata(_EXISTING_METADATA)
 
         assert result == "existing_123"
         mock_doc.set.assert_called_once()
@@ -129,42 +179,22 @@ class TestFirestoreClientGetLatestMetadata:
     async def test_get_latest_metadata_found(self, firestore_client, mock_db):
         """Test getting latest metadata when exists"""
         # Mock query result
-        mock_doc = Mock()
-        mock_doc.id = "doc_123"
-        mock_doc.to_dict.return_value = {
-            "source_file_name": "test.json",
-            "parent_url": "https://example.com",
-            "file_url": "https://example.com/file",
-            "file_name": "test",
-            "version": 3,
-            "format": "json",
-            "gcs_path": "path/to/file",
-            "updated_at": datetime.now(),
-        }
-
-        mock_query = Mock()
-        mock_query.limit.return_value.stream.return_value = AsyncIterator([mock_doc])
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.order_by.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        _stub_stream(
+            mock_db, ("where", "order_by", "limit"), [_doc("doc_123", _STORED_V3)]
+        )
 
         result = await firestore_client.get_latest_metadata("https://example.com/file")
 
         assert result is not None
         assert result.id == "doc_123"
         assert result.version == 3
+        assert result.updated_at == _FIXED_TS
 
     @pytest.mark.asyncio
     async def test_get_latest_metadata_not_found(self, firestore_client, mock_db):
         """Test getting latest metadata when not exists"""
         # Mock empty query result
-        mock_query = Mock()
-        mock_query.limit.return_value.stream.return_value = AsyncIterator([])
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.order_by.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        _stub_stream(mock_db, ("where", "order_by", "limit"), [])
 
         result = await firestore_client.get_latest_metadata(
             "https://example.com/notfound"
@@ -173,6 +203,38 @@ class TestFirestoreClientGetLatestMetadata:
         assert result is None
 
 
+class TestFirestoreClientGetLatestVersionNumber:
+    """Tests for get_latest_version_number method"""
+
+    @pytest.mark.asyncio
+    async def test_get_latest_version_number_found(self, firestore_client, mock_db):
+        """Test getting latest version number projects only the version field"""
+        _stub_stream(
+            mock_db,
+            ("where", "select", "order_by", "limit"),
+            [_doc("doc_123", {"version": 4})],
+        )
+        mock_select = mock_db.collection.return_value.where.return_value.select
+
+        result = await firestore_client.get_latest_version_number(
+            "https://example.com/file"
+        )
+
+        assert result == 4
+        mock_select.assert_called_once_with(["version"])
+
+    @pytest.mark.asyncio
+    async def test_get_latest_version_number_not_found(self, firestore_client, mock_db):
+        """Test getting latest version number when no versions exist"""
+        _stub_stream(mock_db, ("where", "select", "order_by", "limit"), [])
+
+        result = await firestore_client.get_latest_version_number(
+            "https://example.com/notfound"
+        )
+
+        assert result == 0
+
+
 class TestFirestoreClientGetMetadataByVersion:
     """Tests for get_metadata_by_version method"""
 
@@ -180,25 +242,9 @@ class TestFirestoreClientGetMetadataByVersion:
     async def test_get_metadata_by_version_found(self, firestore_client, mock_db):
         """Test getting metadata by specific version"""
         # Mock query result
-        mock_doc = Mock()
-        mock_doc.id = "doc_456"
-        mock_doc.to_dict.return_value = {
-            "source_file_name": "test.json",
-            "parent_url": "https://example.com",
-            "file_url": "https://example.com/file",
-            "file_name": "test",
-            "version": 2,
-            "format": "json",
-            "gcs_path": "path/to/file/v2",
-            "updated_at": datetime.now(),
-        }
-
-        mock_query = Mock()
-        mock_query.limit.return_value.stream.return_value = AsyncIterator([mock_doc])
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.where.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        _stub_stream(
+            mock_db, ("where", "where", "limit"), [_doc("doc_456", _STORED_V2)]
+        )
 
         result = await firestore_client.get_metadata_by_version(
             "https://example.com/file", 2
@@ -212,12 +258,7 @@ class TestFirestoreClientGetMetadataByVersion:
     async def test_get_metadata_by_version_not_found(self, firestore_client, mock_db):
         """Test getting metadata when version not found"""
         # Mock empty query result
-        mock_query = Mock()
-        mock_query.limit.return_value.stream.return_value = AsyncIterator([])
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.where.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        _stub_stream(mock_db, ("where", "where", "limit"), [])
 
         result = await firestore_client.get_metadata_by_version(
             "https://example.com/file", 99
@@ -233,28 +274,8 @@ class TestFirestoreClientGetAllVersions:
     async def test_get_all_versions_multiple(self, firestore_client, mock_db):
         """Test getting all versions of a file"""
         # Mock query results with multiple versions
-        mock_docs = []
-        for version in [3, 2, 1]:
-            mock_doc = Mock()
-            mock_doc.id = f"doc_v{version}"
-            mock_doc.to_dict.return_value = {
-                "source_file_name": "test.json",
-                "parent_url": "https://example.com",
-                "file_url": "https://example.com/file",
-                "file_name": "test",
-                "version": version,
-                "format": "json",
-                "gcs_path": f"path/to/file/v{version}",
-                "updated_at": datetime.now(),
-            }
-            mock_docs.append(mock_doc)
-
-        mock_query = Mock()
-        mock_query.stream.return_value = AsyncIterator(mock_docs)
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.order_by.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        mock_docs = [_doc(doc_id, payload) for doc_id, payload in _STORED_VERSIONS]
+        _stub_stream(mock_db, ("where", "order_by"), mock_docs)
 
         result = await firestore_client.get_all_versions("https://example.com/file")
 
@@ -266,12 +287,7 @@ class TestFirestoreClientGetAllVersions:
     @pytest.mark.asyncio
     async def test_get_all_versions_empty(self, firestore_client, mock_db):
         """Test getting all versions when none exist"""
-        mock_query = Mock()
-        mock_query.stream.return_value = AsyncIterator([])
-
-        mock_collection = Mock()
-        mock_collection.where.return_value.order_by.return_value = mock_query
-        mock_db.collection.return_value = mock_collection
+        _stub_stream(mock_db, ("where", "order_by"), [])
 
         result = await firestore_client.get_all_versions("https://example.com/file")
 
@@ -2,36 +2,76 @@
 Unit tests for GCSClient
 """
 
+import asyncio
 import json
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock, patch
 
 import pytest
+from google.api_core.exceptions import NotFound
 
 from src.storage.gcs_client import GCSClient
 
+# JSON round-trip payloads, serialized once per module
+_JSON_OBJ = {"key": "value", "number": 123}
+_JSON_BYTES = json.dumps(_JSON_OBJ, separators=(",", ":")).encode("utf-8")
+_LARGE_JSON_OBJ = {"items": ["x" * 1024] * 1100}
+_LARGE_JSON_BYTES = json.dumps(_LARGE_JSON_OBJ).encode("utf-8")
 
-@pytest.fixture
-def mock_logger():
-    """Create mock logger"""
-    logger = Mock()
-    logger.info = Mock()
-    logger.debug = Mock()
-    logger.warning = Mock()
-    logger.error = Mock()
-    return logger
+# Errors raised by the mocked blob; each is used by a single test
+_UPLOAD_FAIL = Exception("Upload failed")
+_NOT_FOUND = Exception("File not found")
+_MISSING = NotFound("missing")
+_GCS_ERROR = Exception("GCS error")
 
 
-@pytest.fixture
-def mock_bucket():
-    """Create mock GCS bucket"""
+class _BufferOf:
+    """Matches a file object whose contents equal the expected bytes"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __eq__(self, other):
+        return other.getvalue() == self.data
+
+    def __repr__(self):
+        return f"_BufferOf({self.data!r})"
+
+
+@pytest.fixture(scope="module")
+def _shared_bucket():
+    """Mock GCS bucket shared by the module; mock_bucket resets it per test"""
     bucket = Mock()
     bucket.name = "test-bucket"
     return bucket
 
 
+@pytest.fixture
+def mock_bucket(_shared_bucket):
+    """Shared mock GCS bucket with no calls or stubs left from earlier tests"""
+    _shared_bucket.reset_mock(return_value=True, side_effect=True)
+    return _shared_bucket
+
+
+@pytest.fixture(scope="module")
+def _shared_blob():
+    """Mock GCS blob shared by the module, limited to the methods GCSClient calls"""
+    return Mock(spec_set=["upload_from_file", "download_as_bytes", "exists", "delete"])
+
+
+@pytest.fixture
+def mock_blob(_shared_blob, mock_bucket):
+    """Shared mock blob, cleared per test and returned by mock_bucket.blob"""
+    _shared_blob.reset_mock(return_value=True, side_effect=True)
+    mock_bucket.blob.return_value = _shared_blob
+    return _shared_blob
+
+
 @pytest.fixture
 def gcs_client(mock_logger, mock_bucket):
-    """Create GCSClient instance with mocked bucket"""
+    """Create GCSClient instance with mocked bucket
+
+    Kept per test: some tests replace methods on the instance.
+    """
     return GCSClient(mock_logger, bucket=mock_bucket)
 
 
@@ -49,108 +89,215 @@ class TestGCSClientInit:
         assert gcs_client.max_retries == 3
         assert gcs_client.retry_delay == 1.0
 
+    def test_init_reuses_shared_storage_client(self, mock_logger, mock_config):
+        """Test instances for the same project share one client and bucket"""
+        mock_config.gcs_bucket = "shared-bucket"
+        GCSClient.close_shared()
+
+        try:
+            with patch(
+                "src.storage.gcs_client.get_config", return_value=mock_config
+            ), patch("src.storage.gcs_client.storage.Client") as mock_storage_client:
+                first = GCSClient(mock_logger)
+                second = GCSClient(mock_logger)
+        finally:
+            GCSClient.close_shared()
+
+        assert first.bucket is second.bucket
+        mock_storage_client.assert_called_once_with(project="test-project")
+        mock_storage_client.return_value.bucket.assert_called_once_with("shared-bucket")
+
+    @pytest.mark.asyncio
+    async def test_blob_created_per_operation(self, gcs_client, mock_bucket, mock_blob):
+        """Test each operation gets a fresh blob (no stale generation reuse)"""
+        await gcs_client.file_exists("same/path.json")
+        await gcs_client.file_exists("same/path.json")
+
+        assert mock_bucket.blob.call_count == 2
+
+    def test_init_with_injected_bucket_skips_config(self, mock_logger, mock_bucket):
+        """Test an injected bucket does not read the configuration"""
+        with patch("src.storage.gcs_client.get_config") as mock_get_config:
+            GCSClient(mock_logger, bucket=mock_bucket)
+
+        mock_get_config.assert_not_called()
+
+    def test_executor_shared_across_instances(self, mock_logger, mock_bucket):
+        """Test every instance uses one dedicated GCS IO executor"""
+        first = GCSClient(mock_logger, bucket=mock_bucket)
+        second = GCSClient(mock_logger, bucket=mock_bucket)
+
+        assert first._executor is second._executor
+        assert first._executor._thread_name_prefix == "gcs-io"
+
 
 class TestGCSClientUploadData:
     """Tests for upload_data method"""
 
     @pytest.mark.asyncio
-    async def test_upload_json_data(self, gcs_client, mock_bucket):
+    async def test_upload_json_data(self, gcs_client, mock_bucket, mock_blob):
         """Test uploading JSON data"""
-        data = {"key": "value", "number": 123}
         path = "test/path/file.json"
 
-        mock_blob = Mock()
-        mock_blob.upload_from_string = Mock()
-        mock_bucket.blob.return_value = mock_blob
-
-        await gcs_client.upload_data(path, data)
+        await gcs_client.upload_data(path, _JSON_OBJ)
 
         # Verify blob was created with correct path
         mock_bucket.blob.assert_called_once_with(path)
 
-        # Verify upload was called with JSON string
-        args = mock_blob.upload_from_string.call_args
-        uploaded_data = args[0][0]
-        assert json.loads(uploaded_data) == data
+        # Verify upload was called with JSON bytes and explicit size
+        mock_blob.upload_from_file.assert_called_once_with(
+            _BufferOf(_JSON_BYTES),
+            size=len(_JSON_BYTES),
+            content_type="application/json",
+        )
 
     @pytest.mark.asyncio
-    async def test_upload_string_data(self, gcs_client, mock_bucket):
+    async def test_upload_string_data(self, gcs_client, mock_blob):
         """Test uploading string data"""
         data = "Plain text content"
         path = "test/path/file.txt"
 
-        mock_blob = Mock()
-        mock_blob.upload_from_string = Mock()
-        mock_bucket.blob.return_value = mock_blob
-
         await gcs_client.upload_data(path, data)
 
-        # Verify upload was called with string
-        args = mock_blob.upload_from_string.call_args
-        uploaded_data = args[0][0]
-        assert uploaded_data == data
+        # Verify upload was called with UTF-8 encoded string
+        encoded = data.encode("utf-8")
+        mock_blob.upload_from_file.assert_called_once_with(
+            _BufferOf(encoded), size=len(encoded), content_type="text/markdown"
+        )
 
     @pytest.mark.asyncio
-    async def test_upload_with_content_type(self, gcs_client, mock_bucket):
+    async def test_upload_with_content_type(self, gcs_client, mock_blob):
         """Test upload sets correct content type"""
-        mock_blob = Mock()
-        mock_blob.upload_from_string = Mock()
-        mock_bucket.blob.return_value = mock_blob
-
         await gcs_client.upload_data("file.json", {"test": "data"})
 
         # Verify content_type was set
-        args = mock_blob.upload_from_string.call_args
-        assert args[1]["content_type"] == "application/json"
+        mock_blob.upload_from_file.assert_called_once_with(
+            ANY, size=ANY, content_type="application/json"
+        )
+
+    @pytest.mark.asyncio
+    async def test_upload_json_compact_by_default(self, gcs_client, mock_blob):
+        """Test JSON is uploaded without indentation unless pretty is set"""
+        await gcs_client.upload_data("compact.json", {"a": 1, "b": [1, 2]})
+        await gcs_client.upload_data("pretty.json", {"a": 1, "b": [1, 2]}, pretty=True)
+
+        compact = mock_blob.upload_from_file.call_args_list[0][0][0].getvalue()
+        pretty = mock_blob.upload_from_file.call_args_list[1][0][0].getvalue()
+        assert b"\n" not in compact
+        assert b"\n" in pretty
+        assert json.loads(compact) == json.loads(pretty)
 
     @pytest.mark.asyncio
-    async def test_upload_failure(self, gcs_client, mock_bucket):
+    async def test_upload_json_japanese_as_utf8(self, gcs_client, mock_blob):
+        """Test non-ASCII text is uploaded as raw UTF-8 without escapes"""
+        await gcs_client.upload_data("ja.json", {"category": "要件定義"})
+
+        uploaded_data = mock_blob.upload_from_file.call_args[0][0].getvalue()
+        assert "要件定義".encode("utf-8") in uploaded_data
+        assert b"\\u" not in uploaded_data
+
+    @pytest.mark.asyncio
+    async def test_upload_failure(self, gcs_client, mock_blob):
         """Test upload raises exception on failure"""
-        mock_blob = Mock()
-        mock_blob.upload_from_string = Mock(side_effect=Exception("Upload failed"))
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.upload_from_file.side_effect = _UPLOAD_FAIL
 
         with pytest.raises(Exception, match="Upload failed"):
             await gcs_client.upload_data("test.json", {"data": "test"})
 
 
+class TestGCSClientUploadMany:
+    """Tests for upload_many method"""
+
+    @pytest.mark.asyncio
+    async def test_upload_many_returns_uris_in_order(
+        self, gcs_client, mock_bucket, mock_blob
+    ):
+        """Test uploading multiple items returns URIs in input order"""
+        result = await gcs_client.upload_many(
+            [("a.json", {"a": 1}), ("b.md", "# B"), ("c.json", {"c": 3})]
+        )
+
+        assert result == [
+            "gs://test-bucket/a.json",
+            "gs://test-bucket/b.md",
+            "gs://test-bucket/c.json",
+        ]
+        assert mock_bucket.blob.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_upload_many_limits_concurrency(self, gcs_client):
+        """Test no more than max_concurrency uploads run at once"""
+        active = 0
+        peak = 0
+
+        async def fake_upload(path, data):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return f"gs://test-bucket/{path}"
+
+        gcs_client.upload_data = fake_upload
+
+        result = await gcs_client.upload_many(
+            [(f"{i}.json", {"i": i}) for i in range(10)], max_concurrency=2
+        )
+
+        assert len(result) == 10
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_upload_many_rejects_non_positive_concurrency(
+        self, gcs_client, mock_bucket, max_concurrency
+    ):
+        """Test max_concurrency below 1 raises instead of using the default"""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await gcs_client.upload_many(
+                [("a.json", {"a": 1})], max_concurrency=max_concurrency
+            )
+
+        mock_bucket.blob.assert_not_called()
+
+
 class TestGCSClientDownloadData:
     """Tests for download_data method"""
 
     @pytest.mark.asyncio
-    async def test_download_json_data(self, gcs_client, mock_bucket):
+    async def test_download_json_data(self, gcs_client, mock_blob):
         """Test downloading JSON data"""
-        test_data = {"key": "value"}
-        json_string = json.dumps(test_data)
-
-        mock_blob = Mock()
-        mock_blob.download_as_bytes = Mock(return_value=json_string.encode("utf-8"))
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.download_as_bytes.return_value = _JSON_BYTES
 
         result = await gcs_client.download_data("test/file.json")
 
-        assert result == test_data
+        assert result == _JSON_OBJ
         mock_blob.download_as_bytes.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_download_text_data(self, gcs_client, mock_bucket):
+    async def test_download_large_json_data(self, gcs_client, mock_blob):
+        """Test downloading JSON larger than the inline parse threshold"""
+        mock_blob.download_as_bytes.return_value = _LARGE_JSON_BYTES
+
+        result = await gcs_client.download_data("test/large.json")
+
+        assert result == _LARGE_JSON_OBJ
+
+    @pytest.mark.asyncio
+    async def test_download_text_data(self, gcs_client, mock_blob):
         """Test downloading text data"""
         text_data = "Plain text content"
 
-        mock_blob = Mock()
-        mock_blob.download_as_bytes = Mock(return_value=text_data.encode("utf-8"))
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.download_as_bytes.return_value = text_data.encode("utf-8")
 
         result = await gcs_client.download_data("test/file.txt", as_json=False)
 
         assert result == text_data
 
     @pytest.mark.asyncio
-    async def test_download_nonexistent_file(self, gcs_client, mock_bucket):
+    async def test_download_nonexistent_file(self, gcs_client, mock_blob):
         """Test downloading nonexistent file"""
-        mock_blob = Mock()
-        mock_blob.download_as_bytes = Mock(side_effect=Exception("File not found"))
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.download_as_bytes.side_effect = _NOT_FOUND
 
         with pytest.raises(Exception):
             await gcs_client.download_data("nonexistent.json")
@@ -160,38 +307,77 @@ class TestGCSClientFileExists:
     """Tests for file_exists method"""
 
     @pytest.mark.asyncio
-    async def test_file_exists_true(self, gcs_client, mock_bucket):
+    async def test_file_exists_true(self, gcs_client, mock_blob):
         """Test file exists returns True"""
-        mock_blob = Mock()
-        mock_blob.exists = Mock(return_value=True)
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.exists.return_value = True
 
         result = await gcs_client.file_exists("existing_file.json")
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_file_exists_false(self, gcs_client, mock_bucket):
+    async def test_file_exists_false(self, gcs_client, mock_blob):
         """Test file exists returns False"""
-        mock_blob = Mock()
-        mock_blob.exists = Mock(return_value=False)
-        mock_bucket.blob.return_value = mock_blob
+        mock_blob.exists.return_value = False
 
         result = await gcs_client.file_exists("nonexistent.json")
 
         assert result is False
 
 
+class TestGCSClientTryDownload:
+    """Tests for try_download method"""
+
+    @pytest.mark.asyncio
+    async def test_try_download_hit(self, gcs_client, mock_blob):
+        """Test try_download returns bytes in a single request"""
+        mock_blob.download_as_bytes.return_value = b'{"a": 1}'
+
+        ok, data = await gcs_client.try_download("existing_file.json")
+
+        assert ok is True
+        assert data == b'{"a": 1}'
+        mock_blob.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_try_download_miss(self, gcs_client, mock_blob):
+        """Test try_download returns (False, None) on 404"""
+        mock_blob.download_as_bytes.side_effect = _MISSING
+
+        ok, data = await gcs_client.try_download("nonexistent.json")
+
+        assert ok is False
+        assert data is None
+
+    @pytest.mark.asyncio
+    async def test_try_download_other_error_raises(self, gcs_client, mock_blob):
+        """Test try_download re-raises non-404 errors"""
+        mock_blob.download_as_bytes.side_effect = _GCS_ERROR
+
+        with pytest.raises(Exception, match="GCS error"):
+            await gcs_client.try_download("broken.json")
+
+
 class TestGCSClientDeleteFile:
     """Tests for delete_file method"""
 
     @pytest.mark.asyncio
-    async def test_delete_file(self, gcs_client, mock_bucket):
+    async def test_delete_file(self, gcs_client, mock_blob):
         """Test deleting file"""
-        mock_blob = Mock()
-        mock_blob.delete = Mock()
-        mock_bucket.blob.return_value = mock_blob
-
         await gcs_client.delete_file("file_to_delete.json")
 
         mock_blob.delete.assert_called_once()
+
+
+class TestGCSClientClose:
+    """Tests for close_shared method"""
+
+    def test_close_shared_shuts_down_executor(self, gcs_client):
+        """Test close_shared shuts the executor down and a new one is created"""
+        executor = gcs_client._executor
+
+        GCSClient.close_shared()
+
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+        assert gcs_client._executor is not executor
@@ -2,27 +2,81 @@
 Unit tests for StorageManager
 """
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 
 from src.models.metadata import FileMetadata
 from src.storage import StorageManager
 
+# Errors raised by the stubbed clients; each is used by a single test
+_DOWNLOAD_FAIL = Exception("Download failed")
+_METADATA_FAIL = Exception("Metadata retrieval failed")
+
+# Metadata StorageManager only reads: validated once, variants via model_copy
+_METADATA = FileMetadata(
+    id="meta",
+    source_file_name="test.json",
+    parent_url="https://example.com",
+    file_url="https://example.com/file",
+    file_name="test",
+    version=1,
+    format="json",
+    gcs_path="path/to/file.json",
+)
+_MARKDOWN_METADATA = _METADATA.model_copy(
+    update={
+        "source_file_name": "test.md",
+        "format": "markdown",
+        "gcs_path": "path/to/file.md",
+    }
+)
+_V2_METADATA = _METADATA.model_copy(
+    update={"version": 2, "gcs_path": "path/to/file/v2.json"}
+)
+
+
+def _acoro(value=None, exc=None):
+    """Plain coroutine stub for calls whose arguments are not asserted"""
+
+    async def _stub(*args, **kwargs):
+        if exc is not None:
+            raise exc
+        return value
+
+    return _stub
+
+
+@pytest.fixture(scope="module")
+def mock_firestore_client():
+    """Mock Firestore client shared by the module"""
+    return Mock()
 
-@pytest.fixture
-def mock_clients(mock_logger):
-    """Create mock Firestore and GCS clients"""
-    firestore = Mock()
-    gcs = Mock()
-    return firestore, gcs, mock_logger
+
+@pytest.fixture(scope="module")
+def mock_gcs_client():
+    """Mock GCS client shared by the module"""
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients(mock_firestore_client, mock_gcs_client):
+    """Start every test with no calls or stubs left on the shared clients"""
+    mock_firestore_client.reset_mock(return_value=True, side_effect=True)
+    mock_gcs_client.reset_mock(return_value=True, side_effect=True)
+    yield
 
 
 @pytest.fixture
-def storage_manager(mock_clients):
-    """Create StorageManager with mocks"""
-    firestore, gcs, logger = mock_clients
-    return StorageManager(firestore, gcs, logger)
+def mock_clients(mock_firestore_client, mock_gcs_client, mock_logger):
+    """Mock Firestore and GCS clients plus the shared logger"""
+    return mock_firestore_client, mock_gcs_client, mock_logger
+
+
+@pytest.fixture(scope="module")
+def storage_manager(mock_firestore_client, mock_gcs_client, mock_logger):
+    """StorageManager over the shared mocks (holds no per-test state)"""
+    return StorageManager(mock_firestore_client, mock_gcs_client, mock_logger)
 
 
 class TestStorageManager:
@@ -33,9 +87,9 @@ class TestStorageManager:
         """Test saving data for new file (version 1)"""
         firestore, gcs, _ = mock_clients
 
-        # Mock get_latest_metadata returns None (no existing versions)
-        firestore.get_latest_metadata = AsyncMock(return_value=None)
-        firestore.save_metadata = AsyncMock(return_value=Mock(metadata_id="meta123"))
+        # Mock get_latest_version_number returns 0 (no existing versions)
+        firestore.get_latest_version_number = _acoro(0)
+        firestore.save_metadata = _acoro("meta123")
         gcs.upload_data = AsyncMock()
 
         result = await storage_manager.save_data(
@@ -55,19 +109,9 @@ class TestStorageManager:
         firestore, gcs, _ = mock_clients
 
         # Mock existing version 2
-        existing_metadata = FileMetadata(
-            id="old",
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=2,
-            format="json",
-            gcs_path="old/path",
-        )
-        firestore.get_latest_metadata = AsyncMock(return_value=existing_metadata)
-        firestore.save_metadata = AsyncMock(return_value=Mock(metadata_id="meta456"))
-        gcs.upload_data = AsyncMock()
+        firestore.get_latest_version_number = _acoro(2)
+        firestore.save_metadata = _acoro("meta456")
+        gcs.upload_data = _acoro("gs://test-bucket/test")
 
         result = await storage_manager.save_data(
             parent_url="https://example.com",
@@ -84,17 +128,8 @@ class TestStorageManager:
         """Test getting latest version"""
         firestore, _, _ = mock_clients
 
-        metadata = FileMetadata(
-            id="meta",
-            source_file_name="file.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="file",
-            version=5,
-            format="json",
-            gcs_path="path",
-        )
-        firestore.get_latest_metadata = AsyncMock(return_value=metadata)
+        metadata = _METADATA.model_copy(update={"version": 5})
+        firestore.get_latest_metadata = _acoro(metadata)
 
         result = await storage_manager.get_latest_version("file_url")
         assert result.version == 5
@@ -103,7 +138,7 @@ class TestStorageManager:
     async def test_get_latest_version_not_found(self, storage_manager, mock_clients):
         """Test getting latest version when not found"""
         firestore, _, _ = mock_clients
-        firestore.get_latest_metadata = AsyncMock(return_value=None)
+        firestore.get_latest_metadata = _acoro(None)
 
         result = await storage_manager.get_latest_version(
             "https://example.com/notfound"
@@ -115,42 +150,13 @@ class TestStorageManager:
 class TestStorageManagerGetData:
     """Tests for get_data method"""
 
-    @pytest.fixture
-    def mock_firestore_client(self):
-        return Mock()
-
-    @pytest.fixture
-    def mock_gcs_client(self):
-        return Mock()
-
-    @pytest.fixture
-    def mock_logger(self):
-        logger = Mock()
-        logger.info = Mock()
-        logger.error = Mock()
-        return logger
-
-    @pytest.fixture
-    def storage_manager(self, mock_firestore_client, mock_gcs_client, mock_logger):
-        return StorageManager(mock_firestore_client, mock_gcs_client, mock_logger)
-
     @pytest.mark.asyncio
     async def test_get_json_data(self, storage_manager, mock_gcs_client):
         """Test getting JSON data"""
-        metadata = FileMetadata(
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=1,
-            format="json",
-            gcs_path="path/to/file.json",
-        )
-
         expected_data = {"key": "value"}
         mock_gcs_client.download_data = AsyncMock(return_value=expected_data)
 
-        result = await storage_manager.get_data(metadata)
+        result = await storage_manager.get_data(_METADATA)
 
         assert result == expected_data
         mock_gcs_client.download_data.assert_called_once_with(
@@ -160,20 +166,10 @@ class TestStorageManagerGetData:
     @pytest.mark.asyncio
     async def test_get_markdown_data(self, storage_manager, mock_gcs_client):
         """Test getting Markdown data"""
-        metadata = FileMetadata(
-            source_file_name="test.md",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=1,
-            format="markdown",
-            gcs_path="path/to/file.md",
-        )
-
         expected_data = "# Markdown content"
         mock_gcs_client.download_data = AsyncMock(return_value=expected_data)
 
-        result = await storage_manager.get_data(metadata)
+        result = await storage_manager.get_data(_MARKDOWN_METADATA)
 
         assert result == expected_data
         mock_gcs_client.download_data.assert_called_once_with(
@@ -183,80 +179,45 @@ class TestStorageManagerGetData:
     @pytest.mark.asyncio
     async def test_get_data_failure(self, storage_manager, mock_gcs_client):
         """Test get_data raises exception on failure"""
-        metadata = FileMetadata(
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=1,
-            format="json",
-            gcs_path="path/to/file.json",
-        )
-
-        mock_gcs_client.download_data = AsyncMock(
-            side_effect=Exception("Download failed")
-        )
+        mock_gcs_client.download_data = _acoro(exc=_DOWNLOAD_FAIL)
 
         with pytest.raises(Exception, match="Download failed"):
-            await storage_manager.get_data(metadata)
+            await storage_manager.get_data(_METADATA)
 
 
 class TestStorageManagerGetDataByVersion:
     """Tests for get_data_by_version method"""
 
-    @pytest.fixture
-    def mock_firestore_client(self):
-        return Mock()
-
-    @pytest.fixture
-    def mock_gcs_client(self):
-        return Mock()
-
-    @pytest.fixture
-    def mock_logger(self):
-        logger = Mock()
-        logger.info = Mock()
-        logger.error = Mock()
-        return logger
-
-    @pytest.fixture
-    def storage_manager(self, mock_firestore_client, mock_gcs_client, mock_logger):
-        return StorageManager(mock_firestore_client, mock_gcs_client, mock_logger)
-
     @pytest.mark.asyncio
     async def test_get_data_by_version_found(
         self, storage_manager, mock_firestore_client, mock_gcs_client
     ):
         """Test getting data by specific version"""
-        metadata = FileMetadata(
-            source_file_name="test.json",
-            parent_url="https://example.com",
-            file_url="https://example.com/file",
-            file_name="test",
-            version=2,
-            format="json",
-            gcs_path="path/to/file/v2.json",
-        )
-
         expected_data = {"version": 2, "data": "test"}
-        mock_firestore_client.get_metadata_by_version = AsyncMock(return_value=metadata)
-        mock_gcs_client.download_data = AsyncMock(return_value=expected_data)
+
+        # One parent records both clients' calls in order
+        calls = Mock()
+        calls.attach_mock(AsyncMock(return_value=_V2_METADATA), "fs")
+        calls.attach_mock(AsyncMock(return_value=expected_data), "gcs")
+        mock_firestore_client.get_metadata_by_version = calls.fs
+        mock_gcs_client.download_data = calls.gcs
 
         result = await storage_manager.get_data_by_version(
             "https://example.com/file", 2
         )
 
         assert result == expected_data
-        mock_firestore_client.get_metadata_by_version.assert_called_once_with(
-            "https://example.com/file", 2
-        )
+        assert calls.mock_calls == [
+            call.fs("https://example.com/file", 2),
+            call.gcs("path/to/file/v2.json", as_json=True),
+        ]
 
     @pytest.mark.asyncio
     async def test_get_data_by_version_not_found(
         self, storage_manager, mock_firestore_client
     ):
         """Test getting data by version when version doesn't exist"""
-        mock_firestore_client.get_metadata_by_version = AsyncMock(return_value=None)
+        mock_firestore_client.get_metadata_by_version = _acoro(None)
 
         result = await storage_manager.get_data_by_version(
             "https://example.com/file", 99
@@ -269,9 +230,7 @@ class TestStorageManagerGetDataByVersion:
         self, storage_manager, mock_firestore_client
     ):
         """Test get_data_by_version raises exception on failure"""
-        mock_firestore_client.get_metadata_by_version = AsyncMock(
-            side_effect=Exception("Metadata retrieval failed")
-        )
+        mock_firestore_client.get_metadata_by_version = _acoro(exc=_METADATA_FAIL)
 
         with pytest.raises(Exception, match="Metadata retrieval failed"):
             await storage_manager.get_data_by_version("https://example.com/file", 1)
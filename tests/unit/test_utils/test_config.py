@@ -0,0 +1,67 @@
+"""
+Unit tests for Config
+"""
+
+import dataclasses
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.config import Config, get_config
+
+
+class TestConfig:
+    """Tests for Config"""
+
+    def test_from_env_reads_environment(self):
+        """Test settings are read from environment variables"""
+        env = {
+            "GCP_PROJECT_ID": "env-project",
+            "GCS_BUCKET": "env-bucket",
+            "GCS_IO_WORKERS": "8",
+            "GCS_MAX_CONCURRENCY": "4",
+            "API_TIMEOUT": "10",
+        }
+        with patch.dict(os.environ, env):
+            config = Config.from_env()
+
+        assert config.gcp_project_id == "env-project"
+        assert config.gcs_bucket == "env-bucket"
+        assert config.gcs_io_workers == 8
+        assert config.gcs_max_concurrency == 4
+        assert config.api_timeout == 10
+
+    def test_config_is_frozen(self):
+        """Test config instances cannot be modified"""
+        config = Config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.gcp_project_id = "changed"
+
+    def test_repr_hides_api_keys(self):
+        """Test API keys are excluded from the config repr"""
+        config = Config(
+            backlog_api_key="backlog-secret", notion_api_key="notion-secret"
+        )
+        assert "backlog-secret" not in repr(config)
+        assert "notion-secret" not in repr(config)
+
+    def test_get_gcs_path_format(self):
+        """Test GCS path uses a stable 16-hex-char URL hash"""
+        config = Config()
+        path = config.get_gcs_path("https://example.com/file", 3)
+
+        prefix, url_hash, version = path.split("/")
+        assert prefix == "templates"
+        assert len(url_hash) == 16
+        assert version == "v3"
+        assert config.get_gcs_path("https://example.com/file", 3) == path
+        assert config.get_gcs_path("https://example.com/other", 3) != path
+
+
+class TestGetConfig:
+    """Tests for get_config"""
+
+    def test_get_config_returns_shared_instance(self):
+        """Test get_config returns the same instance every call"""
+        assert get_config() is get_config()
@@ -3,12 +3,20 @@ Unit tests for Logger
 """
 
 import logging
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import pytest
 
 from src.utils.logger import Logger, get_logger
 
 
+@pytest.fixture(scope="module")
+def logger():
+    """Logger shared by tests that neither rename it nor change its level"""
+    return Logger(request_id="req-shared")
+
+
 class TestLoggerInit:
     """Tests for Logger initialization"""
 
@@ -26,42 +34,46 @@ class TestLoggerInit:
 
     def test_init_configures_handler(self):
         """Test that initialization configures stream handler"""
+        # The patch must end inside the test body: pytest's logging plugin
+        # calls logging.getLogger() around each phase, including teardown.
         with patch("logging.getLogger") as mock_get_logger:
-            mock_logger = Mock()
-            mock_logger.handlers = []
+            mock_logger = Mock(handlers=[])
             mock_get_logger.return_value = mock_logger
 
-            logger = Logger(request_id="test-789")
+            Logger(request_id="test-789")
 
-            # Verify handler was added
-            assert mock_logger.addHandler.called
-            mock_logger.setLevel.assert_called_with(logging.INFO)
+        # Verify handler was added
+        assert mock_logger.addHandler.called
+        mock_logger.setLevel.assert_called_with(logging.INFO)
 
 
 class TestLoggerFormatLog:
     """Tests for _format_log method"""
 
-    def test_format_log_basic(self):
+    def test_format_log_basic(self, logger):
         """Test basic log formatting"""
-        logger = Logger(request_id="req-001")
         log_data = logger._format_log("Test message")
 
         assert log_data["message"] == "Test message"
-        assert log_data["request_id"] == "req-001"
+        assert log_data["request_id"] == "req-shared"
         assert "timestamp" in log_data
 
-    def test_format_log_with_kwargs(self):
+    def test_format_log_timestamp_has_no_utc_offset(self, logger):
+        """Test the timestamp keeps the naive UTC ISO format"""
+        log_data = logger._format_log("Test message")
+
+        assert datetime.fromisoformat(log_data["timestamp"]).tzinfo is None
+
+    def test_format_log_with_kwargs(self, logger):
         """Test log formatting with additional fields"""
-        logger = Logger(request_id="req-002")
         log_data = logger._format_log("Test", user_id=123, action="login")
 
         assert log_data["message"] == "Test"
         assert log_data["user_id"] == 123
         assert log_data["action"] == "login"
 
-    def test_format_log_filters_sensitive_data(self):
+    def test_format_log_filters_sensitive_data(self, logger):
         """Test that sensitive data is filtered out"""
-        logger = Logger(request_id="req-003")
         log_data = logger._format_log(
             "Login attempt",
             username="user123",
@@ -77,47 +89,66 @@ class TestLoggerFormatLog:
         assert "token" not in log_data
         assert "secret" not in log_data
 
+    def test_format_log_filters_sensitive_data_case_insensitive(self, logger):
+        """Test that sensitive keys are filtered regardless of case"""
+        log_data = logger._format_log("Login", API_KEY="key123", Token="token123")
+
+        assert "API_KEY" not in log_data
+        assert "Token" not in log_data
+
 
 class TestLoggerInfoMethod:
     """Tests for info logging method"""
 
-    def test_info_logs_message(self):
+    def test_info_logs_message(self, logger):
         """Test info logging"""
-        logger = Logger(request_id="req-004")
 
-        with patch.object(logger.logger, "info") as mock_info:
+        with patch.object(logger.logger, "log") as mock_log:
             logger.info("Info message", key="value")
 
-            mock_info.assert_called_once()
-            call_args = mock_info.call_args[0][0]
+            mock_log.assert_called_once()
+            assert mock_log.call_args[0][0] == logging.INFO
+            call_args = mock_log.call_args[0][1]
             assert call_args["message"] == "Info message"
             assert call_args["key"] == "value"
 
+    def test_info_skipped_when_level_disabled(self):
+        """Test info does not build a record when INFO is disabled"""
+        logger = Logger(request_id="req-012", name="info-disabled")
+        logger.logger.setLevel(logging.WARNING)
+
+        with patch.object(logger.logger, "log") as mock_log, patch.object(
+            logger, "_format_log"
+        ) as mock_format:
+            logger.info("Info message")
+
+        mock_log.assert_not_called()
+        mock_format.assert_not_called()
+
 
 class TestLoggerErrorMethod:
     """Tests for error logging method"""
 
-    def test_error_logs_message(self):
+    def test_error_logs_message(self, logger):
         """Test error logging without exception"""
-        logger = Logger(request_id="req-005")
 
-        with patch.object(logger.logger, "error") as mock_error:
+        with patch.object(logger.logger, "log") as mock_log:
             logger.error("Error message", key="value")
 
-            mock_error.assert_called_once()
-            call_args = mock_error.call_args[0][0]
+            mock_log.assert_called_once()
+            assert mock_log.call_args[0][0] == logging.ERROR
+            call_args = mock_log.call_args[0][1]
             assert call_args["message"] == "Error message"
             assert call_args["key"] == "value"
 
-    def test_error_logs_with_exception(self):
+    def test_error_logs_with_exception(self, logger):
         """Test error logging with exception"""
-        logger = Logger(request_id="req-006")
 
-        with patch.object(logger.logger, "error") as mock_error:
+        with patch.object(logger.logger, "log") as mock_log:
             test_exception = ValueError("Test error")
             logger.error("Error occurred", error=test_exception)
 
-            call_args = mock_error.call_args[0][0]
+            call_args = mock_log.call_args[0][1]
             assert call_args["message"] == "Error occurred"
             assert call_args["error_type"] == "ValueError"
             assert call_args["error_message"] == "Test error"
@@ -126,15 +157,15 @@ class TestLoggerErrorMethod:
 class TestLoggerWarningMethod:
     """Tests for warning logging method"""
 
-    def test_warning_logs_message(self):
+    def test_warning_logs_message(self, logger):
         """Test warning logging"""
-        logger = Logger(request_id="req-007")
 
-        with patch.object(logger.logger, "warning") as mock_warning:
+        with patch.object(logger.logger, "log") as mock_log:
             logger.warning("Warning message", severity="medium")
 
-            mock_warning.assert_called_once()
-            call_args = mock_warning.call_args[0][0]
+            mock_log.assert_called_once()
+            assert mock_log.call_args[0][0] == logging.WARNING
+            call_args = mock_log.call_args[0][1]
             assert call_args["message"] == "Warning message"
             assert call_args["severity"] == "medium"
 
@@ -144,16 +175,42 @@ class TestLoggerDebugMethod:
 
     def test_debug_logs_message(self):
         """Test debug logging"""
-        logger = Logger(request_id="req-008")
+        logger = Logger(request_id="req-008", name="debug-enabled")
+        logger.logger.setLevel(logging.DEBUG)
 
-        with patch.object(logger.logger, "debug") as mock_debug:
+        with patch.object(logger.logger, "log") as mock_log:
             logger.debug("Debug message", detail="test")
 
-            mock_debug.assert_called_once()
-            call_args = mock_debug.call_args[0][0]
+            mock_log.assert_called_once()
+            assert mock_log.call_args[0][0] == logging.DEBUG
+            call_args = mock_log.call_args[0][1]
             assert call_args["message"] == "Debug message"
             assert call_args["detail"] == "test"
 
+    def test_debug_skipped_at_default_level(self):
+        """Test debug does not build a record at the default INFO level"""
+        logger = Logger(request_id="req-013", name="debug-disabled")
+
+        with patch.object(logger.logger, "log") as mock_log, patch.object(
+            logger, "_format_log"
+        ) as mock_format:
+            logger.debug("Debug message", detail="test")
+
+        mock_log.assert_not_called()
+        mock_format.assert_not_called()
+
+
+class TestLoggerIsEnabledFor:
+    """Tests for isEnabledFor method"""
+
+    def test_is_enabled_for_delegates_to_logger(self):
+        """Test isEnabledFor reflects the underlying logger level"""
+        logger = Logger(request_id="req-011", name="level-check")
+        logger.logger.setLevel(logging.INFO)
+
+        assert logger.isEnabledFor(logging.INFO) is True
+        assert logger.isEnabledFor(logging.DEBUG) is False
+
 
 class TestGetLogger:
     """Tests for get_logger factory function"""
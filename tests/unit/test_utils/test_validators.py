@@ -4,139 +4,169 @@ Unit tests for validators module
 
 import pytest
 
-from src.utils.validators import (validate_backlog_url, validate_notion_url,
-                                  validate_project_key, validate_url)
+from src.utils.validators import (
+    is_backlog_url,
+    is_notion_url,
+    validate_backlog_url,
+    validate_notion_url,
+    validate_project_key,
+    validate_url,
+)
 
 
 class TestValidateUrl:
     """Tests for validate_url function"""
 
-    def test_valid_https_url(self):
-        """Test valid HTTPS URL"""
-        assert validate_url("https://example.com") is True
-
-    def test_valid_http_url(self):
-        """Test valid HTTP URL"""
-        assert validate_url("http://example.com") is True
-
-    def test_url_with_path(self):
-        """Test URL with path"""
-        assert validate_url("https://example.com/path/to/page") is True
-
-    def test_url_with_query(self):
-        """Test URL with query parameters"""
-        assert validate_url("https://example.com?param=value") is True
-
-    def test_invalid_url_no_scheme(self):
-        """Test invalid URL without scheme"""
-        with pytest.raises(ValueError):
-            validate_url("example.com")
-
-    def test_invalid_url_empty(self):
-        """Test empty URL"""
-        with pytest.raises(ValueError):
-            validate_url("")
-
-    def test_invalid_url_malformed(self):
-        """Test malformed URL"""
-        with pytest.raises(ValueError):
-            validate_url("not a url")
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("https://example.com", id="https"),
+            pytest.param("http://example.com", id="http"),
+            pytest.param("https://example.com/path/to/page", id="with_path"),
+            pytest.param("https://example.com?param=value", id="with_query"),
+            pytest.param("HTTPS://example.com", id="uppercase_scheme"),
+        ],
+    )
+    def test_valid(self, url):
+        """Test valid HTTP(S) URLs are accepted"""
+        assert validate_url(url) is True
+
+    @pytest.mark.parametrize(
+        "url, match",
+        [
+            pytest.param("example.com", "URLの形式が無効です", id="no_scheme"),
+            pytest.param("", "URLが空です", id="empty"),
+            pytest.param("not a url", "URLの形式が無効です", id="malformed"),
+            pytest.param("https://", "URLの形式が無効です", id="missing_host"),
+            pytest.param(
+                "ftp://example.com",
+                "HTTP/HTTPSスキームが必要です",
+                id="unsupported_scheme",
+            ),
+        ],
+    )
+    def test_invalid(self, url, match):
+        """Test invalid URLs raise ValueError"""
+        with pytest.raises(ValueError, match=match):
+            validate_url(url)
 
 
 class TestValidateBacklogUrl:
     """Tests for validate_backlog_url function"""
 
-    def test_valid_backlog_url(self):
-        """Test valid Backlog URL"""
-        url = "https://example.backlog.com/view/PROJ-123"
-        assert validate_backlog_url(url) is True
-
-    def test_valid_backlog_url_jp(self):
-        """Test valid Backlog JP URL"""
-        url = "https://example.backlog.jp/view/PROJ-456"
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("https://example.backlog.com/view/PROJ-123", id="com"),
+            pytest.param("https://example.backlog.jp/view/PROJ-456", id="jp"),
+            pytest.param("https://example.backlog.com/wiki/PROJ", id="other_path"),
+        ],
+    )
+    def test_valid(self, url):
+        """Test valid Backlog URLs are accepted"""
         assert validate_backlog_url(url) is True
 
-    def test_backlog_url_with_different_path(self):
-        """Test Backlog URL with different path"""
-        url = "https://example.backlog.com/wiki/PROJ"
-        assert validate_backlog_url(url) is True
-
-    def test_invalid_backlog_url_wrong_domain(self):
-        """Test non-Backlog URL"""
-        url = "https://example.com/view/PROJ-123"
-        with pytest.raises(ValueError):
+    @pytest.mark.parametrize(
+        "url, match",
+        [
+            pytest.param(
+                "https://example.com/view/PROJ-123",
+                "BacklogのURLを指定してください",
+                id="wrong_domain",
+            ),
+            pytest.param("", "URLが空です", id="empty"),
+            pytest.param(None, "URLが空です", id="none"),
+        ],
+    )
+    def test_invalid(self, url, match):
+        """Test non-Backlog URLs raise ValueError"""
+        with pytest.raises(ValueError, match=match):
             validate_backlog_url(url)
 
-    def test_invalid_backlog_url_empty(self):
-        """Test empty URL"""
-        with pytest.raises(ValueError):
-            validate_backlog_url("")
-
 
 class TestValidateNotionUrl:
     """Tests for validate_notion_url function"""
 
-    def test_valid_notion_url_with_id(self):
-        """Test valid Notion URL with page ID"""
-        url = "https://www.notion.so/workspace/Page-Title-abc123def456"
-        assert validate_notion_url(url) is True
-
-    def test_valid_notion_url_short(self):
-        """Test valid short Notion URL"""
-        url = "https://notion.so/abc123def456"
-        assert validate_notion_url(url) is True
-
-    def test_notion_url_with_uuid(self):
-        """Test Notion URL with UUID format"""
-        url = "https://www.notion.so/12345678-1234-1234-1234-123456789abc"
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param(
+                "https://www.notion.so/workspace/Page-Title-abc123def456",
+                id="with_id",
+            ),
+            pytest.param("https://notion.so/abc123def456", id="short"),
+            pytest.param(
+                "https://www.notion.so/12345678-1234-1234-1234-123456789abc",
+                id="uuid",
+            ),
+        ],
+    )
+    def test_valid(self, url):
+        """Test valid Notion URLs are accepted"""
         assert validate_notion_url(url) is True
 
-    def test_invalid_notion_url_wrong_domain(self):
-        """Test non-Notion URL"""
-        url = "https://example.com/page"
-        with pytest.raises(ValueError):
+    @pytest.mark.parametrize(
+        "url, match",
+        [
+            pytest.param(
+                "https://example.com/page",
+                "NotionのURLを指定してください",
+                id="wrong_domain",
+            ),
+            pytest.param("", "URLが空です", id="empty"),
+            pytest.param(None, "URLが空です", id="none"),
+        ],
+    )
+    def test_invalid(self, url, match):
+        """Test non-Notion URLs raise ValueError"""
+        with pytest.raises(ValueError, match=match):
             validate_notion_url(url)
 
-    def test_invalid_notion_url_empty(self):
-        """Test empty URL"""
-        with pytest.raises(ValueError):
-            validate_notion_url("")
-
 
 class TestValidateProjectKey:
     """Tests for validate_project_key function"""
 
-    def test_valid_project_key_uppercase(self):
-        """Test valid uppercase project key"""
-        assert validate_project_key("PROJ") is True
-
-    def test_valid_project_key_mixed_case(self):
-        """Test valid mixed case project key"""
-        assert validate_project_key("Project") is True
-
-    def test_valid_project_key_with_numbers(self):
-        """Test valid project key with numbers"""
-        assert validate_project_key("PROJ123") is True
+    @pytest.mark.parametrize(
+        "key",
+        [
+            pytest.param("PROJ", id="uppercase"),
+            pytest.param("Project", id="mixed_case"),
+            pytest.param("PROJ123", id="with_numbers"),
+            pytest.param("P", id="single_char"),
+            pytest.param("P" * 51, id="long"),
+        ],
+    )
+    def test_valid(self, key):
+        """Test valid project keys are accepted"""
+        assert validate_project_key(key) is True
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            pytest.param("PROJ KEY", id="with_spaces"),
+            pytest.param("PROJ@123", id="with_symbols"),
+            pytest.param("PROJ\n", id="trailing_newline"),
+            pytest.param("PROJß", id="non_ascii"),
+            pytest.param("", id="empty"),
+        ],
+    )
+    def test_invalid(self, key):
+        """Test malformed project keys raise ValueError"""
+        with pytest.raises(ValueError):
+            validate_project_key(key)
 
-    def test_valid_project_key_single_char(self):
-        """Test valid single character project key"""
-        assert validate_project_key("P") is True
 
-    def test_valid_project_key_long(self):
-        """Test valid long project key"""
-        assert validate_project_key("P" * 51) is True
+class TestIsServiceUrl:
+    """Tests for is_backlog_url / is_notion_url functions"""
 
-    def test_invalid_project_key_with_spaces(self):
-        """Test project key with spaces"""
-        with pytest.raises(ValueError):
-            validate_project_key("PROJ KEY")
+    def test_is_backlog_url(self):
+        """Test Backlog URL detection"""
+        assert is_backlog_url("https://example.backlog.jp/view/PROJ-1") is True
+        assert is_backlog_url("https://www.notion.so/page") is False
+        assert is_backlog_url("") is False
 
-    def test_invalid_project_key_with_symbols(self):
-        """Test project key with special symbols"""
-        with pytest.raises(ValueError):
-            validate_project_key("PROJ@123")
-
-    def test_invalid_project_key_empty(self):
-        """Test empty project key"""
-        with pytest.raises(ValueError):
-            validate_project_key("")
+    def test_is_notion_url(self):
+        """Test Notion URL detection"""
+        assert is_notion_url("https://www.notion.so/page") is True
+        assert is_notion_url("https://example.backlog.com/view/PROJ-1") is False
+        assert is_notion_url("") is False